@@ -16,6 +16,11 @@ from langchain_openai import ChatOpenAI
 from langchain.agents import create_agent
 from dotenv import load_dotenv
 
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is the fallback
+    orjson = None
+
 # Import project tools
 import sys
 project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -39,6 +44,13 @@ from agent.chat_model_wrapper import ToolCallArgsParsingWrapper
 load_dotenv()
 
 
+def _serialize_conversation(conversation: List[Dict[str, Any]]) -> str:
+    """Serialize conversation history as compact JSON for trading_days.reasoning_full."""
+    if orjson is not None:
+        return orjson.dumps(conversation, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(conversation, separators=(",", ":"), ensure_ascii=False)
+
+
 class BaseAgent:
     """
     Base class for trading agents
@@ -698,14 +710,17 @@ Summary:"""
             starting_cash=starting_cash
         )
 
-        # 9. Save final holdings to database
-        for symbol, quantity in current_holdings.items():
-            if quantity > 0:
-                db.create_holding(
-                    trading_day_id=trading_day_id,
-                    symbol=symbol,
-                    quantity=quantity
-                )
+        # 9. Save final holdings to database (committed together with the
+        # trading_day update below, so end-of-day state lands in one transaction)
+        db.create_holdings_bulk(
+            trading_day_id=trading_day_id,
+            holdings=[
+                (symbol, quantity)
+                for symbol, quantity in current_holdings.items()
+                if quantity > 0
+            ],
+            commit=False
+        )
 
         # 10. Calculate final portfolio value
         final_value = self._calculate_portfolio_value(current_holdings, current_prices, current_cash)
@@ -728,7 +743,7 @@ Summary:"""
                 current_cash,
                 final_value,
                 summary,
-                json.dumps(self.conversation_history),
+                _serialize_conversation(self.conversation_history),
                 action_count,
                 session_duration,
                 trading_day_id
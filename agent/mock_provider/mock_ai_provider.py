@@ -5,6 +5,7 @@ Returns static but rotating trading responses to test orchestration without AI A
 Rotates through NASDAQ 100 stocks in a predictable pattern.
 """
 
+import functools
 from typing import Optional
 from datetime import datetime
 
@@ -33,11 +34,19 @@ class MockAIProvider:
         Returns:
             Mock AI response string with tool calls and finish signal
         """
+        # The response depends only on the date, so every step and every
+        # provider instance shares one rendered string per date
+        return self._response_for_date(date)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _response_for_date(date: str) -> str:
+        """Render the mock response for a date (memoized)."""
         # Use date to deterministically select stock
         date_obj = datetime.strptime(date, "%Y-%m-%d")
         day_offset = (date_obj - datetime(2025, 1, 1)).days
-        stock_idx = day_offset % len(self.STOCK_ROTATION)
-        selected_stock = self.STOCK_ROTATION[stock_idx]
+        stock_idx = day_offset % len(MockAIProvider.STOCK_ROTATION)
+        selected_stock = MockAIProvider.STOCK_ROTATION[stock_idx]
 
         # Generate mock response
         response = f"""Let me analyze the market for today ({date}).
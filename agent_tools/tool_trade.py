@@ -20,6 +20,32 @@ from datetime import datetime, timezone
 from tools.deployment_config import get_db_path
 mcp = FastMCP("TradeTools")
 
+# SQL shared by every call, kept as module constants so each statement text
+# is built once and maps to a single entry in the connection's statement cache
+
+# Most recent trading_day BEFORE the current date (previous day's ending position).
+# NOTE: No job_id filter, to enable cross-job continuity
+_PREVIOUS_DAY_QUERY = """
+    SELECT id, ending_cash
+    FROM trading_days
+    WHERE model = ? AND date < ?
+    ORDER BY date DESC
+    LIMIT 1
+"""
+
+_HOLDINGS_QUERY = """
+    SELECT symbol, quantity
+    FROM holdings
+    WHERE trading_day_id = ?
+"""
+
+_INSERT_ACTION_SQL = """
+    INSERT INTO actions (
+        trading_day_id, action_type, symbol, quantity, price, created_at
+    )
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+
 
 def get_current_position_from_db(
     job_id: str,
@@ -54,14 +80,7 @@ def get_current_position_from_db(
 
     try:
         # Query most recent trading_day BEFORE current date (previous day's ending position)
-        # NOTE: Removed job_id filter to enable cross-job continuity
-        cursor.execute("""
-            SELECT id, ending_cash
-            FROM trading_days
-            WHERE model = ? AND date < ?
-            ORDER BY date DESC
-            LIMIT 1
-        """, (model, date))
+        cursor.execute(_PREVIOUS_DAY_QUERY, (model, date))
 
         row = cursor.fetchone()
 
@@ -72,11 +91,7 @@ def get_current_position_from_db(
         trading_day_id, ending_cash = row
 
         # Query holdings for that day
-        cursor.execute("""
-            SELECT symbol, quantity
-            FROM holdings
-            WHERE trading_day_id = ?
-        """, (trading_day_id,))
+        cursor.execute(_HOLDINGS_QUERY, (trading_day_id,))
 
         holdings_rows = cursor.fetchall()
 
@@ -175,12 +190,7 @@ def _buy_impl(symbol: str, amount: int, signature: str = None, today_date: str =
 
         created_at = datetime.now(timezone.utc).isoformat()
 
-        cursor.execute("""
-            INSERT INTO actions (
-                trading_day_id, action_type, symbol, quantity, price, created_at
-            )
-            VALUES (?, ?, ?, ?, ?, ?)
-        """, (
+        cursor.execute(_INSERT_ACTION_SQL, (
             trading_day_id, "buy", symbol, amount, this_symbol_price, created_at
         ))
 
@@ -302,12 +312,7 @@ def _sell_impl(symbol: str, amount: int, signature: str = None, today_date: str
 
         created_at = datetime.now(timezone.utc).isoformat()
 
-        cursor.execute("""
-            INSERT INTO actions (
-                trading_day_id, action_type, symbol, quantity, price, created_at
-            )
-            VALUES (?, ?, ?, ?, ?, ?)
-        """, (
+        cursor.execute(_INSERT_ACTION_SQL, (
             trading_day_id, "sell", symbol, amount, this_symbol_price, created_at
         ))
 
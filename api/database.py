@@ -11,9 +11,29 @@ import sqlite3
 from pathlib import Path
 import os
 from contextlib import contextmanager
+from typing import Iterable, Optional
 from tools.deployment_config import get_db_path
 
 
+# Applied to every connection opened here. WAL lets API readers run alongside
+# the simulation writer, and with synchronous=NORMAL a commit only fsyncs at
+# checkpoints (still crash-safe in WAL mode). journal_mode is persistent in the
+# file, so re-issuing it on an existing WAL database is a no-op.
+CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode = WAL",
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA mmap_size = 268435456",  # 256 MiB
+    "PRAGMA cache_size = -64000",  # ~64 MB
+)
+
+
+def _apply_connection_pragmas(conn: sqlite3.Connection) -> None:
+    """Apply CONNECTION_PRAGMAS to a freshly opened connection."""
+    for pragma in CONNECTION_PRAGMAS:
+        conn.execute(pragma)
+
+
 def get_db_connection(db_path: str = "data/jobs.db") -> sqlite3.Connection:
     """
     Get SQLite database connection with proper configuration.
@@ -30,6 +50,9 @@ def get_db_connection(db_path: str = "data/jobs.db") -> sqlite3.Connection:
         - Foreign keys enabled for referential integrity
         - Row factory for dict-like access
         - Check same thread disabled for FastAPI async compatibility
+        - Statement cache sized for the full set of repeated queries
+        - WAL journal, synchronous=NORMAL and in-memory temp store
+          (see CONNECTION_PRAGMAS)
     """
     # Resolve path based on deployment mode
     resolved_path = get_db_path(db_path)
@@ -38,7 +61,8 @@ def get_db_connection(db_path: str = "data/jobs.db") -> sqlite3.Connection:
     db_path_obj = Path(resolved_path)
     db_path_obj.parent.mkdir(parents=True, exist_ok=True)
 
-    conn = sqlite3.connect(resolved_path, check_same_thread=False)
+    conn = sqlite3.connect(resolved_path, check_same_thread=False, cached_statements=256)
+    _apply_connection_pragmas(conn)
     conn.execute("PRAGMA foreign_keys = ON")
     conn.row_factory = sqlite3.Row
 
@@ -91,7 +115,21 @@ def resolve_db_path(db_path: str) -> str:
     return get_db_path(db_path)
 
 
-def initialize_database(db_path: str = "data/jobs.db") -> None:
+# Tables created by initialize_database(), in dependency order
+SCHEMA_TABLES = (
+    "jobs",
+    "job_details",
+    "tool_usage",
+    "price_data",
+    "price_data_coverage",
+    "simulation_runs",
+)
+
+
+def initialize_database(
+    db_path: str = "data/jobs.db",
+    tables: Optional[Iterable[str]] = None
+) -> None:
     """
     Create all database tables with enhanced schema.
 
@@ -109,43 +147,56 @@ def initialize_database(db_path: str = "data/jobs.db") -> None:
 
     Args:
         db_path: Path to SQLite database file
+        tables: Optional subset of SCHEMA_TABLES to create (with their
+                indexes). Defaults to all tables. Useful for tests that only
+                exercise one table.
+
+    Raises:
+        ValueError: If tables contains an unknown table name
     """
+    selected = set(SCHEMA_TABLES if tables is None else tables)
+    unknown = selected - set(SCHEMA_TABLES)
+    if unknown:
+        raise ValueError(f"Unknown tables: {sorted(unknown)}")
+
     conn = get_db_connection(db_path)
     cursor = conn.cursor()
 
     # Table 1: Jobs - Job metadata and lifecycle
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS jobs (
-            job_id TEXT PRIMARY KEY,
-            config_path TEXT NOT NULL,
-            status TEXT NOT NULL CHECK(status IN ('pending', 'downloading_data', 'running', 'completed', 'partial', 'failed')),
-            date_range TEXT NOT NULL,
-            models TEXT NOT NULL,
-            created_at TEXT NOT NULL,
-            started_at TEXT,
-            updated_at TEXT,
-            completed_at TEXT,
-            total_duration_seconds REAL,
-            error TEXT,
-            warnings TEXT
-        )
-    """)
+    if "jobs" in selected:
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS jobs (
+                job_id TEXT PRIMARY KEY,
+                config_path TEXT NOT NULL,
+                status TEXT NOT NULL CHECK(status IN ('pending', 'downloading_data', 'running', 'completed', 'partial', 'failed')),
+                date_range TEXT NOT NULL,
+                models TEXT NOT NULL,
+                created_at TEXT NOT NULL,
+                started_at TEXT,
+                updated_at TEXT,
+                completed_at TEXT,
+                total_duration_seconds REAL,
+                error TEXT,
+                warnings TEXT
+            )
+        """)
 
     # Table 2: Job Details - Per model-day execution
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS job_details (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            job_id TEXT NOT NULL,
-            date TEXT NOT NULL,
-            model TEXT NOT NULL,
-            status TEXT NOT NULL CHECK(status IN ('pending', 'running', 'completed', 'failed', 'skipped')),
-            started_at TEXT,
-            completed_at TEXT,
-            duration_seconds REAL,
-            error TEXT,
-            FOREIGN KEY (job_id) REFERENCES jobs(job_id) ON DELETE CASCADE
-        )
-    """)
+    if "job_details" in selected:
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS job_details (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                job_id TEXT NOT NULL,
+                date TEXT NOT NULL,
+                model TEXT NOT NULL,
+                status TEXT NOT NULL CHECK(status IN ('pending', 'running', 'completed', 'failed', 'skipped')),
+                started_at TEXT,
+                completed_at TEXT,
+                duration_seconds REAL,
+                error TEXT,
+                FOREIGN KEY (job_id) REFERENCES jobs(job_id) ON DELETE CASCADE
+            )
+        """)
 
     # Table 3: Positions - Trading positions and P&L
     # DEPRECATED: Old positions table replaced by trading_days, holdings, and actions tables
@@ -194,73 +245,83 @@ def initialize_database(db_path: str = "data/jobs.db") -> None:
     # See api/migrations/002_drop_old_schema.py for removal migration
 
     # Table 7: Tool Usage - Tool usage statistics
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS tool_usage (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            job_id TEXT NOT NULL,
-            date TEXT NOT NULL,
-            model TEXT NOT NULL,
-            tool_name TEXT NOT NULL,
-            call_count INTEGER NOT NULL DEFAULT 1,
-            total_duration_seconds REAL,
-            FOREIGN KEY (job_id) REFERENCES jobs(job_id) ON DELETE CASCADE
-        )
-    """)
+    if "tool_usage" in selected:
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS tool_usage (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                job_id TEXT NOT NULL,
+                date TEXT NOT NULL,
+                model TEXT NOT NULL,
+                tool_name TEXT NOT NULL,
+                call_count INTEGER NOT NULL DEFAULT 1,
+                total_duration_seconds REAL,
+                FOREIGN KEY (job_id) REFERENCES jobs(job_id) ON DELETE CASCADE
+            )
+        """)
 
     # Table 8: Price Data - OHLCV price data (replaces merged.jsonl)
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS price_data (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            symbol TEXT NOT NULL,
-            date TEXT NOT NULL,
-            open REAL NOT NULL,
-            high REAL NOT NULL,
-            low REAL NOT NULL,
-            close REAL NOT NULL,
-            volume INTEGER NOT NULL,
-            created_at TEXT NOT NULL,
-            UNIQUE(symbol, date)
-        )
-    """)
+    if "price_data" in selected:
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS price_data (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                symbol TEXT NOT NULL,
+                date TEXT NOT NULL,
+                open REAL NOT NULL,
+                high REAL NOT NULL,
+                low REAL NOT NULL,
+                close REAL NOT NULL,
+                volume INTEGER NOT NULL,
+                created_at TEXT NOT NULL,
+                UNIQUE(symbol, date)
+            )
+        """)
 
     # Table 9: Price Data Coverage - Track downloaded date ranges per symbol
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS price_data_coverage (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            symbol TEXT NOT NULL,
-            start_date TEXT NOT NULL,
-            end_date TEXT NOT NULL,
-            downloaded_at TEXT NOT NULL,
-            source TEXT DEFAULT 'alpha_vantage',
-            UNIQUE(symbol, start_date, end_date)
-        )
-    """)
+    if "price_data_coverage" in selected:
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS price_data_coverage (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                symbol TEXT NOT NULL,
+                start_date TEXT NOT NULL,
+                end_date TEXT NOT NULL,
+                downloaded_at TEXT NOT NULL,
+                source TEXT DEFAULT 'alpha_vantage',
+                UNIQUE(symbol, start_date, end_date)
+            )
+        """)
 
     # Table 10: Simulation Runs - Track simulation runs for soft delete
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS simulation_runs (
-            run_id TEXT PRIMARY KEY,
-            job_id TEXT NOT NULL,
-            model TEXT NOT NULL,
-            start_date TEXT NOT NULL,
-            end_date TEXT NOT NULL,
-            status TEXT NOT NULL CHECK(status IN ('active', 'superseded')),
-            created_at TEXT NOT NULL,
-            superseded_at TEXT,
-            FOREIGN KEY (job_id) REFERENCES jobs(job_id) ON DELETE CASCADE
-        )
-    """)
+    if "simulation_runs" in selected:
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS simulation_runs (
+                run_id TEXT PRIMARY KEY,
+                job_id TEXT NOT NULL,
+                model TEXT NOT NULL,
+                start_date TEXT NOT NULL,
+                end_date TEXT NOT NULL,
+                status TEXT NOT NULL CHECK(status IN ('active', 'superseded')),
+                created_at TEXT NOT NULL,
+                superseded_at TEXT,
+                FOREIGN KEY (job_id) REFERENCES jobs(job_id) ON DELETE CASCADE
+            )
+        """)
 
     # Run schema migrations for existing databases
     _migrate_schema(cursor)
 
     # Create indexes for performance
-    _create_indexes(cursor)
+    _create_indexes(cursor, selected)
 
     conn.commit()
     conn.close()
 
 
+def _remove_wal_files(db_path: str) -> None:
+    """Remove WAL sidecar files left next to a deleted database file."""
+    for suffix in ("-wal", "-shm"):
+        Path(db_path + suffix).unlink(missing_ok=True)
+
+
 def initialize_dev_database(db_path: str = "data/trading_dev.db") -> None:
     """
     Initialize dev database with clean schema
@@ -285,6 +346,7 @@ def initialize_dev_database(db_path: str = "data/trading_dev.db") -> None:
     if Path(db_path).exists():
         print(f"🗑️  Removing existing dev database: {db_path}")
         Path(db_path).unlink()
+    _remove_wal_files(db_path)
 
     # Create fresh dev database
     print(f"📁 Creating fresh dev database: {db_path}")
@@ -305,6 +367,7 @@ def cleanup_dev_database(db_path: str = "data/trading_dev.db", data_path: str =
     if Path(db_path).exists():
         print(f"🗑️  Removing dev database: {db_path}")
         Path(db_path).unlink()
+    _remove_wal_files(db_path)
 
     # Remove dev data directory
     if Path(data_path).exists():
@@ -336,28 +399,47 @@ def _migrate_schema(cursor: sqlite3.Cursor) -> None:
             """)
 
 
-def _create_indexes(cursor: sqlite3.Cursor) -> None:
-    """Create database indexes for query performance."""
+def _create_indexes(cursor: sqlite3.Cursor, tables: Iterable[str] = SCHEMA_TABLES) -> None:
+    """Create database indexes for query performance.
+
+    Args:
+        cursor: Database cursor
+        tables: Tables whose indexes should be created
+    """
+    tables = set(tables)
 
     # Jobs table indexes
-    cursor.execute("""
-        CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs(status)
-    """)
-    cursor.execute("""
-        CREATE INDEX IF NOT EXISTS idx_jobs_created_at ON jobs(created_at DESC)
-    """)
+    if "jobs" in tables:
+        # idx_jobs_status(status) was a prefix of idx_jobs_status_created
+        cursor.execute("DROP INDEX IF EXISTS idx_jobs_status")
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_jobs_created_at ON jobs(created_at DESC)
+        """)
+        # Covers the "any pending/running job?" checks and newest-first listings
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_jobs_status_created ON jobs(status, created_at DESC)
+        """)
 
     # Job details table indexes
-    cursor.execute("""
-        CREATE INDEX IF NOT EXISTS idx_job_details_job_id ON job_details(job_id)
-    """)
-    cursor.execute("""
-        CREATE INDEX IF NOT EXISTS idx_job_details_status ON job_details(status)
-    """)
-    cursor.execute("""
-        CREATE UNIQUE INDEX IF NOT EXISTS idx_job_details_unique
-        ON job_details(job_id, date, model)
-    """)
+    if "job_details" in tables:
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_job_details_status ON job_details(status)
+        """)
+        # Covering index for per-job status counts, the running model-day lookup
+        # and the completion check: (date, model) ride along in the key since
+        # SQLite has no INCLUDE columns
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_job_details_job_status_day
+            ON job_details(job_id, status, date, model)
+        """)
+        # Both are key prefixes of the indexes above and only cost writes.
+        # Plain job_id lookups are served by idx_job_details_unique.
+        cursor.execute("DROP INDEX IF EXISTS idx_job_details_job_id")
+        cursor.execute("DROP INDEX IF EXISTS idx_job_details_job_status")
+        cursor.execute("""
+            CREATE UNIQUE INDEX IF NOT EXISTS idx_job_details_unique
+            ON job_details(job_id, date, model)
+        """)
 
     # DEPRECATED: Positions table indexes (only create if table exists for backward compatibility)
     cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='positions'")
@@ -398,40 +480,44 @@ def _create_indexes(cursor: sqlite3.Cursor) -> None:
     # These tables have been replaced by trading_days with reasoning_full JSON column
 
     # Tool usage table indexes
-    cursor.execute("""
-        CREATE INDEX IF NOT EXISTS idx_tool_usage_job_date_model
-        ON tool_usage(job_id, date, model)
-    """)
+    if "tool_usage" in tables:
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_tool_usage_job_date_model
+            ON tool_usage(job_id, date, model)
+        """)
 
     # Price data table indexes
-    cursor.execute("""
-        CREATE INDEX IF NOT EXISTS idx_price_data_symbol_date ON price_data(symbol, date)
-    """)
-    cursor.execute("""
-        CREATE INDEX IF NOT EXISTS idx_price_data_date ON price_data(date)
-    """)
-    cursor.execute("""
-        CREATE INDEX IF NOT EXISTS idx_price_data_symbol ON price_data(symbol)
-    """)
+    if "price_data" in tables:
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_price_data_symbol_date ON price_data(symbol, date)
+        """)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_price_data_date ON price_data(date)
+        """)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_price_data_symbol ON price_data(symbol)
+        """)
 
     # Price data coverage table indexes
-    cursor.execute("""
-        CREATE INDEX IF NOT EXISTS idx_coverage_symbol ON price_data_coverage(symbol)
-    """)
-    cursor.execute("""
-        CREATE INDEX IF NOT EXISTS idx_coverage_dates ON price_data_coverage(start_date, end_date)
-    """)
+    if "price_data_coverage" in tables:
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_coverage_symbol ON price_data_coverage(symbol)
+        """)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_coverage_dates ON price_data_coverage(start_date, end_date)
+        """)
 
     # Simulation runs table indexes
-    cursor.execute("""
-        CREATE INDEX IF NOT EXISTS idx_runs_job_model ON simulation_runs(job_id, model)
-    """)
-    cursor.execute("""
-        CREATE INDEX IF NOT EXISTS idx_runs_status ON simulation_runs(status)
-    """)
-    cursor.execute("""
-        CREATE INDEX IF NOT EXISTS idx_runs_dates ON simulation_runs(start_date, end_date)
-    """)
+    if "simulation_runs" in tables:
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_runs_job_model ON simulation_runs(job_id, model)
+        """)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_runs_status ON simulation_runs(status)
+        """)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_runs_dates ON simulation_runs(start_date, end_date)
+        """)
 
     # Positions table - add index for simulation_run_id and session_id
     # Check if columns exist before creating indexes
@@ -540,19 +626,34 @@ def get_database_stats(db_path: str = "data/jobs.db") -> dict:
 class Database:
     """Database wrapper class with helper methods for trading_days schema."""
 
-    def __init__(self, db_path: str = None):
+    def __init__(self, db_path: str = None, connection: sqlite3.Connection = None):
         """Initialize database connection.
 
         Args:
             db_path: Path to SQLite database file.
                      If None, uses default from deployment config.
+            connection: Existing connection to wrap instead of opening
+                        db_path (e.g. a test connection shared across cases).
         """
+        if connection is not None:
+            self.db_path = db_path
+            self.connection = connection
+            self.connection.row_factory = sqlite3.Row
+            self._initialize_schema()
+            return
+
         if db_path is None:
             from tools.deployment_config import get_db_path
             db_path = get_db_path("data/jobs.db")
 
         self.db_path = db_path
-        self.connection = sqlite3.connect(db_path, check_same_thread=False)
+        # Larger statement cache so every helper's SQL stays compiled
+        self.connection = sqlite3.connect(
+            db_path,
+            check_same_thread=False,
+            cached_statements=256
+        )
+        _apply_connection_pragmas(self.connection)
         self.connection.row_factory = sqlite3.Row
 
         # Auto-initialize schema if needed
@@ -699,43 +800,42 @@ class Database:
             List of dicts with keys: symbol, quantity
             Empty list if first trading day
         """
-        # Get previous trading day
+        # Resolve the previous trading day and read its holdings in one query
         cursor = self.connection.execute(
             """
-            SELECT td_prev.id
-            FROM trading_days td_current
-            JOIN trading_days td_prev ON
-                td_prev.model = td_current.model AND
-                td_prev.date < td_current.date
-            WHERE td_current.id = ?
-            ORDER BY td_prev.date DESC
-            LIMIT 1
+            WITH prev AS (
+                SELECT td_prev.id
+                FROM trading_days td_current
+                JOIN trading_days td_prev ON
+                    td_prev.model = td_current.model AND
+                    td_prev.date < td_current.date
+                WHERE td_current.id = ?
+                ORDER BY td_prev.date DESC
+                LIMIT 1
+            )
+            SELECT symbol, quantity
+            FROM holdings
+            WHERE trading_day_id = (SELECT id FROM prev)
+            ORDER BY symbol
             """,
             (trading_day_id,)
         )
 
-        row = cursor.fetchone()
-        if not row:
-            # First trading day - no previous holdings
-            return []
-
-        previous_day_id = row[0]
-
-        # Get previous day's ending holdings
-        return self.get_ending_holdings(previous_day_id)
+        # First trading day - no previous holdings (subquery yields NULL)
+        return [{"symbol": row[0], "quantity": row[1]} for row in cursor.fetchall()]
 
     def create_holding(
         self,
         trading_day_id: int,
         symbol: str,
         quantity: int
-    ) -> int:
+    ) -> None:
         """Create a holding record.
 
-        Returns:
-            holding_id
+        Raises:
+            sqlite3.IntegrityError: If the symbol is already held for this trading day
         """
-        cursor = self.connection.execute(
+        self.connection.execute(
             """
             INSERT INTO holdings (trading_day_id, symbol, quantity)
             VALUES (?, ?, ?)
@@ -743,7 +843,30 @@ class Database:
             (trading_day_id, symbol, quantity)
         )
         self.connection.commit()
-        return cursor.lastrowid
+
+    def create_holdings_bulk(
+        self,
+        trading_day_id: int,
+        holdings: list,
+        commit: bool = True
+    ) -> None:
+        """Create multiple holding records in a single executemany call.
+
+        Args:
+            trading_day_id: Trading day the holdings belong to
+            holdings: List of (symbol, quantity) tuples
+            commit: Commit immediately. Pass False to leave the inserts in the
+                    open transaction so the caller's next commit covers them.
+        """
+        self.connection.executemany(
+            """
+            INSERT INTO holdings (trading_day_id, symbol, quantity)
+            VALUES (?, ?, ?)
+            """,
+            [(trading_day_id, symbol, quantity) for symbol, quantity in holdings]
+        )
+        if commit:
+            self.connection.commit()
 
     def create_action(
         self,
@@ -768,6 +891,29 @@ class Database:
         self.connection.commit()
         return cursor.lastrowid
 
+    def create_actions_bulk(
+        self,
+        trading_day_id: int,
+        actions: list
+    ) -> None:
+        """Create multiple action records in a single executemany call.
+
+        Args:
+            trading_day_id: Trading day the actions belong to
+            actions: List of (action_type, symbol, quantity, price) tuples
+        """
+        self.connection.executemany(
+            """
+            INSERT INTO actions (trading_day_id, action_type, symbol, quantity, price)
+            VALUES (?, ?, ?, ?, ?)
+            """,
+            [
+                (trading_day_id, action_type, symbol, quantity, price)
+                for action_type, symbol, quantity, price in actions
+            ]
+        )
+        self.connection.commit()
+
     def get_actions(self, trading_day_id: int) -> list:
         """Get all actions for a trading day.
 
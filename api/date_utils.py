@@ -8,7 +8,7 @@ This module provides:
 """
 
 import os
-from datetime import datetime, timedelta
+from datetime import date, datetime
 from typing import List
 
 
@@ -26,20 +26,18 @@ def expand_date_range(start_date: str, end_date: str) -> List[str]:
     Raises:
         ValueError: If dates are invalid or start > end
     """
-    start = datetime.strptime(start_date, "%Y-%m-%d")
-    end = datetime.strptime(end_date, "%Y-%m-%d")
+    start = datetime.strptime(start_date, "%Y-%m-%d").date()
+    end = datetime.strptime(end_date, "%Y-%m-%d").date()
 
     if start > end:
         raise ValueError(f"start_date ({start_date}) must be <= end_date ({end_date})")
 
-    dates = []
-    current = start
-
-    while current <= end:
-        dates.append(current.strftime("%Y-%m-%d"))
-        current += timedelta(days=1)
-
-    return dates
+    # Walk day ordinals instead of adding timedeltas; isoformat() emits
+    # YYYY-MM-DD without going through strftime's format parser.
+    return [
+        date.fromordinal(ordinal).isoformat()
+        for ordinal in range(start.toordinal(), end.toordinal() + 1)
+    ]
 
 
 def validate_date_range(
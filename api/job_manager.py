@@ -13,6 +13,11 @@ This module provides:
 import sqlite3
 import json
 import uuid
+import functools
+import os
+import threading
+from collections import Counter
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from typing import Optional, List, Dict, Any
 from pathlib import Path
@@ -23,6 +28,107 @@ from api.database import get_db_connection
 logger = logging.getLogger(__name__)
 
 
+# One lock per database file, shared by every JobManager in the process.
+# API handlers, the simulation worker and executors each create their own
+# JobManager, so a per-instance lock would not serialize anything.
+_write_locks: Dict[str, threading.Lock] = {}
+_write_locks_guard = threading.Lock()
+
+
+def _write_lock_for(db_path: str) -> threading.Lock:
+    """Return the process-wide write lock for db_path."""
+    key = os.path.abspath(db_path)
+    with _write_locks_guard:
+        return _write_locks.setdefault(key, threading.Lock())
+
+
+# Seconds from the row's started_at to the bound timestamp, computed by SQLite.
+# julianday() parses the stored "...Z" ISO strings and yields NULL when the
+# row never started, so no Python datetime parsing is needed.
+_ELAPSED_SINCE_START_SQL = "(julianday(?) - julianday(started_at)) * 86400.0"
+
+
+# (model, date) pairs per completed-pair lookup (2 bound parameters each)
+_PAIR_LOOKUP_CHUNK = 400
+
+# Column list shared by every query that returns full job rows
+_JOB_COLUMNS = """
+    job_id, config_path, status, date_range, models,
+    created_at, started_at, updated_at, completed_at,
+    total_duration_seconds, error, warnings
+"""
+
+# Concurrency check run by create_job/can_start_new_job. It only reads
+# idx_jobs_status_created, so it never touches the jobs table itself.
+_ACTIVE_JOB_QUERY = """
+    SELECT 1
+    FROM jobs
+    WHERE status IN ('pending', 'running')
+    LIMIT 1
+"""
+
+# Walks idx_jobs_created_at from the newest entry; LIMIT 1 means a single
+# index step plus one rowid lookup for the full row.
+_CURRENT_JOB_QUERY = f"""
+    SELECT {_JOB_COLUMNS}
+    FROM jobs
+    ORDER BY created_at DESC
+    LIMIT 1
+"""
+
+# Model-day status writes shared by update_job_detail_status and
+# update_job_detail_status_many. Built once so both paths send the exact
+# same text and reuse one prepared statement from the connection cache.
+_START_JOB_DETAIL_SQL = """
+    UPDATE job_details
+    SET status = 'running', started_at = ?
+    WHERE job_id = ? AND date = ? AND model = ?
+"""
+
+_START_JOB_SQL = """
+    UPDATE jobs
+    SET status = 'running', started_at = COALESCE(started_at, ?), updated_at = ?
+    WHERE job_id = ? AND status = 'pending'
+"""
+
+_FINISH_JOB_DETAIL_SQL = f"""
+    UPDATE job_details
+    SET status = ?, completed_at = ?,
+        duration_seconds = {_ELAPSED_SINCE_START_SQL}, error = ?
+    WHERE job_id = ? AND date = ? AND model = ?
+"""
+
+
+@functools.lru_cache(maxsize=256)
+def _encode_list(values: tuple) -> str:
+    """JSON-encode a date/model list (memoized; jobs reuse the same few lists)."""
+    return json.dumps(list(values))
+
+
+@functools.lru_cache(maxsize=256)
+def _decode_list(text: str) -> tuple:
+    """Decode a stored JSON list; a tuple so the cached value cannot be mutated."""
+    return tuple(json.loads(text))
+
+
+def _job_row_to_dict(row) -> Dict[str, Any]:
+    """Build the job dict returned by JobManager from a _JOB_COLUMNS row."""
+    return {
+        "job_id": row[0],
+        "config_path": row[1],
+        "status": row[2],
+        "date_range": list(_decode_list(row[3])),
+        "models": list(_decode_list(row[4])),
+        "created_at": row[5],
+        "started_at": row[6],
+        "updated_at": row[7],
+        "completed_at": row[8],
+        "total_duration_seconds": row[9],
+        "error": row[10],
+        "warnings": row[11]
+    }
+
+
 class JobManager:
     """
     Manages simulation job lifecycle and orchestration.
@@ -49,6 +155,29 @@ class JobManager:
             db_path: Path to SQLite database
         """
         self.db_path = db_path
+        self._write_lock = _write_lock_for(db_path)
+
+    @contextmanager
+    def _write_transaction(self):
+        """
+        Run one serialized write transaction and yield its cursor.
+
+        In-process writers queue on a Python lock instead of colliding on
+        SQLite's single writer lock (and its busy-timeout retries). BEGIN
+        IMMEDIATE takes the database write lock before the first read, so a
+        transaction never has to upgrade from a stale read snapshot. Commits
+        on normal exit; on an exception the connection closes uncommitted,
+        which rolls back.
+        """
+        with self._write_lock:
+            conn = get_db_connection(self.db_path)
+            try:
+                cursor = conn.cursor()
+                cursor.execute("BEGIN IMMEDIATE")
+                yield cursor
+                conn.commit()
+            finally:
+                conn.close()
 
     def create_job(
         self,
@@ -78,16 +207,15 @@ class JobManager:
         Raises:
             ValueError: If another job is already running/pending or if all simulations are already completed (when skip_completed=True)
         """
-        if not self.can_start_new_job():
-            raise ValueError("Another simulation job is already running or pending")
-
         job_id = str(uuid.uuid4())
         created_at = datetime.utcnow().isoformat() + "Z"
 
-        conn = get_db_connection(self.db_path)
-        cursor = conn.cursor()
+        with self._write_transaction() as cursor:
+            # The write transaction holds the lock from the concurrency check
+            # through the inserts, so no other create_job can slip in between
+            if self._has_active_job(cursor):
+                raise ValueError("Another simulation job is already running or pending")
 
-        try:
             # Determine which model-day pairs to check
             if model_day_filter is not None:
                 pairs_to_check = model_day_filter
@@ -99,17 +227,11 @@ class JobManager:
             pending_pairs = []
 
             if skip_completed:
-                # Perform duplicate checking
-                for model, date in pairs_to_check:
-                    cursor.execute("""
-                        SELECT COUNT(*)
-                        FROM job_details
-                        WHERE model = ? AND date = ? AND status = 'completed'
-                    """, (model, date))
-
-                    count = cursor.fetchone()[0]
+                # Perform duplicate checking with one lookup for all pairs
+                completed = self._completed_pairs(cursor, pairs_to_check)
 
-                    if count > 0:
+                for model, date in pairs_to_check:
+                    if (model, date) in completed:
                         skipped_pairs.append((model, date))
                         logger.info(f"Skipping {model}/{date} - already completed in previous job")
                     else:
@@ -141,27 +263,24 @@ class JobManager:
                 job_id,
                 config_path,
                 "pending",
-                json.dumps(date_range),
-                json.dumps(models),
+                _encode_list(tuple(date_range)),
+                _encode_list(tuple(models)),
                 created_at
             ))
 
-            # Create job_details only for pending pairs
-            for model, date in pending_pairs:
-                cursor.execute("""
-                    INSERT INTO job_details (
-                        job_id, date, model, status
-                    )
-                    VALUES (?, ?, ?, ?)
-                """, (job_id, date, model, "pending"))
+            # Create job_details only for pending pairs (one batched statement)
+            cursor.executemany("""
+                INSERT INTO job_details (
+                    job_id, date, model, status
+                )
+                VALUES (?, ?, ?, ?)
+            """, [(job_id, date, model, "pending") for model, date in pending_pairs])
 
             logger.info(f"Created job {job_id} with {len(pending_pairs)} model-day tasks")
 
             if skipped_pairs:
                 logger.info(f"Skipped {len(skipped_pairs)} already-completed simulations")
 
-            conn.commit()
-
             # Prepare warnings
             warnings = [
                 f"Skipped {model}/{date} - already completed"
@@ -173,8 +292,40 @@ class JobManager:
                 "warnings": warnings
             }
 
-        finally:
-            conn.close()
+    @staticmethod
+    def _has_active_job(cursor: sqlite3.Cursor) -> bool:
+        """Whether any job is pending or running (stops at the first one)."""
+        cursor.execute(_ACTIVE_JOB_QUERY)
+        return cursor.fetchone() is not None
+
+    @staticmethod
+    def _completed_pairs(cursor: sqlite3.Cursor, pairs: List[tuple]) -> set:
+        """
+        Return the subset of (model, date) pairs already completed in any job.
+
+        Args:
+            cursor: Database cursor
+            pairs: (model, date) tuples to look up
+
+        Returns:
+            Set of (model, date) tuples with a completed job_details row
+        """
+        requested = sorted({(model, date) for model, date in pairs})
+        completed = set()
+
+        # Row-value IN matches exact pairs; chunked to stay far below
+        # SQLite's bound-parameter limit on large date ranges
+        for start in range(0, len(requested), _PAIR_LOOKUP_CHUNK):
+            chunk = requested[start:start + _PAIR_LOOKUP_CHUNK]
+            cursor.execute(f"""
+                SELECT DISTINCT model, date
+                FROM job_details
+                WHERE status = 'completed'
+                  AND (model, date) IN (VALUES {",".join(["(?, ?)"] * len(chunk))})
+            """, [value for pair in chunk for value in pair])
+            completed.update((model, date) for model, date in cursor.fetchall())
+
+        return completed
 
     def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -190,11 +341,8 @@ class JobManager:
         cursor = conn.cursor()
 
         try:
-            cursor.execute("""
-                SELECT
-                    job_id, config_path, status, date_range, models,
-                    created_at, started_at, updated_at, completed_at,
-                    total_duration_seconds, error, warnings
+            cursor.execute(f"""
+                SELECT {_JOB_COLUMNS}
                 FROM jobs
                 WHERE job_id = ?
             """, (job_id,))
@@ -203,20 +351,7 @@ class JobManager:
             if not row:
                 return None
 
-            return {
-                "job_id": row[0],
-                "config_path": row[1],
-                "status": row[2],
-                "date_range": json.loads(row[3]),
-                "models": json.loads(row[4]),
-                "created_at": row[5],
-                "started_at": row[6],
-                "updated_at": row[7],
-                "completed_at": row[8],
-                "total_duration_seconds": row[9],
-                "error": row[10],
-                "warnings": row[11]
-            }
+            return _job_row_to_dict(row)
 
         finally:
             conn.close()
@@ -232,34 +367,13 @@ class JobManager:
         cursor = conn.cursor()
 
         try:
-            cursor.execute("""
-                SELECT
-                    job_id, config_path, status, date_range, models,
-                    created_at, started_at, updated_at, completed_at,
-                    total_duration_seconds, error, warnings
-                FROM jobs
-                ORDER BY created_at DESC
-                LIMIT 1
-            """)
+            cursor.execute(_CURRENT_JOB_QUERY)
 
             row = cursor.fetchone()
             if not row:
                 return None
 
-            return {
-                "job_id": row[0],
-                "config_path": row[1],
-                "status": row[2],
-                "date_range": json.loads(row[3]),
-                "models": json.loads(row[4]),
-                "created_at": row[5],
-                "started_at": row[6],
-                "updated_at": row[7],
-                "completed_at": row[8],
-                "total_duration_seconds": row[9],
-                "error": row[10],
-                "warnings": row[11]
-            }
+            return _job_row_to_dict(row)
 
         finally:
             conn.close()
@@ -278,15 +392,15 @@ class JobManager:
         cursor = conn.cursor()
 
         try:
-            date_range_json = json.dumps(date_range)
+            date_range_json = _encode_list(tuple(date_range))
 
-            cursor.execute("""
-                SELECT
-                    job_id, config_path, status, date_range, models,
-                    created_at, started_at, updated_at, completed_at,
-                    total_duration_seconds, error, warnings
+            # json() canonicalizes both sides, so whitespace differences in
+            # the stored array do not prevent a match; json_valid() skips
+            # legacy non-JSON values, which json() would raise on
+            cursor.execute(f"""
+                SELECT {_JOB_COLUMNS}
                 FROM jobs
-                WHERE date_range = ?
+                WHERE json_valid(date_range) AND json(date_range) = json(?)
                 ORDER BY created_at DESC
                 LIMIT 1
             """, (date_range_json,))
@@ -295,20 +409,7 @@ class JobManager:
             if not row:
                 return None
 
-            return {
-                "job_id": row[0],
-                "config_path": row[1],
-                "status": row[2],
-                "date_range": json.loads(row[3]),
-                "models": json.loads(row[4]),
-                "created_at": row[5],
-                "started_at": row[6],
-                "updated_at": row[7],
-                "completed_at": row[8],
-                "total_duration_seconds": row[9],
-                "error": row[10],
-                "warnings": row[11]
-            }
+            return _job_row_to_dict(row)
 
         finally:
             conn.close()
@@ -327,10 +428,7 @@ class JobManager:
             status: New status (pending/running/completed/partial/failed)
             error: Optional error message
         """
-        conn = get_db_connection(self.db_path)
-        cursor = conn.cursor()
-
-        try:
+        with self._write_transaction() as cursor:
             updated_at = datetime.utcnow().isoformat() + "Z"
 
             # Set timestamps based on status
@@ -342,25 +440,12 @@ class JobManager:
                 """, (status, updated_at, updated_at, job_id))
 
             elif status in ("completed", "partial", "failed"):
-                # Calculate duration
-                cursor.execute("""
-                    SELECT started_at FROM jobs WHERE job_id = ?
-                """, (job_id,))
-
-                row = cursor.fetchone()
-                duration_seconds = None
-
-                if row and row[0]:
-                    started_at = datetime.fromisoformat(row[0].replace("Z", ""))
-                    completed_at = datetime.fromisoformat(updated_at.replace("Z", ""))
-                    duration_seconds = (completed_at - started_at).total_seconds()
-
-                cursor.execute("""
+                cursor.execute(f"""
                     UPDATE jobs
                     SET status = ?, completed_at = ?, updated_at = ?,
-                        total_duration_seconds = ?, error = ?
+                        total_duration_seconds = {_ELAPSED_SINCE_START_SQL}, error = ?
                     WHERE job_id = ?
-                """, (status, updated_at, updated_at, duration_seconds, error, job_id))
+                """, (status, updated_at, updated_at, updated_at, error, job_id))
 
             else:
                 # Just update status
@@ -370,38 +455,26 @@ class JobManager:
                     WHERE job_id = ?
                 """, (status, updated_at, error, job_id))
 
-            conn.commit()
             logger.debug(f"Updated job {job_id} status to {status}")
 
-        finally:
-            conn.close()
-
     def add_job_warnings(self, job_id: str, warnings: List[str]) -> None:
         """
-        Store warnings for a job.
+        Append warnings to a job's stored JSON array.
 
         Args:
             job_id: Job UUID
             warnings: List of warning messages
         """
-        conn = get_db_connection(self.db_path)
-        cursor = conn.cursor()
-
-        try:
-            warnings_json = json.dumps(warnings)
-
-            cursor.execute("""
+        with self._write_transaction() as cursor:
+            # JSON1 appends in place; the stored array is never decoded in Python
+            cursor.executemany("""
                 UPDATE jobs
-                SET warnings = ?
+                SET warnings = json_insert(COALESCE(warnings, '[]'), '$[#]', ?)
                 WHERE job_id = ?
-            """, (warnings_json, job_id))
+            """, [(warning, job_id) for warning in warnings])
 
-            conn.commit()
             logger.info(f"Added {len(warnings)} warnings to job {job_id}")
 
-        finally:
-            conn.close()
-
     def update_job_detail_status(
         self,
         job_id: str,
@@ -420,94 +493,111 @@ class JobManager:
             status: New status (pending/running/completed/failed)
             error: Optional error message
         """
-        conn = get_db_connection(self.db_path)
-        cursor = conn.cursor()
-
-        try:
+        with self._write_transaction() as cursor:
             updated_at = datetime.utcnow().isoformat() + "Z"
 
             if status == "running":
-                cursor.execute("""
-                    UPDATE job_details
-                    SET status = ?, started_at = ?
-                    WHERE job_id = ? AND date = ? AND model = ?
-                """, (status, updated_at, job_id, date, model))
+                cursor.execute(_START_JOB_DETAIL_SQL, (updated_at, job_id, date, model))
 
                 # Update job to running if not already
-                cursor.execute("""
-                    UPDATE jobs
-                    SET status = 'running', started_at = COALESCE(started_at, ?), updated_at = ?
-                    WHERE job_id = ? AND status = 'pending'
-                """, (updated_at, updated_at, job_id))
+                cursor.execute(_START_JOB_SQL, (updated_at, updated_at, job_id))
 
             elif status in ("completed", "failed", "skipped"):
-                # Calculate duration for detail
-                cursor.execute("""
-                    SELECT started_at FROM job_details
-                    WHERE job_id = ? AND date = ? AND model = ?
-                """, (job_id, date, model))
+                cursor.execute(
+                    _FINISH_JOB_DETAIL_SQL,
+                    (status, updated_at, updated_at, error, job_id, date, model)
+                )
 
-                row = cursor.fetchone()
-                duration_seconds = None
+                self._finalize_job_if_done(cursor, job_id, updated_at)
 
-                if row and row[0]:
-                    started_at = datetime.fromisoformat(row[0].replace("Z", ""))
-                    completed_at = datetime.fromisoformat(updated_at.replace("Z", ""))
-                    duration_seconds = (completed_at - started_at).total_seconds()
+            logger.debug(f"Updated job_detail {job_id}/{date}/{model} to {status}")
 
-                cursor.execute("""
-                    UPDATE job_details
-                    SET status = ?, completed_at = ?, duration_seconds = ?, error = ?
-                    WHERE job_id = ? AND date = ? AND model = ?
-                """, (status, updated_at, duration_seconds, error, job_id, date, model))
+    def update_job_detail_status_many(
+        self,
+        job_id: str,
+        updates: List[tuple]
+    ) -> None:
+        """
+        Update several model-day statuses in one transaction.
 
-                # Check if all details are done
-                cursor.execute("""
-                    SELECT
-                        COUNT(*) as total,
-                        SUM(CASE WHEN status = 'completed' THEN 1 ELSE 0 END) as completed,
-                        SUM(CASE WHEN status = 'failed' THEN 1 ELSE 0 END) as failed,
-                        SUM(CASE WHEN status = 'skipped' THEN 1 ELSE 0 END) as skipped
-                    FROM job_details
-                    WHERE job_id = ?
-                """, (job_id,))
+        Applies the same per-detail changes as update_job_detail_status,
+        batched with executemany, and re-evaluates the job's final status
+        once at the end instead of after every detail.
 
-                total, completed, failed, skipped = cursor.fetchone()
+        Args:
+            job_id: Job UUID
+            updates: List of (date, model, status, error) tuples, at most one
+                     per model-day. Statuses are pending/running/completed/
+                     failed/skipped, as for update_job_detail_status.
+        """
+        if not updates:
+            return
 
-                # Job is done when all details are in terminal states
-                if completed + failed + skipped == total:
-                    # All done - determine final status
-                    if failed == 0:
-                        final_status = "completed"
-                    elif completed > 0:
-                        final_status = "partial"
-                    else:
-                        final_status = "failed"
+        with self._write_transaction() as cursor:
+            updated_at = datetime.utcnow().isoformat() + "Z"
 
-                    # Calculate job duration
-                    cursor.execute("""
-                        SELECT started_at FROM jobs WHERE job_id = ?
-                    """, (job_id,))
+            running = [
+                (updated_at, job_id, date, model)
+                for date, model, status, _ in updates
+                if status == "running"
+            ]
+            terminal = [
+                (date, model, status, error)
+                for date, model, status, error in updates
+                if status in ("completed", "failed", "skipped")
+            ]
 
-                    row = cursor.fetchone()
-                    job_duration = None
+            if running:
+                cursor.executemany(_START_JOB_DETAIL_SQL, running)
 
-                    if row and row[0]:
-                        started_at = datetime.fromisoformat(row[0].replace("Z", ""))
-                        completed_at = datetime.fromisoformat(updated_at.replace("Z", ""))
-                        job_duration = (completed_at - started_at).total_seconds()
+                # Update job to running if not already
+                cursor.execute(_START_JOB_SQL, (updated_at, updated_at, job_id))
 
-                    cursor.execute("""
-                        UPDATE jobs
-                        SET status = ?, completed_at = ?, updated_at = ?, total_duration_seconds = ?
-                        WHERE job_id = ?
-                    """, (final_status, updated_at, updated_at, job_duration, job_id))
+            if terminal:
+                cursor.executemany(_FINISH_JOB_DETAIL_SQL, [
+                    (status, updated_at, updated_at, error, job_id, date, model)
+                    for date, model, status, error in terminal
+                ])
 
-            conn.commit()
-            logger.debug(f"Updated job_detail {job_id}/{date}/{model} to {status}")
+                self._finalize_job_if_done(cursor, job_id, updated_at)
 
-        finally:
-            conn.close()
+            logger.debug(f"Updated {len(updates)} job_details for {job_id}")
+
+    def _finalize_job_if_done(self, cursor: sqlite3.Cursor, job_id: str, updated_at: str) -> None:
+        """
+        Set the job's final status once every model-day is in a terminal state.
+
+        Args:
+            cursor: Cursor inside the caller's open transaction
+            job_id: Job UUID
+            updated_at: Timestamp to record as completed_at/updated_at
+        """
+        # One statement: aggregate the details and, only if every one is in a
+        # terminal state, derive and store the job's final status
+        cursor.execute(f"""
+            WITH counts AS (
+                SELECT
+                    COUNT(*) AS total,
+                    SUM(status = 'completed') AS completed,
+                    SUM(status = 'failed') AS failed,
+                    SUM(status = 'skipped') AS skipped
+                FROM job_details
+                WHERE job_id = ?
+            )
+            UPDATE jobs
+            SET status = (
+                    SELECT CASE
+                        WHEN failed = 0 THEN 'completed'
+                        WHEN completed > 0 THEN 'partial'
+                        ELSE 'failed'
+                    END
+                    FROM counts
+                ),
+                completed_at = ?, updated_at = ?,
+                total_duration_seconds = {_ELAPSED_SINCE_START_SQL}
+            WHERE job_id = ?
+              AND (SELECT completed + failed + skipped = total FROM counts)
+        """, (job_id, updated_at, updated_at, updated_at, job_id))
 
     def get_job_details(self, job_id: str) -> List[Dict[str, Any]]:
         """
@@ -549,45 +639,61 @@ class JobManager:
         finally:
             conn.close()
 
-    def get_job_progress(self, job_id: str) -> Dict[str, Any]:
+    def get_job_details_by_key(self, job_id: str) -> Dict[tuple, Dict[str, Any]]:
         """
-        Get job progress summary.
+        Get a job's model-day details keyed by (date, model).
 
         Args:
             job_id: Job UUID
 
         Returns:
-            Progress dict with total_model_days, completed, failed, current, details
+            Dict mapping (date, model) to the get_job_details record
+        """
+        return {
+            (detail["date"], detail["model"]): detail
+            for detail in self.get_job_details(job_id)
+        }
+
+    def get_job_progress_summary(self, job_id: str) -> Dict[str, Any]:
+        """
+        Get job progress counts without the per-model-day rows.
+
+        Runs one grouped count and one indexed lookup for the running
+        model-day, so the result size does not grow with the job.
+
+        Args:
+            job_id: Job UUID
+
+        Returns:
+            Progress dict with total_model_days, completed, failed, pending,
+            skipped, current
         """
         conn = get_db_connection(self.db_path)
         cursor = conn.cursor()
 
         try:
-            cursor.execute("""
-                SELECT
-                    COUNT(*) as total,
-                    SUM(CASE WHEN status = 'completed' THEN 1 ELSE 0 END) as completed,
-                    SUM(CASE WHEN status = 'failed' THEN 1 ELSE 0 END) as failed,
-                    SUM(CASE WHEN status = 'pending' THEN 1 ELSE 0 END) as pending,
-                    SUM(CASE WHEN status = 'skipped' THEN 1 ELSE 0 END) as skipped
-                FROM job_details
-                WHERE job_id = ?
-            """, (job_id,))
+            return self._progress_summary(cursor, job_id)
 
-            total, completed, failed, pending, skipped = cursor.fetchone()
+        finally:
+            conn.close()
 
-            # Get currently running model-day
-            cursor.execute("""
-                SELECT date, model
-                FROM job_details
-                WHERE job_id = ? AND status = 'running'
-                LIMIT 1
-            """, (job_id,))
+    def get_job_progress(self, job_id: str) -> Dict[str, Any]:
+        """
+        Get job progress summary.
 
-            current_row = cursor.fetchone()
-            current = {"date": current_row[0], "model": current_row[1]} if current_row else None
+        Args:
+            job_id: Job UUID
 
-            # Get all details
+        Returns:
+            Progress dict with total_model_days, completed, failed, current,
+            details, and details_by_key (the same detail dicts keyed by (date, model))
+        """
+        conn = get_db_connection(self.db_path)
+        cursor = conn.cursor()
+
+        try:
+            # Get all details; the counts are derived from these same rows,
+            # so no separate aggregate query is needed
             cursor.execute("""
                 SELECT date, model, status, duration_seconds, error
                 FROM job_details
@@ -595,29 +701,81 @@ class JobManager:
                 ORDER BY date, model
             """, (job_id,))
 
-            details = []
-            for row in cursor.fetchall():
-                details.append({
+            details = [
+                {
                     "date": row[0],
                     "model": row[1],
                     "status": row[2],
                     "duration_seconds": row[3],
                     "error": row[4]
-                })
+                }
+                for row in cursor.fetchall()
+            ]
 
-            return {
-                "total_model_days": total,
-                "completed": completed or 0,
-                "failed": failed or 0,
-                "pending": pending or 0,
-                "skipped": skipped or 0,
-                "current": current,
-                "details": details
+            counts = Counter(detail["status"] for detail in details)
+            current = next(
+                (
+                    {"date": detail["date"], "model": detail["model"]}
+                    for detail in details
+                    if detail["status"] == "running"
+                ),
+                None
+            )
+
+            progress = self._summary_from_counts(counts, current)
+            progress["details"] = details
+            progress["details_by_key"] = {
+                (detail["date"], detail["model"]): detail
+                for detail in details
             }
 
+            return progress
+
         finally:
             conn.close()
 
+    @staticmethod
+    def _progress_summary(cursor: sqlite3.Cursor, job_id: str) -> Dict[str, Any]:
+        """Status counts and the running model-day for a job (see get_job_progress_summary)."""
+        # At most one row per status, served by idx_job_details_job_status_day
+        cursor.execute("""
+            SELECT status, COUNT(*)
+            FROM job_details
+            WHERE job_id = ?
+            GROUP BY status
+        """, (job_id,))
+
+        counts = dict(cursor.fetchall())
+
+        # Get currently running model-day (earliest first, as in get_job_progress)
+        cursor.execute("""
+            SELECT date, model
+            FROM job_details
+            WHERE job_id = ? AND status = 'running'
+            ORDER BY date, model
+            LIMIT 1
+        """, (job_id,))
+
+        current_row = cursor.fetchone()
+        current = {"date": current_row[0], "model": current_row[1]} if current_row else None
+
+        return JobManager._summary_from_counts(counts, current)
+
+    @staticmethod
+    def _summary_from_counts(
+        counts: Dict[str, int],
+        current: Optional[Dict[str, str]]
+    ) -> Dict[str, Any]:
+        """Shape per-status counts and the running model-day into a progress dict."""
+        return {
+            "total_model_days": sum(counts.values()),
+            "completed": counts.get("completed", 0),
+            "failed": counts.get("failed", 0),
+            "pending": counts.get("pending", 0),
+            "skipped": counts.get("skipped", 0),
+            "current": current
+        }
+
     def can_start_new_job(self) -> bool:
         """
         Check if new job can be started.
@@ -629,14 +787,8 @@ class JobManager:
         cursor = conn.cursor()
 
         try:
-            cursor.execute("""
-                SELECT COUNT(*)
-                FROM jobs
-                WHERE status IN ('pending', 'running')
-            """)
-
-            count = cursor.fetchone()[0]
-            return count == 0
+            # Existence check only: stops at the first match in idx_jobs_status_created
+            return not self._has_active_job(cursor)
 
         finally:
             conn.close()
@@ -652,11 +804,8 @@ class JobManager:
         cursor = conn.cursor()
 
         try:
-            cursor.execute("""
-                SELECT
-                    job_id, config_path, status, date_range, models,
-                    created_at, started_at, updated_at, completed_at,
-                    total_duration_seconds, error, warnings
+            cursor.execute(f"""
+                SELECT {_JOB_COLUMNS}
                 FROM jobs
                 WHERE status IN ('pending', 'running')
                 ORDER BY created_at DESC
@@ -664,20 +813,7 @@ class JobManager:
 
             jobs = []
             for row in cursor.fetchall():
-                jobs.append({
-                    "job_id": row[0],
-                    "config_path": row[1],
-                    "status": row[2],
-                    "date_range": json.loads(row[3]),
-                    "models": json.loads(row[4]),
-                    "created_at": row[5],
-                    "started_at": row[6],
-                    "updated_at": row[7],
-                    "completed_at": row[8],
-                    "total_duration_seconds": row[9],
-                    "error": row[10],
-                    "warnings": row[11]
-                })
+                jobs.append(_job_row_to_dict(row))
 
             return jobs
 
@@ -757,10 +893,7 @@ class JobManager:
         Returns:
             Dict with jobs_cleaned count and details
         """
-        conn = get_db_connection(self.db_path)
-        cursor = conn.cursor()
-
-        try:
+        with self._write_transaction() as cursor:
             # Find all stale jobs
             cursor.execute("""
                 SELECT job_id, status
@@ -812,8 +945,6 @@ class JobManager:
                 logger.warning(f"Cleaned up stale job {job_id}: {original_status} → {new_status} ({completed}/{total} completed)")
                 cleaned_count += 1
 
-            conn.commit()
-
             if cleaned_count > 0:
                 logger.warning(f"⚠️  Cleaned up {cleaned_count} stale job(s) from previous container session")
             else:
@@ -821,9 +952,6 @@ class JobManager:
 
             return {"jobs_cleaned": cleaned_count}
 
-        finally:
-            conn.close()
-
     def cleanup_old_jobs(self, days: int = 30) -> Dict[str, int]:
         """
         Delete jobs older than threshold.
@@ -834,31 +962,18 @@ class JobManager:
         Returns:
             Dict with jobs_deleted count
         """
-        conn = get_db_connection(self.db_path)
-        cursor = conn.cursor()
-
-        try:
+        with self._write_transaction() as cursor:
             cutoff_date = (datetime.utcnow() - timedelta(days=days)).isoformat() + "Z"
 
-            # Get count before deletion
-            cursor.execute("""
-                SELECT COUNT(*)
-                FROM jobs
-                WHERE created_at < ? AND status IN ('completed', 'partial', 'failed')
-            """, (cutoff_date,))
-
-            count = cursor.fetchone()[0]
-
-            # Delete old jobs (foreign key cascade will delete related records)
+            # Range scan on idx_jobs_status_created; the ON DELETE CASCADE
+            # foreign keys remove job_details and related rows in the same statement
             cursor.execute("""
                 DELETE FROM jobs
-                WHERE created_at < ? AND status IN ('completed', 'partial', 'failed')
+                WHERE status IN ('completed', 'partial', 'failed') AND created_at < ?
             """, (cutoff_date,))
 
-            conn.commit()
+            count = cursor.rowcount
+
             logger.info(f"Cleaned up {count} jobs older than {days} days")
 
             return {"jobs_deleted": count}
-
-        finally:
-            conn.close()
@@ -357,7 +357,7 @@ def create_app(
                 raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
 
             # Get progress
-            progress = job_manager.get_job_progress(job_id)
+            progress = job_manager.get_job_progress_summary(job_id)
 
             # Get model-day details
             details = job_manager.get_job_details(job_id)
@@ -77,23 +77,22 @@ def create_trading_days_schema(db: "Database") -> None:
     """)
 
     # Create holdings table (ending positions only)
+    # WITHOUT ROWID: rows live directly in the (trading_day_id, symbol) btree
     db.connection.execute("""
         CREATE TABLE IF NOT EXISTS holdings (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
             trading_day_id INTEGER NOT NULL,
             symbol TEXT NOT NULL,
             quantity INTEGER NOT NULL,
 
-            FOREIGN KEY (trading_day_id) REFERENCES trading_days(id) ON DELETE CASCADE,
-            UNIQUE(trading_day_id, symbol)
-        )
+            PRIMARY KEY (trading_day_id, symbol),
+            FOREIGN KEY (trading_day_id) REFERENCES trading_days(id) ON DELETE CASCADE
+        ) WITHOUT ROWID
     """)
 
-    # Create index for holdings lookups
-    db.connection.execute("""
-        CREATE INDEX IF NOT EXISTS idx_holdings_day
-        ON holdings(trading_day_id)
-    """)
+    # Holdings lookups by trading_day_id use the primary key prefix, so there is
+    # no separate idx_holdings_day. This only shapes fresh databases: the schema
+    # is created once, when trading_days is absent, so older databases keep
+    # their rowid holdings table and index until recreated
 
     # Create actions table (trade ledger)
     db.connection.execute("""
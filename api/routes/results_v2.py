@@ -6,6 +6,11 @@ import json
 import os
 from datetime import datetime, timedelta
 
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is the fallback
+    orjson = None
+
 from api.database import Database
 from api.routes.period_metrics import calculate_period_metrics
 
@@ -209,7 +214,17 @@ def format_single_date_result(row, db: Database, reasoning: str) -> dict:
         result["reasoning"] = row[10]  # reasoning_summary
     elif reasoning == "full":
         reasoning_full = row[11]  # reasoning_full
-        result["reasoning"] = json.loads(reasoning_full) if reasoning_full else []
+        if not reasoning_full:
+            result["reasoning"] = []
+        elif orjson is not None:
+            try:
+                result["reasoning"] = orjson.loads(reasoning_full)
+            except orjson.JSONDecodeError:
+                # Rows written by json.dumps may hold NaN/Infinity, which
+                # orjson rejects as non-standard JSON
+                result["reasoning"] = json.loads(reasoning_full)
+        else:
+            result["reasoning"] = json.loads(reasoning_full)
     else:
         result["reasoning"] = None
 
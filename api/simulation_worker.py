@@ -103,7 +103,7 @@ class SimulationWorker:
                 self._execute_date(date, models, config_path, completion_skips)
 
             # Job completed - determine final status
-            progress = self.job_manager.get_job_progress(self.job_id)
+            progress = self.job_manager.get_job_progress_summary(self.job_id)
 
             if progress["failed"] == 0:
                 final_status = "completed"
@@ -363,23 +363,23 @@ class SimulationWorker:
             completion_skips: {model: {dates}} already completed per model
             models: All model signatures in job
         """
+        # Keyed by model-day so a later reason replaces an earlier one
+        skips = {}
+
         # Price skips affect ALL models equally
         for date in price_skips:
             for model in models:
-                self.job_manager.update_job_detail_status(
-                    self.job_id, date, model,
-                    "skipped",
-                    error="Incomplete price data"
-                )
+                skips[(date, model)] = "Incomplete price data"
 
         # Completion skips are per-model
         for model, skipped_dates in completion_skips.items():
             for date in skipped_dates:
-                self.job_manager.update_job_detail_status(
-                    self.job_id, date, model,
-                    "skipped",
-                    error="Already completed"
-                )
+                skips[(date, model)] = "Already completed"
+
+        self.job_manager.update_job_detail_status_many(self.job_id, [
+            (date, model, "skipped", reason)
+            for (date, model), reason in skips.items()
+        ])
 
     def _add_job_warnings(self, warnings: List[str]) -> None:
         """Store warnings in job metadata."""
@@ -27,7 +27,7 @@ PROJECT_ROOT="$(dirname "$SCRIPT_DIR")"
 FAIL_FAST=false
 JUNIT_XML=true
 COVERAGE_MIN=85
-PARALLEL=false
+PARALLEL=true
 VERBOSE=false
 
 # Parse environment variables (common in CI)
@@ -79,7 +79,7 @@ CI-optimized test runner for AI-Trader.
 OPTIONS:
     -f, --fail-fast         Stop on first failure
     -m, --min-coverage NUM  Minimum coverage percentage (default: 85)
-    -p, --parallel          Run tests in parallel
+    -p, --parallel          Run tests in parallel (default)
     -v, --verbose           Verbose output
     --no-junit              Skip JUnit XML generation
     -h, --help              Show this help message
@@ -87,7 +87,7 @@ OPTIONS:
 ENVIRONMENT VARIABLES:
     CI_FAIL_FAST            Set to 'true' to enable fail-fast
     CI_COVERAGE_MIN         Minimum coverage threshold
-    CI_PARALLEL             Set to 'true' to enable parallel execution
+    CI_PARALLEL             Set to 'false' to run tests sequentially
     CI_VERBOSE              Set to 'true' for verbose output
 
 EXAMPLES:
@@ -84,7 +84,6 @@ def main():
         'unit/test_job_manager_duplicate_detection.py',
         'unit/test_dev_database.py',
         'unit/test_database_schema.py',
-        'unit/test_model_day_executor_reasoning.py',
         'integration/test_duplicate_simulation_prevention.py',
         'integration/test_dev_mode_e2e.py',
         'integration/test_on_demand_downloads.py',
@@ -160,6 +160,25 @@ def test_get_results_single_date(test_db):
     assert "final_position" in result
 
 
+def test_full_reasoning_accepts_nan_written_by_json_dumps(test_db):
+    """Test that reasoning_full rows containing NaN still load."""
+    from api.routes.results_v2 import format_single_date_result
+
+    reasoning_full = json.dumps([{"role": "tool", "content": {"price": float("nan")}}])
+    test_db.connection.execute(
+        "UPDATE trading_days SET reasoning_full = ? WHERE date = ?",
+        (reasoning_full, "2024-01-16")
+    )
+    row = test_db.connection.execute(
+        "SELECT * FROM trading_days WHERE date = ?", ("2024-01-16",)
+    ).fetchone()
+
+    result = format_single_date_result(row, test_db, "full")
+
+    assert result["reasoning"][0]["role"] == "tool"
+    assert result["reasoning"][0]["content"]["price"] != result["reasoning"][0]["content"]["price"]
+
+
 def test_get_results_date_range(test_db):
     """Test date range query returns metrics format."""
     app = create_app(db_path=test_db.db_path)
@@ -7,36 +7,65 @@ This module provides reusable fixtures for:
 - Test data factories
 """
 
+import asyncio
 import pytest
-import tempfile
+import queue
+import sqlite3
 import os
 from pathlib import Path
-from api.database import initialize_database, get_db_connection, db_connection
+from api import database
+from api.database import initialize_database, get_db_connection, db_connection, Database
 
 
 @pytest.fixture(scope="session")
-def test_db_path():
-    """Create temporary database file for testing session."""
-    temp_db = tempfile.NamedTemporaryFile(delete=False, suffix=".db")
-    temp_db.close()
+def test_db_path(tmp_path_factory):
+    """
+    Temporary database file for the testing session.
 
-    yield temp_db.name
+    Keyed on the pytest-xdist worker so each process gets its own file;
+    pytest prunes old tmp_path_factory directories itself.
+    """
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "master")
+    return str(tmp_path_factory.mktemp(f"db-{worker}") / "test.db")
 
-    # Cleanup after all tests
-    try:
-        os.unlink(temp_db.name)
-    except FileNotFoundError:
-        pass
+
+def _initialize_test_schema(db_path: str) -> None:
+    """Create both the initialize_database and Database (trading_days, holdings, actions) schemas."""
+    initialize_database(db_path)
+    db = Database(db_path)
+    db.connection.close()
+
+
+def _existing_tables(db_path: str) -> frozenset:
+    """Names of the tables currently present in db_path."""
+    with db_connection(db_path) as conn:
+        return frozenset(
+            row[0] for row in conn.execute(
+                "SELECT name FROM sqlite_master WHERE type='table' AND name NOT LIKE 'sqlite_%'"
+            )
+        )
+
+
+@pytest.fixture(scope="session")
+def test_db_tables(test_db_path):
+    """
+    Build the session database schema once and return its table names.
+
+    Each pytest(-xdist) process has its own test_db_path, so the schema is
+    built once per worker rather than once per test.
+    """
+    _initialize_test_schema(test_db_path)
+    return _existing_tables(test_db_path)
 
 
 @pytest.fixture(scope="function")
-def clean_db(test_db_path):
+def clean_db(test_db_path, test_db_tables):
     """
     Provide clean database for each test function.
 
     This fixture:
-    1. Initializes schema if needed
-    2. Clears all data before test
+    1. Rebuilds the schema only if tables are missing (e.g. a test dropped them)
+    2. Clears all data and AUTOINCREMENT counters before test
     3. Returns database path
 
     Usage:
@@ -44,25 +73,15 @@ def clean_db(test_db_path):
             conn = get_db_connection(clean_db)
             # ... test code
     """
-    # Ensure schema exists (both old initialize_database and new Database class)
-    initialize_database(test_db_path)
-
-    # Also ensure new schema exists (trading_days, holdings, actions)
-    from api.database import Database
-    db = Database(test_db_path)
-    db.connection.close()
+    tables = _existing_tables(test_db_path)
+    if not test_db_tables.issubset(tables):
+        _initialize_test_schema(test_db_path)
+        tables = _existing_tables(test_db_path)
 
     # Clear all tables using context manager for guaranteed cleanup
     with db_connection(test_db_path) as conn:
         cursor = conn.cursor()
 
-        # Get list of tables that exist
-        cursor.execute("""
-            SELECT name FROM sqlite_master
-            WHERE type='table' AND name NOT LIKE 'sqlite_%'
-        """)
-        tables = [row[0] for row in cursor.fetchall()]
-
         # Delete in correct order (respecting foreign keys), only if table exists
         if 'tool_usage' in tables:
             cursor.execute("DELETE FROM tool_usage")
@@ -83,11 +102,263 @@ def clean_db(test_db_path):
         if 'price_data' in tables:
             cursor.execute("DELETE FROM price_data")
 
+        # TRUNCATE equivalent: restart AUTOINCREMENT ids so every test sees
+        # ids from 1, as on a freshly created database
+        if cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'sqlite_sequence'"
+        ).fetchone():
+            cursor.execute("DELETE FROM sqlite_sequence")
+
         conn.commit()
 
     return test_db_path
 
 
+@pytest.fixture(scope="session")
+def event_loop():
+    """
+    One event loop for every @pytest.mark.asyncio test in the session.
+
+    Overrides pytest-asyncio's per-test loop so async tests do not each pay
+    for creating and closing a loop.
+    """
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture(scope="session")
+def jobs_schema_template(tmp_path_factory):
+    """In-memory copy of the jobs/job_details schema, built once per session."""
+    template_path = str(tmp_path_factory.mktemp("schema") / "template.db")
+    initialize_database(template_path, tables=("jobs", "job_details"))
+
+    template = sqlite3.connect(":memory:", check_same_thread=False)
+    with db_connection(template_path) as source:
+        source.backup(template)
+
+    yield template
+
+    template.close()
+
+
+@pytest.fixture
+def jobs_db(jobs_schema_template, tmp_path):
+    """
+    Per-test jobs database cloned from jobs_schema_template.
+
+    Copies the prebuilt schema pages with Connection.backup instead of
+    re-running the DDL. db_connection resolves the path the same way
+    JobManager does, so the clone lands where JobManager will look.
+    """
+    path = str(tmp_path / "jobs.db")
+    with db_connection(path) as conn:
+        jobs_schema_template.backup(conn)
+
+    return path
+
+
+@pytest.fixture(scope="session")
+def full_schema_template(tmp_path_factory):
+    """
+    In-memory copy of the complete schema, built once per session.
+
+    Holds both the initialize_database tables and the Database
+    (trading_days, holdings, actions) tables.
+    """
+    template_path = str(tmp_path_factory.mktemp("schema") / "full.db")
+    initialize_database(template_path)
+
+    template = sqlite3.connect(":memory:", check_same_thread=False)
+    with db_connection(template_path) as source:
+        source.backup(template)
+    Database(connection=template)
+
+    yield template
+
+    template.close()
+
+
+@pytest.fixture
+def schema_db(full_schema_template, tmp_path):
+    """
+    Per-test database file cloned from full_schema_template.
+
+    A fresh file per test needs neither DDL nor row cleanup, and
+    db_connection resolves the path the same way the code under test does.
+    """
+    path = str(tmp_path / "test.db")
+    with db_connection(path) as conn:
+        full_schema_template.backup(conn)
+
+    return path
+
+
+def _apply_fast_pragmas(conn: sqlite3.Connection) -> sqlite3.Connection:
+    """Trade durability for speed on throwaway test databases."""
+    conn.execute("PRAGMA journal_mode = WAL")
+    conn.execute("PRAGMA synchronous = OFF")
+    conn.execute("PRAGMA temp_store = MEMORY")
+    return conn
+
+
+@pytest.fixture
+def fast_db_connections(monkeypatch):
+    """
+    Apply _apply_fast_pragmas to every connection opened via api.database.
+
+    Covers initialize_database(), db_connection() and the dev database
+    helpers, which all go through api.database.get_db_connection, plus
+    JobManager, which imports get_db_connection directly. Production
+    connection settings are untouched outside the test.
+    """
+    from api import job_manager
+
+    real_get_db_connection = database.get_db_connection
+
+    def fast_get_db_connection(*args, **kwargs):
+        return _apply_fast_pragmas(real_get_db_connection(*args, **kwargs))
+
+    monkeypatch.setattr(database, "get_db_connection", fast_get_db_connection)
+    monkeypatch.setattr(job_manager, "get_db_connection", fast_get_db_connection)
+
+
+FAST_SQLITE_ENV = "AITRADER_TEST_FAST_SQLITE"
+
+
+@pytest.fixture(autouse=True)
+def _fast_sqlite_from_env(request):
+    """
+    Apply fast_db_connections to every test when AITRADER_TEST_FAST_SQLITE=1.
+
+    Lets CI opt the whole suite into WAL/synchronous=OFF without marking
+    each module. locking_mode=EXCLUSIVE is deliberately left out: JobManager
+    and the executor open several connections to the same file per test.
+    Tests marked production_pragmas keep the real connection settings.
+    """
+    if request.node.get_closest_marker("production_pragmas"):
+        return
+    if os.environ.get(FAST_SQLITE_ENV) == "1":
+        request.getfixturevalue("fast_db_connections")
+
+
+DB_POOL_SIZE = 4
+# Seconds to wait for a pooled connection before failing instead of hanging
+DB_POOL_TIMEOUT = 30
+TEST_JOB_ID = "test-job-123"
+
+
+class _PooledConnection(sqlite3.Connection):
+    """
+    Connection shared across tests through the db_pool fixture.
+
+    commit() defers to the per-test savepoint, rollback() rolls back to it
+    without ending it, and close() keeps the connection open for the next
+    test; db_pool closes it for real at the end of the session.
+    """
+
+    def commit(self):
+        pass
+
+    def rollback(self):
+        self.execute("ROLLBACK TO test")
+
+    def close(self):
+        pass
+
+
+@pytest.fixture(scope="session")
+def db_pool():
+    """
+    Queue of pre-initialized in-memory Databases, built once per session.
+
+    Each holds the trading_days schema (jobs, trading_days, holdings,
+    actions) plus the shared "test-job-123" jobs row. Connections run in
+    autocommit mode (isolation_level=None) so the db fixture's savepoint
+    owns the only transaction boundary.
+    """
+    pool = queue.Queue()
+    for _ in range(DB_POOL_SIZE):
+        conn = sqlite3.connect(
+            ":memory:",
+            isolation_level=None,
+            check_same_thread=False,
+            factory=_PooledConnection
+        )
+        pooled_db = Database(":memory:", connection=conn)
+        conn.execute("PRAGMA foreign_keys = ON")
+        conn.execute(
+            """
+            INSERT INTO jobs (job_id, config_path, status, date_range, models, created_at)
+            VALUES (?, ?, ?, ?, ?, ?)
+            """,
+            (TEST_JOB_ID, "test_config.json", "running", "2025-01-14 to 2025-01-16",
+             "test-model", "2025-01-14T10:00:00Z")
+        )
+        pool.put(pooled_db)
+
+    yield pool
+
+    while not pool.empty():
+        sqlite3.Connection.close(pool.get_nowait().connection)
+
+
+@pytest.fixture
+def db(db_pool):
+    """
+    Provide a pooled in-memory Database, rolled back after the test.
+
+    The test runs inside a savepoint, so nothing it writes reaches the
+    next test and no connection is opened or schema rebuilt per test.
+
+    Usage:
+        def test_something(db, job_row):
+            db.create_trading_day(job_id=job_row, ...)
+    """
+    pooled_db = db_pool.get(timeout=DB_POOL_TIMEOUT)
+    conn = pooled_db.connection
+    conn.execute("SAVEPOINT test")
+
+    try:
+        yield pooled_db
+    finally:
+        try:
+            conn.execute("ROLLBACK TO test")
+            conn.execute("RELEASE test")
+        except sqlite3.OperationalError:
+            # The savepoint is gone (e.g. the test ran a raw ROLLBACK);
+            # discard whatever transaction is left before reuse
+            if conn.in_transaction:
+                sqlite3.Connection.rollback(conn)
+        db_pool.put(pooled_db)
+
+
+@pytest.fixture
+def job_row(db):
+    """
+    Job id of the jobs row every pooled db already holds.
+
+    The row is inserted once per pooled connection when db_pool is built,
+    so tests that need a parent job pay no INSERT or commit of their own.
+    """
+    return TEST_JOB_ID
+
+
+@pytest.fixture
+def patched_trade_db(db, monkeypatch):
+    """
+    Route agent_tools.tool_trade database access to the per-test db.
+
+    monkeypatch restores the real get_db_connection on teardown, even when
+    the test fails.
+    """
+    monkeypatch.setattr(
+        "agent_tools.tool_trade.get_db_connection",
+        lambda path: db.connection
+    )
+    return db
+
+
 @pytest.fixture
 def sample_job_data():
     """Sample job data for testing."""
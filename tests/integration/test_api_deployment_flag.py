@@ -1,11 +1,10 @@
-import os
 import pytest
 from fastapi.testclient import TestClient
 
 
-def test_api_includes_deployment_mode_flag():
+def test_api_includes_deployment_mode_flag(monkeypatch):
     """Test API responses include deployment_mode field"""
-    os.environ["DEPLOYMENT_MODE"] = "DEV"
+    monkeypatch.setenv("DEPLOYMENT_MODE", "DEV")
 
     from api.main import app
     client = TestClient(app)
@@ -19,9 +18,9 @@ def test_api_includes_deployment_mode_flag():
     assert data["deployment_mode"] == "DEV"
 
 
-def test_job_response_includes_deployment_mode():
+def test_job_response_includes_deployment_mode(monkeypatch):
     """Test job creation response includes deployment mode"""
-    os.environ["DEPLOYMENT_MODE"] = "PROD"
+    monkeypatch.setenv("DEPLOYMENT_MODE", "PROD")
 
     from api.main import app
     client = TestClient(app)
@@ -1,7 +1,9 @@
 """Tests for BaseAgent conversation history tracking."""
 
+import json
+
 import pytest
-from agent.base_agent.base_agent import BaseAgent
+from agent.base_agent.base_agent import BaseAgent, _serialize_conversation
 
 
 def test_conversation_history_initialized_empty():
@@ -93,3 +95,17 @@ def test_get_conversation_history_returns_copy():
     # Other copy should be unaffected
     assert len(history2) == 1
     assert len(agent.conversation_history) == 1
+
+
+def test_serialize_conversation_is_compact_round_trippable_json():
+    """reasoning_full should be compact JSON that loads back unchanged."""
+    conversation = [
+        {"role": "user", "content": "Analyze AAPL", "timestamp": "2025-01-16T10:00:00"},
+        {"role": "assistant", "content": "Bought 10 shares – strong earnings"},
+    ]
+
+    serialized = _serialize_conversation(conversation)
+
+    assert isinstance(serialized, str)
+    assert '": "' not in serialized
+    assert json.loads(serialized) == conversation
@@ -1,13 +1,12 @@
-import os
 import pytest
 import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 from agent.base_agent.base_agent import BaseAgent
 
 
-def test_base_agent_uses_mock_in_dev_mode():
+def test_base_agent_uses_mock_in_dev_mode(monkeypatch):
     """Test BaseAgent uses mock model when DEPLOYMENT_MODE=DEV"""
-    os.environ["DEPLOYMENT_MODE"] = "DEV"
+    monkeypatch.setenv("DEPLOYMENT_MODE", "DEV")
 
     agent = BaseAgent(
         signature="test-agent",
@@ -33,13 +32,11 @@ def test_base_agent_uses_mock_in_dev_mode():
     assert agent.model is not None
     assert "Mock" in str(type(agent.model))
 
-    os.environ["DEPLOYMENT_MODE"] = "PROD"
 
-
-def test_base_agent_warns_about_api_keys_in_dev(capsys):
+def test_base_agent_warns_about_api_keys_in_dev(capsys, monkeypatch):
     """Test BaseAgent logs warning about API keys in DEV mode"""
-    os.environ["DEPLOYMENT_MODE"] = "DEV"
-    os.environ["OPENAI_API_KEY"] = "sk-test123"
+    monkeypatch.setenv("DEPLOYMENT_MODE", "DEV")
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test123")
 
     # Test the warning function directly
     from tools.deployment_config import log_api_key_warning
@@ -49,13 +46,10 @@ def test_base_agent_warns_about_api_keys_in_dev(capsys):
     assert "WARNING" in captured.out
     assert "OPENAI_API_KEY" in captured.out
 
-    os.environ.pop("OPENAI_API_KEY")
-    os.environ["DEPLOYMENT_MODE"] = "PROD"
-
 
-def test_base_agent_uses_dev_data_path():
+def test_base_agent_uses_dev_data_path(monkeypatch):
     """Test BaseAgent uses dev data paths in DEV mode"""
-    os.environ["DEPLOYMENT_MODE"] = "DEV"
+    monkeypatch.setenv("DEPLOYMENT_MODE", "DEV")
 
     agent = BaseAgent(
         signature="test-agent",
@@ -65,5 +59,3 @@ def test_base_agent_uses_dev_data_path():
 
     # Should be converted to dev path
     assert "dev_agent_data" in agent.base_log_path
-
-    os.environ["DEPLOYMENT_MODE"] = "PROD"
@@ -118,8 +118,7 @@ def test_calculate_final_position_with_previous_holdings(test_db):
     )
 
     # Add day 1 ending holdings
-    test_db.create_holding(day1_id, "AAPL", 10)
-    test_db.create_holding(day1_id, "MSFT", 5)
+    test_db.create_holdings_bulk(day1_id, [("AAPL", 10), ("MSFT", 5)])
 
     # Create day 2
     day2_id = test_db.create_trading_day(
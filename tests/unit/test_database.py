@@ -59,6 +59,16 @@ class TestDatabaseConnection:
 
         os.unlink(temp_db.name)
 
+    @pytest.mark.production_pragmas
+    def test_get_db_connection_uses_wal_pragmas(self, tmp_path):
+        """Should open file databases in WAL mode with synchronous=NORMAL."""
+        with db_connection(str(tmp_path / "wal.db")) as conn:
+            cursor = conn.cursor()
+
+            assert cursor.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+            assert cursor.execute("PRAGMA synchronous").fetchone()[0] == 1  # 1 = NORMAL
+            assert cursor.execute("PRAGMA temp_store").fetchone()[0] == 2  # 2 = MEMORY
+
     def test_get_db_connection_row_factory(self):
         """Should set row factory for dict-like access."""
         temp_db = tempfile.NamedTemporaryFile(delete=False, suffix=".db")
@@ -176,13 +186,12 @@ class TestSchemaInitialization:
             indexes = [row[0] for row in cursor.fetchall()]
 
             required_indexes = [
-                'idx_jobs_status',
                 'idx_jobs_created_at',
-                'idx_job_details_job_id',
+                'idx_jobs_status_created',
                 'idx_job_details_status',
+                'idx_job_details_job_status_day',
                 'idx_job_details_unique',
                 'idx_trading_days_lookup',  # Compound index in new schema
-                'idx_holdings_day',
                 'idx_actions_day',
                 'idx_tool_usage_job_date_model'
             ]
@@ -190,6 +199,10 @@ class TestSchemaInitialization:
             for index in required_indexes:
                 assert index in indexes, f"Missing index: {index}"
 
+            # Key prefixes of other indexes or primary keys are not kept
+            assert 'idx_jobs_status' not in indexes
+            assert 'idx_holdings_day' not in indexes
+
 
     def test_initialize_database_idempotent(self, clean_db):
         """Should be safe to call multiple times."""
@@ -1,37 +1,61 @@
 import pytest
+import sqlite3
 from datetime import datetime
 from api.database import Database
 
 
+_INSERT_JOB = (
+    "INSERT INTO jobs (job_id, config_path, status, date_range, models, created_at) "
+    "VALUES (?, ?, ?, ?, ?, ?)"
+)
+
+
+def _seed_jobs(db, *jobs):
+    """Insert job rows inside a single explicit (nestable) transaction."""
+    db.connection.execute("SAVEPOINT seed")
+    db.connection.executemany(_INSERT_JOB, jobs)
+    db.connection.execute("RELEASE seed")
+
+
+class _SavepointConnection(sqlite3.Connection):
+    """Connection whose commit() defers to the enclosing per-test savepoint."""
+
+    def commit(self):
+        pass
+
+
+@pytest.fixture(scope="module")
+def shared_db():
+    """One in-memory database (schema built once) for the whole module.
+
+    The connection runs in autocommit mode (isolation_level=None) so the
+    per-test savepoint below owns the only transaction boundary.
+    """
+    connection = sqlite3.connect(
+        ":memory:",
+        isolation_level=None,
+        factory=_SavepointConnection
+    )
+    db = Database(":memory:", connection=connection)
+    yield db
+    connection.close()
+
+
 class TestDatabaseHelpers:
 
     @pytest.fixture
-    def db(self, tmp_path):
-        """Create test database with schema."""
-        import importlib
-        migration_module = importlib.import_module('api.migrations.001_trading_days_schema')
-        create_trading_days_schema = migration_module.create_trading_days_schema
-
-        db_path = tmp_path / "test.db"
-        db = Database(str(db_path))
-
-        # Create jobs table (prerequisite)
-        db.connection.execute("""
-            CREATE TABLE IF NOT EXISTS jobs (
-                job_id TEXT PRIMARY KEY,
-                status TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
-
-        create_trading_days_schema(db)
-        return db
+    def db(self, shared_db):
+        """Run each test inside a savepoint that is rolled back afterwards."""
+        shared_db.connection.execute("SAVEPOINT test")
+        yield shared_db
+        shared_db.connection.execute("ROLLBACK TO test")
+        shared_db.connection.execute("RELEASE test")
 
     def test_create_trading_day(self, db):
         """Test creating a new trading day record."""
         # Insert job first
-        db.connection.execute(
-            "INSERT INTO jobs (job_id, config_path, status, date_range, models, created_at) VALUES (?, ?, ?, ?, ?, ?)",
+        _seed_jobs(
+            db,
             ("test-job", "configs/test.json", "running", '["2025-01-15"]', '["test-model"]', "2025-01-15T00:00:00Z")
         )
 
@@ -60,8 +84,8 @@ class TestDatabaseHelpers:
     def test_get_previous_trading_day(self, db):
         """Test retrieving previous trading day."""
         # Setup: Create job and two trading days
-        db.connection.execute(
-            "INSERT INTO jobs (job_id, config_path, status, date_range, models, created_at) VALUES (?, ?, ?, ?, ?, ?)",
+        _seed_jobs(
+            db,
             ("test-job", "configs/test.json", "running", '["2025-01-15"]', '["test-model"]', "2025-01-15T00:00:00Z")
         )
 
@@ -102,8 +126,8 @@ class TestDatabaseHelpers:
 
     def test_get_previous_trading_day_with_weekend_gap(self, db):
         """Test retrieving previous trading day across weekend."""
-        db.connection.execute(
-            "INSERT INTO jobs (job_id, config_path, status, date_range, models, created_at) VALUES (?, ?, ?, ?, ?, ?)",
+        _seed_jobs(
+            db,
             ("test-job", "configs/test.json", "running", '["2025-01-15"]', '["test-model"]', "2025-01-15T00:00:00Z")
         )
 
@@ -133,13 +157,10 @@ class TestDatabaseHelpers:
     def test_get_previous_trading_day_across_jobs(self, db):
         """Test retrieving previous trading day from different job (cross-job continuity)."""
         # Setup: Create two jobs
-        db.connection.execute(
-            "INSERT INTO jobs (job_id, status, config_path, date_range, models, created_at) VALUES (?, ?, ?, ?, ?, ?)",
-            ("job-1", "completed", "config.json", "2025-10-07,2025-10-07", "deepseek-chat-v3.1", "2025-11-07T00:00:00Z")
-        )
-        db.connection.execute(
-            "INSERT INTO jobs (job_id, status, config_path, date_range, models, created_at) VALUES (?, ?, ?, ?, ?, ?)",
-            ("job-2", "running", "config.json", "2025-10-08,2025-10-08", "deepseek-chat-v3.1", "2025-11-07T01:00:00Z")
+        _seed_jobs(
+            db,
+            ("job-1", "config.json", "completed", "2025-10-07,2025-10-07", "deepseek-chat-v3.1", "2025-11-07T00:00:00Z"),
+            ("job-2", "config.json", "running", "2025-10-08,2025-10-08", "deepseek-chat-v3.1", "2025-11-07T01:00:00Z"),
         )
 
         # Day 1 in job-1
@@ -170,8 +191,8 @@ class TestDatabaseHelpers:
 
     def test_get_ending_holdings(self, db):
         """Test retrieving ending holdings for a trading day."""
-        db.connection.execute(
-            "INSERT INTO jobs (job_id, config_path, status, date_range, models, created_at) VALUES (?, ?, ?, ?, ?, ?)",
+        _seed_jobs(
+            db,
             ("test-job", "configs/test.json", "running", '["2025-01-15"]', '["test-model"]', "2025-01-15T00:00:00Z")
         )
 
@@ -188,8 +209,7 @@ class TestDatabaseHelpers:
         )
 
         # Add holdings
-        db.create_holding(trading_day_id, "AAPL", 10)
-        db.create_holding(trading_day_id, "MSFT", 5)
+        db.create_holdings_bulk(trading_day_id, [("AAPL", 10), ("MSFT", 5)])
 
         # Test
         holdings = db.get_ending_holdings(trading_day_id)
@@ -198,10 +218,40 @@ class TestDatabaseHelpers:
         assert {"symbol": "AAPL", "quantity": 10} in holdings
         assert {"symbol": "MSFT", "quantity": 5} in holdings
 
+    def test_create_holdings_bulk_can_defer_commit(self, db, monkeypatch):
+        """With commit=False the holdings join the caller's transaction."""
+        _seed_jobs(
+            db,
+            ("test-job", "configs/test.json", "running", '["2025-01-15"]', '["gpt-4"]', "2025-01-15T00:00:00Z")
+        )
+        trading_day_id = db.create_trading_day(
+            job_id="test-job",
+            model="gpt-4",
+            date="2025-01-15",
+            starting_cash=10000.0,
+            starting_portfolio_value=10000.0,
+            daily_profit=0.0,
+            daily_return_pct=0.0,
+            ending_cash=9000.0,
+            ending_portfolio_value=10000.0
+        )
+
+        commits = []
+        monkeypatch.setattr(db.connection, "commit", lambda: commits.append(True))
+
+        # Observe the executed SQL directly instead of re-querying holdings
+        statements = []
+        db.connection.set_trace_callback(statements.append)
+        db.create_holdings_bulk(trading_day_id, [("AAPL", 10), ("MSFT", 5)], commit=False)
+        db.connection.set_trace_callback(None)
+
+        assert commits == []
+        assert [sql.split()[:3] for sql in statements] == [["INSERT", "INTO", "holdings"]] * 2
+
     def test_get_starting_holdings_first_day(self, db):
         """Test starting holdings for first trading day (should be empty)."""
-        db.connection.execute(
-            "INSERT INTO jobs (job_id, config_path, status, date_range, models, created_at) VALUES (?, ?, ?, ?, ?, ?)",
+        _seed_jobs(
+            db,
             ("test-job", "configs/test.json", "running", '["2025-01-15"]', '["test-model"]', "2025-01-15T00:00:00Z")
         )
 
@@ -223,8 +273,8 @@ class TestDatabaseHelpers:
 
     def test_get_starting_holdings_from_previous_day(self, db):
         """Test starting holdings derived from previous day's ending."""
-        db.connection.execute(
-            "INSERT INTO jobs (job_id, config_path, status, date_range, models, created_at) VALUES (?, ?, ?, ?, ?, ?)",
+        _seed_jobs(
+            db,
             ("test-job", "configs/test.json", "running", '["2025-01-15"]', '["test-model"]', "2025-01-15T00:00:00Z")
         )
 
@@ -255,23 +305,29 @@ class TestDatabaseHelpers:
             ending_portfolio_value=9500.0
         )
 
-        # Test: Day 2 starting = Day 1 ending
+        # Test: Day 2 starting = Day 1 ending, fetched with a single statement
+        statements = []
+        db.connection.set_trace_callback(statements.append)
         holdings = db.get_starting_holdings(day2_id)
+        db.connection.set_trace_callback(None)
 
         assert len(holdings) == 1
         assert holdings[0]["symbol"] == "AAPL"
         assert holdings[0]["quantity"] == 10
+        assert len(statements) == 1
+
+        plan = " ".join(
+            row[3] for row in db.connection.execute("EXPLAIN QUERY PLAN " + statements[0])
+        )
+        assert "SCAN holdings" not in plan
 
     def test_get_starting_holdings_across_jobs(self, db):
         """Test starting holdings retrieval across different jobs (cross-job continuity)."""
         # Setup: Create two jobs
-        db.connection.execute(
-            "INSERT INTO jobs (job_id, status, config_path, date_range, models, created_at) VALUES (?, ?, ?, ?, ?, ?)",
-            ("job-1", "completed", "config.json", "2025-10-07,2025-10-07", "deepseek-chat-v3.1", "2025-11-07T00:00:00Z")
-        )
-        db.connection.execute(
-            "INSERT INTO jobs (job_id, status, config_path, date_range, models, created_at) VALUES (?, ?, ?, ?, ?, ?)",
-            ("job-2", "running", "config.json", "2025-10-08,2025-10-08", "deepseek-chat-v3.1", "2025-11-07T01:00:00Z")
+        _seed_jobs(
+            db,
+            ("job-1", "config.json", "completed", "2025-10-07,2025-10-07", "deepseek-chat-v3.1", "2025-11-07T00:00:00Z"),
+            ("job-2", "config.json", "running", "2025-10-08,2025-10-08", "deepseek-chat-v3.1", "2025-11-07T01:00:00Z"),
         )
 
         # Day 1 in job-1 with holdings
@@ -286,11 +342,13 @@ class TestDatabaseHelpers:
             ending_cash=329.825,
             ending_portfolio_value=10666.135
         )
-        db.create_holding(day1_id, "AAPL", 10)
-        db.create_holding(day1_id, "AMD", 4)
-        db.create_holding(day1_id, "MSFT", 8)
-        db.create_holding(day1_id, "NVDA", 12)
-        db.create_holding(day1_id, "TSLA", 1)
+        db.create_holdings_bulk(day1_id, [
+            ("AAPL", 10),
+            ("AMD", 4),
+            ("MSFT", 8),
+            ("NVDA", 12),
+            ("TSLA", 1),
+        ])
 
         # Day 2 in job-2 (different job)
         day2_id = db.create_trading_day(
@@ -317,8 +375,8 @@ class TestDatabaseHelpers:
 
     def test_create_action(self, db):
         """Test creating an action record."""
-        db.connection.execute(
-            "INSERT INTO jobs (job_id, config_path, status, date_range, models, created_at) VALUES (?, ?, ?, ?, ?, ?)",
+        _seed_jobs(
+            db,
             ("test-job", "configs/test.json", "running", '["2025-01-15"]', '["test-model"]', "2025-01-15T00:00:00Z")
         )
 
@@ -354,8 +412,8 @@ class TestDatabaseHelpers:
 
     def test_get_actions(self, db):
         """Test retrieving all actions for a trading day."""
-        db.connection.execute(
-            "INSERT INTO jobs (job_id, config_path, status, date_range, models, created_at) VALUES (?, ?, ?, ?, ?, ?)",
+        _seed_jobs(
+            db,
             ("test-job", "configs/test.json", "running", '["2025-01-15"]', '["test-model"]', "2025-01-15T00:00:00Z")
         )
 
@@ -371,9 +429,45 @@ class TestDatabaseHelpers:
             ending_portfolio_value=9500.0
         )
 
-        db.create_action(trading_day_id, "buy", "AAPL", 10, 100.0)
-        db.create_action(trading_day_id, "sell", "MSFT", 5, 50.0)
+        db.create_actions_bulk(trading_day_id, [
+            ("buy", "AAPL", 10, 100.0),
+            ("sell", "MSFT", 5, 50.0),
+        ])
 
         actions = db.get_actions(trading_day_id)
 
         assert len(actions) == 2
+        assert {a["symbol"] for a in actions} == {"AAPL", "MSFT"}
+
+    def test_create_holding_rejects_duplicate_symbol(self, db):
+        """Test holdings primary key rejects a second row for the same symbol."""
+        _seed_jobs(
+            db,
+            ("test-job", "configs/test.json", "running", '["2025-01-15"]', '["test-model"]', "2025-01-15T00:00:00Z")
+        )
+
+        trading_day_id = db.create_trading_day(
+            job_id="test-job",
+            model="gpt-4",
+            date="2025-01-15",
+            starting_cash=10000.0,
+            starting_portfolio_value=10000.0,
+            daily_profit=0.0,
+            daily_return_pct=0.0,
+            ending_cash=9000.0,
+            ending_portfolio_value=10000.0
+        )
+        db.create_holding(trading_day_id, "AAPL", 10)
+
+        with pytest.raises(sqlite3.IntegrityError):
+            db.create_holding(trading_day_id, "AAPL", 5)
+
+    def test_holdings_point_lookup_uses_primary_key(self, db):
+        """Test (trading_day_id, symbol) lookups hit the WITHOUT ROWID primary key."""
+        cursor = db.connection.execute(
+            "EXPLAIN QUERY PLAN SELECT quantity FROM holdings WHERE trading_day_id = ? AND symbol = ?",
+            (1, "AAPL")
+        )
+        plan = " ".join(row[3] for row in cursor.fetchall())
+
+        assert "USING PRIMARY KEY" in plan
@@ -5,7 +5,7 @@ from api.database import initialize_database, get_db_connection, db_connection
 def test_jobs_table_allows_downloading_data_status(tmp_path):
     """Test that jobs table accepts downloading_data status."""
     db_path = str(tmp_path / "test.db")
-    initialize_database(db_path)
+    initialize_database(db_path, tables=("jobs",))
 
     with db_connection(db_path) as conn:
         cursor = conn.cursor()
@@ -26,7 +26,7 @@ def test_jobs_table_allows_downloading_data_status(tmp_path):
 def test_jobs_table_has_warnings_column(tmp_path):
     """Test that jobs table has warnings TEXT column."""
     db_path = str(tmp_path / "test.db")
-    initialize_database(db_path)
+    initialize_database(db_path, tables=("jobs",))
 
     with db_connection(db_path) as conn:
         cursor = conn.cursor()
@@ -43,3 +43,24 @@ def test_jobs_table_has_warnings_column(tmp_path):
         result = cursor.fetchone()
         assert result[0] == '["Warning 1", "Warning 2"]'
 
+
+def test_initialize_database_creates_only_requested_tables(tmp_path):
+    """Test that tables= limits DDL to the requested tables and their indexes."""
+    db_path = str(tmp_path / "test.db")
+    initialize_database(db_path, tables=("jobs",))
+
+    with db_connection(db_path) as conn:
+        cursor = conn.cursor()
+        cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name NOT LIKE 'sqlite_%'")
+        assert [row[0] for row in cursor.fetchall()] == ["jobs"]
+
+        cursor.execute("SELECT name FROM sqlite_master WHERE type='index' AND name LIKE 'idx_%' ORDER BY name")
+        assert [row[0] for row in cursor.fetchall()] == [
+            "idx_jobs_created_at", "idx_jobs_status_created"
+        ]
+
+
+def test_initialize_database_rejects_unknown_table(tmp_path):
+    """Test that unknown table names are rejected before touching the database."""
+    with pytest.raises(ValueError, match="Unknown tables"):
+        initialize_database(str(tmp_path / "test.db"), tables=("jobs", "nope"))
@@ -61,6 +61,17 @@ class TestExpandDateRange:
         assert "2024-12-31" in result
         assert "2025-01-01" in result
 
+    def test_leap_year_full_range(self):
+        """Test year-long range includes leap day and matches timedelta stepping."""
+        result = expand_date_range("2024-01-01", "2024-12-31")
+        start = datetime(2024, 1, 1)
+        expected = [
+            (start + timedelta(days=i)).strftime("%Y-%m-%d")
+            for i in range(366)
+        ]
+        assert result == expected
+        assert "2024-02-29" in result
+
 
 class TestValidateDateRange:
     """Test validate_date_range function."""
@@ -145,5 +156,4 @@ class TestGetMaxSimulationDays:
         """Test env var is converted to int."""
         monkeypatch.setenv("MAX_SIMULATION_DAYS", "100")
         result = get_max_simulation_days()
-        assert isinstance(result, int)
-        assert result == 100
+        assert (type(result), result) == (int, 100)
@@ -1,4 +1,3 @@
-import os
 import pytest
 from tools.deployment_config import (
     get_deployment_mode,
@@ -12,70 +11,68 @@ from tools.deployment_config import (
 )
 
 
-def test_get_deployment_mode_default():
+def test_get_deployment_mode_default(monkeypatch):
     """Test default deployment mode is PROD"""
     # Clear env to test default
-    os.environ.pop("DEPLOYMENT_MODE", None)
+    monkeypatch.delenv("DEPLOYMENT_MODE", raising=False)
     assert get_deployment_mode() == "PROD"
 
 
-def test_get_deployment_mode_dev():
+def test_get_deployment_mode_dev(monkeypatch):
     """Test DEV mode detection"""
-    os.environ["DEPLOYMENT_MODE"] = "DEV"
-    assert get_deployment_mode() == "DEV"
-    assert is_dev_mode() == True
-    assert is_prod_mode() == False
+    monkeypatch.setenv("DEPLOYMENT_MODE", "DEV")
+    assert (get_deployment_mode(), is_dev_mode(), is_prod_mode()) == ("DEV", True, False)
 
 
-def test_get_deployment_mode_prod():
+def test_get_deployment_mode_prod(monkeypatch):
     """Test PROD mode detection"""
-    os.environ["DEPLOYMENT_MODE"] = "PROD"
-    assert get_deployment_mode() == "PROD"
-    assert is_dev_mode() == False
-    assert is_prod_mode() == True
+    monkeypatch.setenv("DEPLOYMENT_MODE", "PROD")
+    assert (get_deployment_mode(), is_dev_mode(), is_prod_mode()) == ("PROD", False, True)
 
 
-def test_get_data_path_prod():
+def test_get_data_path_prod(monkeypatch):
     """Test production data path"""
-    os.environ["DEPLOYMENT_MODE"] = "PROD"
+    monkeypatch.setenv("DEPLOYMENT_MODE", "PROD")
     assert get_data_path("./data/agent_data") == "./data/agent_data"
 
 
-def test_get_data_path_dev():
+def test_get_data_path_dev(monkeypatch):
     """Test dev data path substitution"""
-    os.environ["DEPLOYMENT_MODE"] = "DEV"
+    monkeypatch.setenv("DEPLOYMENT_MODE", "DEV")
     assert get_data_path("./data/agent_data") == "./data/dev_agent_data"
 
 
-def test_get_db_path_prod():
+def test_get_db_path_prod(monkeypatch):
     """Test production database path"""
-    os.environ["DEPLOYMENT_MODE"] = "PROD"
+    monkeypatch.setenv("DEPLOYMENT_MODE", "PROD")
     assert get_db_path("data/trading.db") == "data/trading.db"
 
 
-def test_get_db_path_dev():
+def test_get_db_path_dev(monkeypatch):
     """Test dev database path substitution"""
-    os.environ["DEPLOYMENT_MODE"] = "DEV"
-    assert get_db_path("data/trading.db") == "data/trading_dev.db"
-    assert get_db_path("data/jobs.db") == "data/jobs_dev.db"
+    monkeypatch.setenv("DEPLOYMENT_MODE", "DEV")
+    assert (get_db_path("data/trading.db"), get_db_path("data/jobs.db")) == (
+        "data/trading_dev.db",
+        "data/jobs_dev.db",
+    )
 
 
-def test_should_preserve_dev_data_default():
+def test_should_preserve_dev_data_default(monkeypatch):
     """Test default preserve flag is False"""
-    os.environ.pop("PRESERVE_DEV_DATA", None)
+    monkeypatch.delenv("PRESERVE_DEV_DATA", raising=False)
     assert should_preserve_dev_data() == False
 
 
-def test_should_preserve_dev_data_true():
+def test_should_preserve_dev_data_true(monkeypatch):
     """Test preserve flag can be enabled"""
-    os.environ["PRESERVE_DEV_DATA"] = "true"
+    monkeypatch.setenv("PRESERVE_DEV_DATA", "true")
     assert should_preserve_dev_data() == True
 
 
-def test_log_api_key_warning_in_dev(capsys):
+def test_log_api_key_warning_in_dev(capsys, monkeypatch):
     """Test warning logged when API keys present in DEV mode"""
-    os.environ["DEPLOYMENT_MODE"] = "DEV"
-    os.environ["OPENAI_API_KEY"] = "sk-test123"
+    monkeypatch.setenv("DEPLOYMENT_MODE", "DEV")
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test123")
 
     log_api_key_warning()
 
@@ -84,13 +81,15 @@ def test_log_api_key_warning_in_dev(capsys):
     assert "OPENAI_API_KEY" in captured.out
 
 
-def test_get_deployment_mode_dict():
+def test_get_deployment_mode_dict(monkeypatch):
     """Test deployment mode dictionary generation"""
-    os.environ["DEPLOYMENT_MODE"] = "DEV"
-    os.environ["PRESERVE_DEV_DATA"] = "true"
+    monkeypatch.setenv("DEPLOYMENT_MODE", "DEV")
+    monkeypatch.setenv("PRESERVE_DEV_DATA", "true")
 
     result = get_deployment_mode_dict()
 
-    assert result["deployment_mode"] == "DEV"
-    assert result["is_dev_mode"] == True
-    assert result["preserve_dev_data"] == True
+    assert (
+        result["deployment_mode"],
+        result["is_dev_mode"],
+        result["preserve_dev_data"],
+    ) == ("DEV", True, True)
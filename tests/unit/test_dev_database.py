@@ -1,35 +1,53 @@
-import os
+import shutil
 import pytest
 from pathlib import Path
-from api.database import initialize_dev_database, cleanup_dev_database, db_connection
+from api.database import initialize_database, initialize_dev_database, cleanup_dev_database, db_connection
+
+# File-backed dev databases here are throwaway: skip fsyncs on every commit
+pytestmark = pytest.mark.usefixtures("fast_db_connections")
+
+
+@pytest.fixture(scope="module")
+def dev_dir(tmp_path_factory):
+    """Shared directory for this module's dev databases (one mkdir per module)"""
+    return tmp_path_factory.mktemp("dev")
 
 
 @pytest.fixture
-def clean_env():
-    """Fixture to ensure clean environment variables for each test"""
-    original_preserve = os.environ.get("PRESERVE_DEV_DATA")
-    os.environ.pop("PRESERVE_DEV_DATA", None)
+def dev_db_path(dev_dir, request):
+    """Per-test database path inside the shared module directory"""
+    return str(dev_dir / f"{request.node.name}.db")
+
+
+@pytest.fixture(scope="module")
+def initialized_db_template(dev_dir):
+    """Schema-only database built once per module and copied by each test"""
+    template_path = str(dev_dir / "template.db")
+    initialize_database(template_path)
+    return template_path
+
+
+@pytest.fixture
+def initialized_dev_db(initialized_db_template, dev_db_path):
+    """Per-test copy of the initialized template (a file copy, not a DDL rerun)"""
+    shutil.copyfile(initialized_db_template, dev_db_path)
+    return dev_db_path
 
-    yield
 
-    # Restore original state
-    if original_preserve:
-        os.environ["PRESERVE_DEV_DATA"] = original_preserve
-    else:
-        os.environ.pop("PRESERVE_DEV_DATA", None)
+@pytest.fixture
+def clean_env(monkeypatch):
+    """Fixture to ensure clean environment variables for each test"""
+    monkeypatch.delenv("PRESERVE_DEV_DATA", raising=False)
 
 
-@pytest.mark.skip(reason="Test isolation issue - passes when run alone, fails in full suite")
-def test_initialize_dev_database_creates_fresh_db(tmp_path, clean_env):
+def test_initialize_dev_database_creates_fresh_db(initialized_dev_db, clean_env, monkeypatch):
     """Test dev database initialization creates clean schema"""
     # Ensure PRESERVE_DEV_DATA is false for this test
-    os.environ["PRESERVE_DEV_DATA"] = "false"
+    monkeypatch.setenv("PRESERVE_DEV_DATA", "false")
 
-    db_path = str(tmp_path / "test_dev.db")
+    db_path = initialized_dev_db
 
-    # Create initial database with some data
-    from api.database import get_db_connection, initialize_database
-    initialize_database(db_path)
+    # Add some data to the initialized database
     with db_connection(db_path) as conn:
         conn.execute("INSERT INTO jobs (job_id, config_path, status, date_range, models, created_at) VALUES (?, ?, ?, ?, ?, ?)",
                      ("test-job", "config.json", "completed", "2025-01-01:2025-01-31", '["model1"]', "2025-01-01T00:00:00"))
@@ -41,17 +59,8 @@ def test_initialize_dev_database_creates_fresh_db(tmp_path, clean_env):
         cursor.execute("SELECT COUNT(*) FROM jobs")
         assert cursor.fetchone()[0] == 1
 
-    # Close all connections before reinitializing
-    conn.close()
-
-    # Clear any cached connections
-    import threading
-    if hasattr(threading.current_thread(), '_db_connections'):
-        delattr(threading.current_thread(), '_db_connections')
-
-    # Wait briefly to ensure file is released
-    import time
-    time.sleep(0.1)
+    # Both connections above were closed by db_connection(), so the file
+    # can be replaced immediately
 
     # Initialize dev database (should reset)
     initialize_dev_database(db_path)
@@ -64,11 +73,11 @@ def test_initialize_dev_database_creates_fresh_db(tmp_path, clean_env):
     assert count == 0, f"Expected 0 jobs after reinitialization, found {count}"
 
 
-def test_cleanup_dev_database_removes_files(tmp_path):
+def test_cleanup_dev_database_removes_files(dev_dir, dev_db_path):
     """Test dev cleanup removes database and data files"""
     # Setup dev files
-    db_path = str(tmp_path / "test_dev.db")
-    data_path = str(tmp_path / "dev_agent_data")
+    db_path = dev_db_path
+    data_path = str(dev_dir / "dev_agent_data")
 
     Path(db_path).touch()
     Path(data_path).mkdir(parents=True, exist_ok=True)
@@ -86,14 +95,12 @@ def test_cleanup_dev_database_removes_files(tmp_path):
     assert not Path(data_path).exists()
 
 
-def test_initialize_dev_respects_preserve_flag(tmp_path, clean_env):
+def test_initialize_dev_respects_preserve_flag(initialized_dev_db, clean_env, monkeypatch):
     """Test that PRESERVE_DEV_DATA flag prevents cleanup"""
-    os.environ["PRESERVE_DEV_DATA"] = "true"
-    db_path = str(tmp_path / "test_dev.db")
+    monkeypatch.setenv("PRESERVE_DEV_DATA", "true")
+    db_path = initialized_dev_db
 
-    # Create database with data
-    from api.database import get_db_connection, initialize_database
-    initialize_database(db_path)
+    # Add data to the initialized database
     with db_connection(db_path) as conn:
         conn.execute("INSERT INTO jobs (job_id, config_path, status, date_range, models, created_at) VALUES (?, ?, ?, ?, ?, ?)",
                      ("test-job", "config.json", "completed", "2025-01-01:2025-01-31", '["model1"]', "2025-01-01T00:00:00"))
@@ -109,10 +116,9 @@ def test_initialize_dev_respects_preserve_flag(tmp_path, clean_env):
         assert cursor.fetchone()[0] == 1
 
 
-def test_get_db_connection_resolves_dev_path():
+def test_get_db_connection_resolves_dev_path(monkeypatch):
     """Test that get_db_connection uses dev path in DEV mode"""
-    import os
-    os.environ["DEPLOYMENT_MODE"] = "DEV"
+    monkeypatch.setenv("DEPLOYMENT_MODE", "DEV")
 
     # This should automatically resolve to dev database
     # We're just testing the path logic, not actually creating DB
@@ -122,5 +128,3 @@ def test_get_db_connection_resolves_dev_path():
     dev_path = resolve_db_path(prod_path)
 
     assert dev_path == "data/trading_dev.db"
-
-    os.environ["DEPLOYMENT_MODE"] = "PROD"
@@ -1,9 +1,9 @@
 """Unit tests for tools/general_tools.py"""
 import pytest
-import os
 import json
 import tempfile
 from pathlib import Path
+from types import SimpleNamespace
 from tools.general_tools import (
     get_config_value,
     write_config_value,
@@ -14,32 +14,22 @@ from tools.general_tools import (
 
 
 @pytest.fixture
-def temp_runtime_env(tmp_path):
+def temp_runtime_env(tmp_path, monkeypatch):
     """Create temporary runtime environment file."""
     env_file = tmp_path / "runtime_env.json"
-    original_path = os.environ.get("RUNTIME_ENV_PATH")
-
-    os.environ["RUNTIME_ENV_PATH"] = str(env_file)
-
-    yield env_file
-
-    # Cleanup
-    if original_path:
-        os.environ["RUNTIME_ENV_PATH"] = original_path
-    else:
-        os.environ.pop("RUNTIME_ENV_PATH", None)
+    monkeypatch.setenv("RUNTIME_ENV_PATH", str(env_file))
+    return env_file
 
 
 @pytest.mark.unit
 class TestConfigManagement:
     """Test configuration value reading and writing."""
 
-    def test_get_config_value_from_env(self):
+    def test_get_config_value_from_env(self, monkeypatch):
         """Should read from environment variables."""
-        os.environ["TEST_KEY"] = "test_value"
+        monkeypatch.setenv("TEST_KEY", "test_value")
         result = get_config_value("TEST_KEY")
         assert result == "test_value"
-        os.environ.pop("TEST_KEY")
 
     def test_get_config_value_default(self):
         """Should return default when key not found."""
@@ -52,15 +42,53 @@ class TestConfigManagement:
         result = get_config_value("RUNTIME_KEY")
         assert result == "runtime_value"
 
-    def test_get_config_value_runtime_overrides_env(self, temp_runtime_env):
+    def test_get_config_value_runtime_overrides_env(self, temp_runtime_env, monkeypatch):
         """Runtime env should override environment variables."""
-        os.environ["OVERRIDE_KEY"] = "env_value"
+        monkeypatch.setenv("OVERRIDE_KEY", "env_value")
         temp_runtime_env.write_text('{"OVERRIDE_KEY": "runtime_value"}')
 
         result = get_config_value("OVERRIDE_KEY")
         assert result == "runtime_value"
 
-        os.environ.pop("OVERRIDE_KEY")
+    def test_get_config_value_runtime_null_overrides_env(self, temp_runtime_env, monkeypatch):
+        """An explicit null in the runtime env file still wins over the environment."""
+        monkeypatch.setenv("NULL_KEY", "env_value")
+        temp_runtime_env.write_text('{"NULL_KEY": null}')
+
+        assert get_config_value("NULL_KEY", "default") is None
+
+    def test_get_config_value_sees_rewritten_file(self, temp_runtime_env):
+        """Cached runtime env should be refreshed after the file changes."""
+        temp_runtime_env.write_text('{"CACHED_KEY": "first"}')
+        assert get_config_value("CACHED_KEY") == "first"
+
+        temp_runtime_env.write_text('{"CACHED_KEY": "second-value"}')
+        assert get_config_value("CACHED_KEY") == "second-value"
+
+        write_config_value("CACHED_KEY", "third")
+        assert get_config_value("CACHED_KEY") == "third"
+
+    def test_get_config_value_sees_file_written_after_miss(self, temp_runtime_env):
+        """A cached missing-file lookup must not hide a later write_config_value."""
+        assert get_config_value("LATE_KEY", "default") == "default"
+
+        write_config_value("LATE_KEY", "written")
+        assert get_config_value("LATE_KEY", "default") == "written"
+
+    def test_write_config_value_keeps_keys_of_file_created_after_miss(self, temp_runtime_env):
+        """A cached missing-file lookup must not make a write drop externally written keys."""
+        assert get_config_value("SIGNATURE") is None
+
+        with open(temp_runtime_env, "w") as f:
+            json.dump({"SIGNATURE": "gpt-5", "JOB_ID": "job-1", "TODAY_DATE": "2025-01-16"}, f)
+        write_config_value("TRADING_DAY_ID", 7)
+
+        assert json.loads(temp_runtime_env.read_text()) == {
+            "SIGNATURE": "gpt-5",
+            "JOB_ID": "job-1",
+            "TODAY_DATE": "2025-01-16",
+            "TRADING_DAY_ID": 7,
+        }
 
     def test_write_config_value_creates_file(self, temp_runtime_env):
         """Should create runtime env file if it doesn't exist."""
@@ -81,9 +109,24 @@ class TestConfigManagement:
         assert data["EXISTING"] == "new"
         assert data["ANOTHER"] == "value"
 
-    def test_write_config_value_no_path_set(self, capsys):
+    def test_write_config_value_matches_stdlib_fallback(self, temp_runtime_env, monkeypatch):
+        """orjson and stdlib json should write the same file, non-str keys included."""
+        import tools.general_tools as general_tools
+
+        value = {1: "ünïcode", "nested": [1, 2]}
+        write_config_value("MAPPING", value)
+        fast = temp_runtime_env.read_bytes()
+
+        temp_runtime_env.unlink()
+        monkeypatch.setattr(general_tools, "orjson", None)
+        write_config_value("MAPPING", value)
+
+        assert temp_runtime_env.read_bytes() == fast
+        assert json.loads(fast)["MAPPING"]["1"] == "ünïcode"
+
+    def test_write_config_value_no_path_set(self, capsys, monkeypatch):
         """Should warn when RUNTIME_ENV_PATH not set."""
-        os.environ.pop("RUNTIME_ENV_PATH", None)
+        monkeypatch.delenv("RUNTIME_ENV_PATH", raising=False)
 
         write_config_value("TEST", "value")
 
@@ -96,59 +139,41 @@ class TestConfigManagement:
 class TestExtractConversation:
     """Test conversation extraction functions."""
 
-    def test_extract_conversation_final_with_stop(self):
-        """Should extract final message with finish_reason='stop'."""
-        conversation = {
-            "messages": [
+    @pytest.mark.parametrize("conversation,output_type,expected", [
+        pytest.param(
+            {"messages": [
                 {"content": "Hello", "response_metadata": {"finish_reason": "stop"}},
                 {"content": "World", "response_metadata": {"finish_reason": "stop"}}
-            ]
-        }
-
-        result = extract_conversation(conversation, "final")
-        assert result == "World"
-
-    def test_extract_conversation_final_fallback(self):
-        """Should fallback to last non-tool message."""
-        conversation = {
-            "messages": [
+            ]},
+            "final", "World",
+            id="final_with_stop"
+        ),
+        pytest.param(
+            {"messages": [
                 {"content": "First message"},
                 {"content": "Second message"},
                 {"content": "", "additional_kwargs": {"tool_calls": [{"name": "tool"}]}}
-            ]
-        }
-
-        result = extract_conversation(conversation, "final")
-        assert result == "Second message"
-
-    def test_extract_conversation_final_no_messages(self):
-        """Should return None when no suitable messages."""
-        conversation = {"messages": []}
-
-        result = extract_conversation(conversation, "final")
-        assert result is None
-
-    def test_extract_conversation_final_only_tool_calls(self):
-        """Should return None when only tool calls exist."""
-        conversation = {
-            "messages": [
-                {"content": "tool result", "tool_call_id": "123"}
-            ]
-        }
-
-        result = extract_conversation(conversation, "final")
-        assert result is None
-
-    def test_extract_conversation_all(self):
-        """Should return all messages."""
-        messages = [
-            {"content": "Message 1"},
-            {"content": "Message 2"}
-        ]
-        conversation = {"messages": messages}
-
-        result = extract_conversation(conversation, "all")
-        assert result == messages
+            ]},
+            "final", "Second message",
+            id="final_fallback_to_last_non_tool_message"
+        ),
+        pytest.param({"messages": []}, "final", None, id="final_no_messages"),
+        pytest.param(
+            {"messages": [{"content": "tool result", "tool_call_id": "123"}]},
+            "final", None,
+            id="final_only_tool_calls"
+        ),
+        pytest.param(
+            {"messages": [{"content": "Message 1"}, {"content": "Message 2"}]},
+            "all", [{"content": "Message 1"}, {"content": "Message 2"}],
+            id="all_messages"
+        ),
+        pytest.param({}, "all", [], id="all_missing_messages"),
+        pytest.param({}, "final", None, id="final_missing_messages"),
+    ])
+    def test_extract_conversation(self, conversation, output_type, expected):
+        """Should extract the final answer or all messages for each payload shape."""
+        assert extract_conversation(conversation, output_type) == expected
 
     def test_extract_conversation_invalid_type(self):
         """Should raise ValueError for invalid output_type."""
@@ -157,16 +182,6 @@ class TestExtractConversation:
         with pytest.raises(ValueError, match="output_type must be 'final' or 'all'"):
             extract_conversation(conversation, "invalid")
 
-    def test_extract_conversation_missing_messages(self):
-        """Should handle missing messages gracefully."""
-        conversation = {}
-
-        result = extract_conversation(conversation, "all")
-        assert result == []
-
-        result = extract_conversation(conversation, "final")
-        assert result is None
-
 
 @pytest.mark.unit
 class TestExtractToolMessages:
@@ -233,15 +248,10 @@ class TestExtractToolMessages:
 
     def test_extract_tool_messages_object_based(self):
         """Should work with object-based messages."""
-        class Message:
-            def __init__(self, content, tool_call_id=None):
-                self.content = content
-                self.tool_call_id = tool_call_id
-
         conversation = {
             "messages": [
-                Message("Regular"),
-                Message("Tool result", tool_call_id="abc123")
+                SimpleNamespace(content="Regular", tool_call_id=None),
+                SimpleNamespace(content="Tool result", tool_call_id="abc123")
             ]
         }
 
@@ -278,33 +288,21 @@ class TestEdgeCases:
         data = json.loads(temp_runtime_env.read_text())
         assert data["SPECIAL"] == "value with 日本語 and émojis 🎉"
 
-    def test_write_config_value_invalid_path(self, capsys):
+    def test_write_config_value_invalid_path(self, capsys, monkeypatch):
         """Should handle write errors gracefully."""
-        os.environ["RUNTIME_ENV_PATH"] = "/invalid/nonexistent/path/config.json"
+        monkeypatch.setenv("RUNTIME_ENV_PATH", "/invalid/nonexistent/path/config.json")
 
         write_config_value("TEST", "value")
 
         captured = capsys.readouterr()
         assert "Error writing config" in captured.out
 
-        # Cleanup
-        os.environ.pop("RUNTIME_ENV_PATH", None)
-
     def test_extract_conversation_with_object_messages(self):
         """Should work with object-based messages (not just dicts)."""
-        class Message:
-            def __init__(self, content, response_metadata=None):
-                self.content = content
-                self.response_metadata = response_metadata or {}
-
-        class ResponseMetadata:
-            def __init__(self, finish_reason):
-                self.finish_reason = finish_reason
-
         conversation = {
             "messages": [
-                Message("First", ResponseMetadata("stop")),
-                Message("Second", ResponseMetadata("stop"))
+                SimpleNamespace(content="First", response_metadata=SimpleNamespace(finish_reason="stop")),
+                SimpleNamespace(content="Second", response_metadata=SimpleNamespace(finish_reason="stop"))
             ]
         }
 
@@ -313,14 +311,9 @@ class TestEdgeCases:
 
     def test_extract_first_tool_message_content_with_object(self):
         """Should extract content from object-based tool messages."""
-        class ToolMessage:
-            def __init__(self, content):
-                self.content = content
-                self.tool_call_id = "test123"
-
         conversation = {
             "messages": [
-                ToolMessage("Tool output")
+                SimpleNamespace(content="Tool output", tool_call_id="test123")
             ]
         }
 
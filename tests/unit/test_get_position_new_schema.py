@@ -2,25 +2,29 @@
 
 import pytest
 from agent_tools.tool_trade import get_current_position_from_db
-from api.database import Database
 
+# Every test reads positions through tool_trade's (patched) db connection
+pytestmark = pytest.mark.usefixtures("patched_trade_db")
 
-def test_get_position_from_new_schema():
-    """Test position retrieval from trading_days + holdings (previous day)."""
 
-    # Create test database
-    db = Database(":memory:")
+def _assert_position(expected_position, expected_action_id, **query_kwargs):
+    """Query get_current_position_from_db and compare the full result."""
+    position, action_id = get_current_position_from_db(**query_kwargs)
+
+    assert position == expected_position
+    assert action_id == expected_action_id
 
-    # Create prerequisite: jobs record
-    db.connection.execute("""
-        INSERT INTO jobs (job_id, config_path, status, date_range, models, created_at)
-        VALUES ('test-job-123', 'test_config.json', 'running', '2025-01-14 to 2025-01-16', 'test-model', '2025-01-14T10:00:00Z')
-    """)
-    db.connection.commit()
+
+@pytest.mark.parametrize("query_date", [
+    "2025-01-16",  # next calendar day
+    "2025-01-20",  # after a weekend gap
+])
+def test_get_position_from_new_schema(db, job_row, query_date):
+    """Test position retrieval from trading_days + holdings (previous day)."""
 
     # Create trading_day with holdings for 2025-01-15
     trading_day_id = db.create_trading_day(
-        job_id='test-job-123',
+        job_id=job_row,
         model='test-model',
         date='2025-01-15',
         starting_cash=10000.0,
@@ -33,90 +37,33 @@ def test_get_position_from_new_schema():
     )
 
     # Add ending holdings for 2025-01-15
-    db.create_holding(trading_day_id, 'AAPL', 10)
-    db.create_holding(trading_day_id, 'MSFT', 5)
-
-    db.connection.commit()
-
-    # Mock get_db_connection to return our test db
-    import agent_tools.tool_trade as trade_module
-    original_get_db_connection = trade_module.get_db_connection
-
-    def mock_get_db_connection(path):
-        return db.connection
-
-    trade_module.get_db_connection = mock_get_db_connection
-
-    try:
-        # Query position for NEXT day (2025-01-16)
-        # Should retrieve previous day's (2025-01-15) ending position
-        position, action_id = get_current_position_from_db(
-            job_id='test-job-123',
-            model='test-model',
-            date='2025-01-16'  # Query for day AFTER the trading_day record
-        )
+    db.create_holdings_bulk(trading_day_id, [('AAPL', 10), ('MSFT', 5)])
 
-        # Verify we got the previous day's ending position
-        assert position['AAPL'] == 10, f"Expected 10 AAPL but got {position.get('AAPL', 0)}"
-        assert position['MSFT'] == 5, f"Expected 5 MSFT but got {position.get('MSFT', 0)}"
-        assert position['CASH'] == 8000.0, f"Expected cash $8000 but got ${position['CASH']}"
-        assert action_id == 2, f"Expected 2 holdings but got {action_id}"
-    finally:
-        # Restore original function
-        trade_module.get_db_connection = original_get_db_connection
-        db.connection.close()
+    # Query position for a LATER day
+    # Should retrieve the most recent previous day's (2025-01-15) ending position
+    _assert_position(
+        {'CASH': 8000.0, 'AAPL': 10, 'MSFT': 5}, 2,
+        job_id=job_row, model='test-model', date=query_date
+    )
 
 
-def test_get_position_first_day():
+def test_get_position_first_day(db, job_row):
     """Test position retrieval on first day (no prior data)."""
 
-    db = Database(":memory:")
-
-    # Mock get_db_connection to return our test db
-    import agent_tools.tool_trade as trade_module
-    original_get_db_connection = trade_module.get_db_connection
-
-    def mock_get_db_connection(path):
-        return db.connection
-
-    trade_module.get_db_connection = mock_get_db_connection
+    # No data exists: initial position with the default initial cash
+    _assert_position({'CASH': 10000.0}, 0, job_id=job_row, model='test-model', date='2025-01-15')
 
-    try:
-        # Query position (no data exists)
-        position, action_id = get_current_position_from_db(
-            job_id='test-job-123',
-            model='test-model',
-            date='2025-01-15'
-        )
 
-        # Should return initial position
-        assert position['CASH'] == 10000.0  # Default initial cash
-        assert action_id == 0
-    finally:
-        # Restore original function
-        trade_module.get_db_connection = original_get_db_connection
-        db.connection.close()
-
-
-def test_get_position_retrieves_previous_day_not_current():
+def test_get_position_retrieves_previous_day_not_current(db, job_row):
     """Test that get_current_position_from_db queries PREVIOUS day's ending, not current day.
 
     This is the critical fix: when querying for day 2's starting position,
     it should return day 1's ending position, NOT day 2's (incomplete) position.
     """
 
-    db = Database(":memory:")
-
-    # Create prerequisite: jobs record
-    db.connection.execute("""
-        INSERT INTO jobs (job_id, config_path, status, date_range, models, created_at)
-        VALUES ('test-job-123', 'test_config.json', 'running', '2025-10-01 to 2025-10-03', 'gpt-5', '2025-10-01T10:00:00Z')
-    """)
-    db.connection.commit()
-
     # Day 1: Create complete trading day with holdings
     day1_id = db.create_trading_day(
-        job_id='test-job-123',
+        job_id=job_row,
         model='gpt-5',
         date='2025-10-02',
         starting_cash=10000.0,
@@ -129,18 +76,21 @@ def test_get_position_retrieves_previous_day_not_current():
     )
 
     # Day 1 ending holdings (7 AMZN, 5 GOOGL, 6 MU, 3 QCOM, 4 MSFT, 1 CRWD, 10 NVDA, 3 AVGO)
-    db.create_holding(day1_id, 'AMZN', 7)
-    db.create_holding(day1_id, 'GOOGL', 5)
-    db.create_holding(day1_id, 'MU', 6)
-    db.create_holding(day1_id, 'QCOM', 3)
-    db.create_holding(day1_id, 'MSFT', 4)
-    db.create_holding(day1_id, 'CRWD', 1)
-    db.create_holding(day1_id, 'NVDA', 10)
-    db.create_holding(day1_id, 'AVGO', 3)
+    day1_holdings = [
+        ('AMZN', 7),
+        ('GOOGL', 5),
+        ('MU', 6),
+        ('QCOM', 3),
+        ('MSFT', 4),
+        ('CRWD', 1),
+        ('NVDA', 10),
+        ('AVGO', 3),
+    ]
+    db.create_holdings_bulk(day1_id, day1_holdings)
 
     # Day 2: Create incomplete trading day (just started, no holdings yet)
     day2_id = db.create_trading_day(
-        job_id='test-job-123',
+        job_id=job_row,
         model='gpt-5',
         date='2025-10-03',
         starting_cash=2500.0,  # From day 1 ending
@@ -153,42 +103,34 @@ def test_get_position_retrieves_previous_day_not_current():
     )
     # NOTE: No holdings created for day 2 yet (trading in progress)
 
-    db.connection.commit()
-
-    # Mock get_db_connection to return our test db
-    import agent_tools.tool_trade as trade_module
-    original_get_db_connection = trade_module.get_db_connection
-
-    def mock_get_db_connection(path):
-        return db.connection
-
-    trade_module.get_db_connection = mock_get_db_connection
-
-    try:
-        # Query starting position for day 2 (2025-10-03)
-        # This should return day 1's ending position, NOT day 2's incomplete position
-        position, action_id = get_current_position_from_db(
-            job_id='test-job-123',
-            model='gpt-5',
-            date='2025-10-03'
-        )
-
-        # Verify we got day 1's ending position (8 holdings)
-        assert position['CASH'] == 2500.0, f"Expected cash $2500 but got ${position['CASH']}"
-        assert position['AMZN'] == 7, f"Expected 7 AMZN but got {position.get('AMZN', 0)}"
-        assert position['GOOGL'] == 5, f"Expected 5 GOOGL but got {position.get('GOOGL', 0)}"
-        assert position['MU'] == 6, f"Expected 6 MU but got {position.get('MU', 0)}"
-        assert position['QCOM'] == 3, f"Expected 3 QCOM but got {position.get('QCOM', 0)}"
-        assert position['MSFT'] == 4, f"Expected 4 MSFT but got {position.get('MSFT', 0)}"
-        assert position['CRWD'] == 1, f"Expected 1 CRWD but got {position.get('CRWD', 0)}"
-        assert position['NVDA'] == 10, f"Expected 10 NVDA but got {position.get('NVDA', 0)}"
-        assert position['AVGO'] == 3, f"Expected 3 AVGO but got {position.get('AVGO', 0)}"
-        assert action_id == 8, f"Expected 8 holdings but got {action_id}"
-
-        # Verify total holdings count (should NOT include day 2's empty holdings)
-        assert len(position) == 9, f"Expected 9 items (8 stocks + CASH) but got {len(position)}"
-
-    finally:
-        # Restore original function
-        trade_module.get_db_connection = original_get_db_connection
-        db.connection.close()
+    # Query starting position for day 2 (2025-10-03)
+    # This should return day 1's ending position, NOT day 2's incomplete position
+    # Exactly day 1's 8 holdings plus CASH (day 2 has no holdings yet)
+    _assert_position(
+        {'CASH': 2500.0, **dict(day1_holdings)}, 8,
+        job_id=job_row, model='gpt-5', date='2025-10-03'
+    )
+
+
+def test_rollback_on_pooled_connection_keeps_test_savepoint(db, job_row):
+    """tool_trade's error-path rollback() must undo the test's writes, not end its savepoint."""
+    trading_day_id = db.create_trading_day(
+        job_id=job_row,
+        model='test-model',
+        date='2025-01-15',
+        starting_cash=10000.0,
+        starting_portfolio_value=10000.0,
+        daily_profit=0.0,
+        daily_return_pct=0.0,
+        ending_cash=8000.0,
+        ending_portfolio_value=9500.0,
+        days_since_last_trading=0
+    )
+
+    db.connection.rollback()
+
+    assert db.connection.execute(
+        "SELECT 1 FROM trading_days WHERE id = ?", (trading_day_id,)
+    ).fetchone() is None
+    # The savepoint survives, so the db fixture teardown can still roll back to it
+    db.connection.execute("ROLLBACK TO test")
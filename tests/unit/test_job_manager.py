@@ -16,17 +16,24 @@ import pytest
 import json
 from datetime import datetime, timedelta
 from api.database import db_connection
+from api.job_manager import JobManager
+
+# Job databases here are throwaway: skip fsyncs on every status update
+pytestmark = pytest.mark.usefixtures("fast_db_connections")
+
+
+@pytest.fixture
+def manager(clean_db):
+    """JobManager bound to the per-test clean database."""
+    return JobManager(db_path=clean_db)
 
 
 @pytest.mark.unit
 class TestJobCreation:
     """Test job creation and validation."""
 
-    def test_create_job_success(self, clean_db):
+    def test_create_job_success(self, manager):
         """Should create job with pending status."""
-        from api.job_manager import JobManager
-
-        manager = JobManager(db_path=clean_db)
         job_result = manager.create_job(
             config_path="configs/test.json",
             date_range=["2025-01-16", "2025-01-17"],
@@ -41,11 +48,8 @@ class TestJobCreation:
         assert job["models"] == ["gpt-5", "claude-3.7-sonnet"]
         assert job["created_at"] is not None
 
-    def test_create_job_with_job_details(self, clean_db):
+    def test_create_job_with_job_details(self, manager):
         """Should create job_details for each model-day."""
-        from api.job_manager import JobManager
-
-        manager = JobManager(db_path=clean_db)
         job_result = manager.create_job(
             config_path="configs/test.json",
             date_range=["2025-01-16", "2025-01-17"],
@@ -58,11 +62,8 @@ class TestJobCreation:
         assert progress["completed"] == 0
         assert progress["failed"] == 0
 
-    def test_create_job_blocks_concurrent(self, clean_db):
+    def test_create_job_blocks_concurrent(self, manager):
         """Should prevent creating second job while first is pending."""
-        from api.job_manager import JobManager
-
-        manager = JobManager(db_path=clean_db)
         job1_result = manager.create_job(
             "configs/test.json",
             ["2025-01-16"],
@@ -77,11 +78,8 @@ class TestJobCreation:
                 ["gpt-5"]
             )
 
-    def test_create_job_after_completion(self, clean_db):
+    def test_create_job_after_completion(self, manager):
         """Should allow new job after previous completes."""
-        from api.job_manager import JobManager
-
-        manager = JobManager(db_path=clean_db)
         job1_result = manager.create_job(
             "configs/test.json",
             ["2025-01-16"],
@@ -105,11 +103,8 @@ class TestJobCreation:
 class TestJobStatusTransitions:
     """Test job status state machine."""
 
-    def test_pending_to_running(self, clean_db):
+    def test_pending_to_running(self, manager):
         """Should transition from pending to running."""
-        from api.job_manager import JobManager
-
-        manager = JobManager(db_path=clean_db)
         job_result = manager.create_job(
             "configs/test.json",
             ["2025-01-16"],
@@ -124,11 +119,8 @@ class TestJobStatusTransitions:
         assert job["status"] == "running"
         assert job["started_at"] is not None
 
-    def test_running_to_completed(self, clean_db):
+    def test_running_to_completed(self, manager):
         """Should transition to completed when all details complete."""
-        from api.job_manager import JobManager
-
-        manager = JobManager(db_path=clean_db)
         job_result = manager.create_job(
             "configs/test.json",
             ["2025-01-16"],
@@ -144,11 +136,8 @@ class TestJobStatusTransitions:
         assert job["completed_at"] is not None
         assert job["total_duration_seconds"] is not None
 
-    def test_partial_completion(self, clean_db):
+    def test_partial_completion(self, manager):
         """Should mark as partial when some models fail."""
-        from api.job_manager import JobManager
-
-        manager = JobManager(db_path=clean_db)
         job_result = manager.create_job(
             "configs/test.json",
             ["2025-01-16"],
@@ -174,24 +163,54 @@ class TestJobStatusTransitions:
         assert progress["completed"] == 1
         assert progress["failed"] == 1
 
+    def test_update_job_detail_status_many(self, manager):
+        """Should apply a batch of detail updates and finalize the job once."""
+        job_result = manager.create_job(
+            "configs/test.json",
+            ["2025-01-16", "2025-01-17"],
+            ["gpt-5", "claude-3.7-sonnet"]
+        )
+        job_id = job_result["job_id"]
+
+        manager.update_job_detail_status_many(job_id, [
+            ("2025-01-16", "gpt-5", "running", None),
+            ("2025-01-16", "claude-3.7-sonnet", "running", None),
+        ])
+        assert manager.get_job(job_id)["status"] == "running"
+
+        manager.update_job_detail_status_many(job_id, [
+            ("2025-01-16", "gpt-5", "completed", None),
+            ("2025-01-16", "claude-3.7-sonnet", "failed", "API timeout"),
+            ("2025-01-17", "gpt-5", "completed", None),
+        ])
+        assert manager.get_job(job_id)["status"] == "running"
+
+        manager.update_job_detail_status_many(job_id, [
+            ("2025-01-17", "claude-3.7-sonnet", "skipped", None),
+        ])
+
+        job = manager.get_job(job_id)
+        assert job["status"] == "partial"
+        assert job["total_duration_seconds"] is not None
+
+        details = {(d["date"], d["model"]): d for d in manager.get_job_details(job_id)}
+        assert details[("2025-01-16", "claude-3.7-sonnet")]["error"] == "API timeout"
+        assert details[("2025-01-16", "gpt-5")]["duration_seconds"] is not None
+        # Never started, so no duration
+        assert details[("2025-01-17", "gpt-5")]["duration_seconds"] is None
+
 
 @pytest.mark.unit
 class TestJobRetrieval:
     """Test job query operations."""
 
-    def test_get_nonexistent_job(self, clean_db):
+    def test_get_nonexistent_job(self, manager):
         """Should return None for nonexistent job."""
-        from api.job_manager import JobManager
-
-        manager = JobManager(db_path=clean_db)
         job = manager.get_job("nonexistent-id")
         assert job is None
 
-    def test_get_current_job(self, clean_db):
+    def test_get_current_job(self, manager):
         """Should return most recent job."""
-        from api.job_manager import JobManager
-
-        manager = JobManager(db_path=clean_db)
         job1_result = manager.create_job("configs/test.json", ["2025-01-16"], ["gpt-5"])
         job1_id = job1_result["job_id"]
         manager.update_job_status(job1_id, "completed")
@@ -202,19 +221,13 @@ class TestJobRetrieval:
         current = manager.get_current_job()
         assert current["job_id"] == job2_id
 
-    def test_get_current_job_empty(self, clean_db):
+    def test_get_current_job_empty(self, manager):
         """Should return None when no jobs exist."""
-        from api.job_manager import JobManager
-
-        manager = JobManager(db_path=clean_db)
         current = manager.get_current_job()
         assert current is None
 
-    def test_find_job_by_date_range(self, clean_db):
+    def test_find_job_by_date_range(self, manager):
         """Should find existing job with same date range."""
-        from api.job_manager import JobManager
-
-        manager = JobManager(db_path=clean_db)
         job_result = manager.create_job(
             "configs/test.json",
             ["2025-01-16", "2025-01-17"],
@@ -225,11 +238,8 @@ class TestJobRetrieval:
         found = manager.find_job_by_date_range(["2025-01-16", "2025-01-17"])
         assert found["job_id"] == job_id
 
-    def test_find_job_by_date_range_not_found(self, clean_db):
+    def test_find_job_by_date_range_not_found(self, manager):
         """Should return None when no matching job exists."""
-        from api.job_manager import JobManager
-
-        manager = JobManager(db_path=clean_db)
         manager.create_job(
             "configs/test.json",
             ["2025-01-16"],
@@ -240,15 +250,35 @@ class TestJobRetrieval:
         assert found is None
 
 
+    def test_find_job_by_date_range_skips_malformed_rows(self, manager, clean_db):
+        """A non-JSON date_range in another row should not break the lookup."""
+        job_result = manager.create_job(
+            "configs/test.json",
+            ["2025-01-16", "2025-01-17"],
+            ["gpt-5"]
+        )
+
+        with db_connection(clean_db) as conn:
+            conn.execute(
+                """
+                INSERT INTO jobs (job_id, config_path, status, date_range, models, created_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                ("legacy-job", "configs/test.json", "completed", "2025-01-14 to 2025-01-16",
+                 '["gpt-5"]', "2025-01-14T10:00:00Z")
+            )
+            conn.commit()
+
+        found = manager.find_job_by_date_range(["2025-01-16", "2025-01-17"])
+        assert found["job_id"] == job_result["job_id"]
+        assert manager.find_job_by_date_range(["2025-01-20"]) is None
+
 @pytest.mark.unit
 class TestJobProgress:
     """Test job progress tracking."""
 
-    def test_progress_all_pending(self, clean_db):
+    def test_progress_all_pending(self, manager):
         """Should show 0 completed when all pending."""
-        from api.job_manager import JobManager
-
-        manager = JobManager(db_path=clean_db)
         job_result = manager.create_job(
             "configs/test.json",
             ["2025-01-16", "2025-01-17"],
@@ -262,11 +292,8 @@ class TestJobProgress:
         assert progress["failed"] == 0
         assert progress["current"] is None
 
-    def test_progress_with_running(self, clean_db):
+    def test_progress_with_running(self, manager):
         """Should identify currently running model-day."""
-        from api.job_manager import JobManager
-
-        manager = JobManager(db_path=clean_db)
         job_result = manager.create_job(
             "configs/test.json",
             ["2025-01-16"],
@@ -279,11 +306,8 @@ class TestJobProgress:
         progress = manager.get_job_progress(job_id)
         assert progress["current"] == {"date": "2025-01-16", "model": "gpt-5"}
 
-    def test_progress_details(self, clean_db):
+    def test_progress_details(self, manager):
         """Should return detailed progress for all model-days."""
-        from api.job_manager import JobManager
-
-        manager = JobManager(db_path=clean_db)
         job_result = manager.create_job(
             "configs/test.json",
             ["2025-01-16"],
@@ -296,58 +320,88 @@ class TestJobProgress:
         progress = manager.get_job_progress(job_id)
         assert len(progress["details"]) == 2
 
-        # Find the gpt-5 detail (order may vary)
-        gpt5_detail = next(d for d in progress["details"] if d["model"] == "gpt-5")
+        gpt5_detail = progress["details_by_key"][("2025-01-16", "gpt-5")]
         assert gpt5_detail["status"] == "completed"
+        assert progress["details_by_key"][("2025-01-16", "claude-3.7-sonnet")]["status"] == "pending"
+
+    def test_progress_summary_matches_progress_without_details(self, manager):
+        """Summary should carry the same counts and current model-day, minus details."""
+        job_result = manager.create_job(
+            "configs/test.json",
+            ["2025-01-16", "2025-01-17"],
+            ["gpt-5", "claude-3.7-sonnet"]
+        )
+        job_id = job_result["job_id"]
+
+        manager.update_job_detail_status(job_id, "2025-01-16", "gpt-5", "completed")
+        manager.update_job_detail_status(job_id, "2025-01-16", "claude-3.7-sonnet", "failed")
+        manager.update_job_detail_status(job_id, "2025-01-17", "gpt-5", "running")
+
+        summary = manager.get_job_progress_summary(job_id)
+        progress = manager.get_job_progress(job_id)
+
+        assert "details" not in summary
+        assert summary == {
+            k: v for k, v in progress.items() if k not in ("details", "details_by_key")
+        }
+        assert summary == {
+            "total_model_days": 4,
+            "completed": 1,
+            "failed": 1,
+            "pending": 1,
+            "skipped": 0,
+            "current": {"date": "2025-01-17", "model": "gpt-5"}
+        }
+
+    def test_progress_current_is_earliest_running_model_day(self, manager):
+        """With several model-days running, both progress views report the earliest one."""
+        job_id = manager.create_job(
+            "configs/test.json",
+            ["2025-01-16", "2025-01-17"],
+            ["gpt-5", "claude-3.7-sonnet"]
+        )["job_id"]
+
+        manager.update_job_detail_status(job_id, "2025-01-17", "gpt-5", "running")
+        manager.update_job_detail_status(job_id, "2025-01-16", "gpt-5", "running")
+        manager.update_job_detail_status(job_id, "2025-01-16", "claude-3.7-sonnet", "running")
+
+        expected = {"date": "2025-01-16", "model": "claude-3.7-sonnet"}
+        assert manager.get_job_progress_summary(job_id)["current"] == expected
+        assert manager.get_job_progress(job_id)["current"] == expected
 
 
 @pytest.mark.unit
 class TestConcurrencyControl:
     """Test concurrency control mechanisms."""
 
-    def test_can_start_new_job_when_empty(self, clean_db):
+    def test_can_start_new_job_when_empty(self, manager):
         """Should allow job when none exist."""
-        from api.job_manager import JobManager
-
-        manager = JobManager(db_path=clean_db)
         assert manager.can_start_new_job() is True
 
-    def test_can_start_new_job_blocks_pending(self, clean_db):
+    def test_can_start_new_job_blocks_pending(self, manager):
         """Should block when job is pending."""
-        from api.job_manager import JobManager
-
-        manager = JobManager(db_path=clean_db)
         manager.create_job("configs/test.json", ["2025-01-16"], ["gpt-5"])
 
         assert manager.can_start_new_job() is False
 
-    def test_can_start_new_job_blocks_running(self, clean_db):
+    def test_can_start_new_job_blocks_running(self, manager):
         """Should block when job is running."""
-        from api.job_manager import JobManager
-
-        manager = JobManager(db_path=clean_db)
         job_result = manager.create_job("configs/test.json", ["2025-01-16"], ["gpt-5"])
         job_id = job_result["job_id"]
         manager.update_job_status(job_id, "running")
 
         assert manager.can_start_new_job() is False
 
-    def test_can_start_new_job_allows_after_completion(self, clean_db):
+    def test_can_start_new_job_allows_after_completion(self, manager):
         """Should allow new job after previous completes."""
-        from api.job_manager import JobManager
-
-        manager = JobManager(db_path=clean_db)
         job_result = manager.create_job("configs/test.json", ["2025-01-16"], ["gpt-5"])
         job_id = job_result["job_id"]
         manager.update_job_status(job_id, "completed")
 
         assert manager.can_start_new_job() is True
 
-    def test_get_running_jobs(self, clean_db):
+    def test_get_running_jobs(self, manager):
         """Should return all running/pending jobs."""
-        from api.job_manager import JobManager
-
-        manager = JobManager(db_path=clean_db)
         job1_result = manager.create_job("configs/test.json", ["2025-01-16"], ["gpt-5"])
         job1_id = job1_result["job_id"]
 
@@ -362,18 +416,50 @@ class TestConcurrencyControl:
         assert len(running) == 1
         assert running[0]["job_id"] == job2_id
 
+    def test_job_lookups_are_served_by_indexes(self, clean_db):
+        """The concurrency check should be index-only and the latest-job lookup index-ordered."""
+        from api.job_manager import _ACTIVE_JOB_QUERY, _CURRENT_JOB_QUERY
+
+        with db_connection(clean_db) as conn:
+            active_plan = " ".join(
+                row[3] for row in conn.execute("EXPLAIN QUERY PLAN " + _ACTIVE_JOB_QUERY)
+            )
+            current_plan = " ".join(
+                row[3] for row in conn.execute("EXPLAIN QUERY PLAN " + _CURRENT_JOB_QUERY)
+            )
+
+        assert "COVERING INDEX" in active_plan
+        assert "USING INDEX idx_jobs_created_at" in current_plan
+        assert "TEMP B-TREE" not in current_plan
+
+    def test_concurrent_detail_updates_are_serialized(self, clean_db, manager):
+        """Writers from separate JobManager instances and threads should not collide."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        dates = [f"2025-01-{day:02d}" for day in range(2, 10)]
+        job_id = manager.create_job("configs/test.json", dates, ["gpt-5"])["job_id"]
+
+        def run_model_day(date):
+            # Each worker gets its own JobManager, as executors do in production
+            worker_manager = JobManager(db_path=clean_db)
+            worker_manager.update_job_detail_status(job_id, date, "gpt-5", "running")
+            worker_manager.update_job_detail_status(job_id, date, "gpt-5", "completed")
+
+        with ThreadPoolExecutor(max_workers=len(dates)) as pool:
+            list(pool.map(run_model_day, dates))
+
+        assert manager.get_job(job_id)["status"] == "completed"
+        assert manager.get_job_progress_summary(job_id)["completed"] == len(dates)
+
 
 @pytest.mark.unit
 class TestJobCleanup:
     """Test maintenance operations."""
 
-    def test_cleanup_old_jobs(self, clean_db):
+    def test_cleanup_old_jobs(self, clean_db, manager):
         """Should delete jobs older than threshold."""
-        from api.job_manager import JobManager
         from api.database import get_db_connection
 
-        manager = JobManager(db_path=clean_db)
-
         # Create old job (manually set created_at)
         with db_connection(clean_db) as conn:
             cursor = conn.cursor()
@@ -383,6 +469,10 @@ class TestJobCleanup:
                 INSERT INTO jobs (job_id, config_path, status, date_range, models, created_at)
                 VALUES (?, ?, ?, ?, ?, ?)
             """, ("old-job", "configs/test.json", "completed", '["2025-01-01"]', '["gpt-5"]', old_date))
+            cursor.execute("""
+                INSERT INTO job_details (job_id, date, model, status)
+                VALUES (?, ?, ?, ?)
+            """, ("old-job", "2025-01-01", "gpt-5", "completed"))
             conn.commit()
 
         # Create recent job
@@ -394,6 +484,7 @@ class TestJobCleanup:
 
         assert cleanup_result["jobs_deleted"] == 1
         assert manager.get_job("old-job") is None
+        assert manager.get_job_details("old-job") == []
         assert manager.get_job(recent_id) is not None
 
 
@@ -401,11 +492,8 @@ class TestJobCleanup:
 class TestJobUpdateOperations:
     """Test job update methods."""
 
-    def test_update_job_status_with_error(self, clean_db):
+    def test_update_job_status_with_error(self, manager):
         """Should record error message when job fails."""
-        from api.job_manager import JobManager
-
-        manager = JobManager(db_path=clean_db)
         job_result = manager.create_job("configs/test.json", ["2025-01-16"], ["gpt-5"])
         job_id = job_result["job_id"]
 
@@ -415,12 +503,10 @@ class TestJobUpdateOperations:
         assert job["status"] == "failed"
         assert job["error"] == "MCP service unavailable"
 
-    def test_update_job_detail_records_duration(self, clean_db):
+    def test_update_job_detail_records_duration(self, manager):
         """Should calculate duration for completed model-days."""
-        from api.job_manager import JobManager
         import time
 
-        manager = JobManager(db_path=clean_db)
         job_result = manager.create_job("configs/test.json", ["2025-01-16"], ["gpt-5"])
         job_id = job_result["job_id"]
 
@@ -446,7 +532,6 @@ class TestJobWarnings:
 
     def test_add_job_warnings(self, clean_db):
         """Test adding warnings to a job."""
-        from api.job_manager import JobManager
         from api.database import initialize_database
 
         initialize_database(clean_db)
@@ -469,16 +554,23 @@ class TestJobWarnings:
         stored_warnings = json.loads(job["warnings"])
         assert stored_warnings == warnings
 
+    def test_add_job_warnings_appends(self, manager):
+        """Later warnings should be appended to the ones already stored."""
+        job_id = manager.create_job("config.json", ["2025-10-01"], ["gpt-5"])["job_id"]
+
+        manager.add_job_warnings(job_id, ["First"])
+        manager.add_job_warnings(job_id, ["Second", "Third"])
+
+        job = manager.get_job(job_id)
+        assert json.loads(job["warnings"]) == ["First", "Second", "Third"]
+
 
 @pytest.mark.unit
 class TestStaleJobCleanup:
     """Test cleanup of stale jobs from container restarts."""
 
-    def test_cleanup_stale_pending_job(self, clean_db):
+    def test_cleanup_stale_pending_job(self, manager):
         """Should mark pending job as failed with no progress."""
-        from api.job_manager import JobManager
-
-        manager = JobManager(db_path=clean_db)
         job_result = manager.create_job(
             config_path="configs/test.json",
             date_range=["2025-01-16", "2025-01-17"],
@@ -496,11 +588,8 @@ class TestStaleJobCleanup:
         assert "pending" in job["error"]
         assert "no progress" in job["error"]
 
-    def test_cleanup_stale_running_job_with_partial_progress(self, clean_db):
+    def test_cleanup_stale_running_job_with_partial_progress(self, manager):
         """Should mark running job as partial if some model-days completed."""
-        from api.job_manager import JobManager
-
-        manager = JobManager(db_path=clean_db)
         job_result = manager.create_job(
             config_path="configs/test.json",
             date_range=["2025-01-16", "2025-01-17"],
@@ -521,11 +610,8 @@ class TestStaleJobCleanup:
         assert "container restart" in job["error"].lower()
         assert "1/2" in job["error"]  # 1 out of 2 model-days completed
 
-    def test_cleanup_stale_downloading_data_job(self, clean_db):
+    def test_cleanup_stale_downloading_data_job(self, manager):
         """Should mark downloading_data job as failed."""
-        from api.job_manager import JobManager
-
-        manager = JobManager(db_path=clean_db)
         job_result = manager.create_job(
             config_path="configs/test.json",
             date_range=["2025-01-16"],
@@ -544,11 +630,8 @@ class TestStaleJobCleanup:
         assert job["status"] == "failed"
         assert "downloading_data" in job["error"]
 
-    def test_cleanup_marks_incomplete_job_details_as_failed(self, clean_db):
+    def test_cleanup_marks_incomplete_job_details_as_failed(self, manager):
         """Should mark incomplete job_details as failed."""
-        from api.job_manager import JobManager
-
-        manager = JobManager(db_path=clean_db)
         job_result = manager.create_job(
             config_path="configs/test.json",
             date_range=["2025-01-16", "2025-01-17"],
@@ -573,11 +656,8 @@ class TestStaleJobCleanup:
             assert detail["status"] == "failed"
             assert "container restarted" in detail["error"].lower()
 
-    def test_cleanup_no_stale_jobs(self, clean_db):
+    def test_cleanup_no_stale_jobs(self, manager):
         """Should report 0 cleaned jobs when none are stale."""
-        from api.job_manager import JobManager
-
-        manager = JobManager(db_path=clean_db)
         job_result = manager.create_job(
             config_path="configs/test.json",
             date_range=["2025-01-16"],
@@ -595,12 +675,8 @@ class TestStaleJobCleanup:
         job = manager.get_job(job_id)
         assert job["status"] == "completed"
 
-    def test_cleanup_multiple_stale_jobs(self, clean_db):
+    def test_cleanup_multiple_stale_jobs(self, manager):
         """Should clean up multiple stale jobs."""
-        from api.job_manager import JobManager
-
-        manager = JobManager(db_path=clean_db)
-
         # Create first job
         job1_result = manager.create_job(
             config_path="configs/test.json",
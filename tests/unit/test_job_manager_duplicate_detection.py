@@ -1,70 +1,21 @@
 """Test duplicate detection in job creation."""
 import pytest
-from api.database import db_connection
-import tempfile
-import os
-from pathlib import Path
 from api.job_manager import JobManager
 
+# Job databases here are throwaway: skip fsyncs on every status update
+pytestmark = pytest.mark.usefixtures("fast_db_connections")
 
-@pytest.fixture
-def temp_db():
-    """Create temporary database for testing."""
-    fd, path = tempfile.mkstemp(suffix='.db')
-    os.close(fd)
-
-    # Initialize schema
-    from api.database import get_db_connection
-    with db_connection(path) as conn:
-        cursor = conn.cursor()
-
-        # Create jobs table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS jobs (
-                job_id TEXT PRIMARY KEY,
-                config_path TEXT NOT NULL,
-                status TEXT NOT NULL,
-                date_range TEXT NOT NULL,
-                models TEXT NOT NULL,
-                created_at TEXT NOT NULL,
-                started_at TEXT,
-                updated_at TEXT,
-                completed_at TEXT,
-                total_duration_seconds REAL,
-                error TEXT,
-                warnings TEXT
-            )
-        """)
-
-        # Create job_details table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS job_details (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                job_id TEXT NOT NULL,
-                date TEXT NOT NULL,
-                model TEXT NOT NULL,
-                status TEXT NOT NULL,
-                started_at TEXT,
-                completed_at TEXT,
-                duration_seconds REAL,
-                error TEXT,
-                FOREIGN KEY (job_id) REFERENCES jobs(job_id) ON DELETE CASCADE,
-                UNIQUE(job_id, date, model)
-            )
-        """)
-
-        conn.commit()
-
-    yield path
-
-    # Cleanup
-    if os.path.exists(path):
-        os.remove(path)
-
-
-def test_create_job_with_filter_skips_completed_simulations(temp_db):
+
+def mark_completed_bulk(manager, job_id, pairs):
+    """Mark every (date, model) pair completed in a single write transaction."""
+    manager.update_job_detail_status_many(
+        job_id, [(date, model, "completed", None) for date, model in pairs]
+    )
+
+
+def test_create_job_with_filter_skips_completed_simulations(jobs_db):
     """Test that job creation with model_day_filter skips already-completed pairs."""
-    manager = JobManager(db_path=temp_db)
+    manager = JobManager(db_path=jobs_db)
 
     # Create first job and mark model-day as completed
     result_1 = manager.create_job(
@@ -106,9 +57,9 @@ def test_create_job_with_filter_skips_completed_simulations(temp_db):
     assert details[0]["model"] == "deepseek-chat-v3.1"
 
 
-def test_create_job_without_filter_skips_all_completed_simulations(temp_db):
+def test_create_job_without_filter_skips_all_completed_simulations(jobs_db):
     """Test that job creation without filter skips all completed model-day pairs."""
-    manager = JobManager(db_path=temp_db)
+    manager = JobManager(db_path=jobs_db)
 
     # Create first job and complete some model-days
     result_1 = manager.create_job(
@@ -147,9 +98,9 @@ def test_create_job_without_filter_skips_all_completed_simulations(temp_db):
     assert ("2025-10-16", "model-b") in dates_models
 
 
-def test_create_job_returns_warnings_for_skipped_simulations(temp_db):
+def test_create_job_returns_warnings_for_skipped_simulations(jobs_db):
     """Test that skipped simulations are returned as warnings."""
-    manager = JobManager(db_path=temp_db)
+    manager = JobManager(db_path=jobs_db)
 
     # Create and complete first simulation
     result_1 = manager.create_job(
@@ -181,9 +132,9 @@ def test_create_job_returns_warnings_for_skipped_simulations(temp_db):
     assert details[0]["date"] == "2025-10-16"
 
 
-def test_create_job_raises_error_when_all_simulations_completed(temp_db):
+def test_create_job_raises_error_when_all_simulations_completed(jobs_db):
     """Test that ValueError is raised when ALL requested simulations are already completed."""
-    manager = JobManager(db_path=temp_db)
+    manager = JobManager(db_path=jobs_db)
 
     # Create and complete first simulation
     result_1 = manager.create_job(
@@ -194,10 +145,11 @@ def test_create_job_raises_error_when_all_simulations_completed(temp_db):
     job_id_1 = result_1["job_id"]
 
     # Mark all model-days as completed
-    manager.update_job_detail_status(job_id_1, "2025-10-15", "model-a", "completed")
-    manager.update_job_detail_status(job_id_1, "2025-10-15", "model-b", "completed")
-    manager.update_job_detail_status(job_id_1, "2025-10-16", "model-a", "completed")
-    manager.update_job_detail_status(job_id_1, "2025-10-16", "model-b", "completed")
+    mark_completed_bulk(manager, job_id_1, [
+        (date, model)
+        for date in ("2025-10-15", "2025-10-16")
+        for model in ("model-a", "model-b")
+    ])
 
     # Try to create job with same date range and models (all already completed)
     with pytest.raises(ValueError) as exc_info:
@@ -213,9 +165,9 @@ def test_create_job_raises_error_when_all_simulations_completed(temp_db):
     assert "Skipped 4 model-day pair(s)" in error_message
 
 
-def test_create_job_with_skip_completed_false_includes_all_simulations(temp_db):
+def test_create_job_with_skip_completed_false_includes_all_simulations(jobs_db):
     """Test that skip_completed=False includes ALL simulations, even already-completed ones."""
-    manager = JobManager(db_path=temp_db)
+    manager = JobManager(db_path=jobs_db)
 
     # Create first job and complete some model-days
     result_1 = manager.create_job(
@@ -226,10 +178,11 @@ def test_create_job_with_skip_completed_false_includes_all_simulations(temp_db):
     job_id_1 = result_1["job_id"]
 
     # Mark all model-days as completed
-    manager.update_job_detail_status(job_id_1, "2025-10-15", "model-a", "completed")
-    manager.update_job_detail_status(job_id_1, "2025-10-15", "model-b", "completed")
-    manager.update_job_detail_status(job_id_1, "2025-10-16", "model-a", "completed")
-    manager.update_job_detail_status(job_id_1, "2025-10-16", "model-b", "completed")
+    mark_completed_bulk(manager, job_id_1, [
+        (date, model)
+        for date in ("2025-10-15", "2025-10-16")
+        for model in ("model-a", "model-b")
+    ])
 
     # Create second job with skip_completed=False
     result_2 = manager.create_job(
@@ -254,3 +207,38 @@ def test_create_job_with_skip_completed_false_includes_all_simulations(temp_db):
 
     # Verify no warnings were returned
     assert result_2.get("warnings") == []
+
+
+@pytest.mark.parametrize("chunk_size", [400, 1])
+def test_create_job_skips_only_exact_completed_pairs(jobs_db, monkeypatch, chunk_size):
+    """Test that completed (model, date) pairs are matched exactly, not per model or per date."""
+    monkeypatch.setattr("api.job_manager._PAIR_LOOKUP_CHUNK", chunk_size)
+    manager = JobManager(db_path=jobs_db)
+
+    result_1 = manager.create_job(
+        config_path="test_config.json",
+        date_range=["2025-10-15", "2025-10-16"],
+        models=["model-a", "model-b"]
+    )
+    job_id_1 = result_1["job_id"]
+
+    # Complete the diagonal only: model-a/15 and model-b/16
+    manager.update_job_detail_status_many(job_id_1, [
+        ("2025-10-15", "model-a", "completed", None),
+        ("2025-10-16", "model-b", "completed", None),
+        ("2025-10-15", "model-b", "failed", None),
+        ("2025-10-16", "model-a", "failed", None),
+    ])
+
+    result_2 = manager.create_job(
+        config_path="test_config.json",
+        date_range=["2025-10-15", "2025-10-16"],
+        models=["model-a", "model-b"]
+    )
+
+    details = manager.get_job_details(result_2["job_id"])
+    assert [(d["model"], d["date"]) for d in details] == [
+        ("model-b", "2025-10-15"),
+        ("model-a", "2025-10-16"),
+    ]
+    assert len(result_2["warnings"]) == 2
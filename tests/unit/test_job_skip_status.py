@@ -10,29 +10,17 @@ terminal states (completed/failed/skipped).
 """
 
 import pytest
-import tempfile
-from pathlib import Path
 
 from api.job_manager import JobManager
-from api.database import initialize_database
 
-
-@pytest.fixture
-def temp_db():
-    """Create temporary database for testing."""
-    with tempfile.NamedTemporaryFile(suffix='.db', delete=False) as f:
-        db_path = f.name
-
-    initialize_database(db_path)
-    yield db_path
-
-    Path(db_path).unlink(missing_ok=True)
+# Job databases here are throwaway: skip fsyncs on every status update
+pytestmark = pytest.mark.usefixtures("fast_db_connections")
 
 
 @pytest.fixture
-def job_manager(temp_db):
-    """Create JobManager with temporary database."""
-    return JobManager(db_path=temp_db)
+def job_manager(jobs_db):
+    """Create JobManager on a per-test clone of the jobs schema."""
+    return JobManager(db_path=jobs_db)
 
 
 class TestSkipStatusDatabase:
@@ -58,9 +46,9 @@ class TestSkipStatusDatabase:
         )
 
         # Verify status was set
-        details = job_manager.get_job_details(job_id)
+        details = job_manager.get_job_details_by_key(job_id)
         assert len(details) == 2
-        skipped_detail = next(d for d in details if d["date"] == "2025-10-01")
+        skipped_detail = details[("2025-10-01", "test-model")]
         assert skipped_detail["status"] == "skipped"
         assert skipped_detail["error"] == "Test skip reason"
 
@@ -79,14 +67,10 @@ class TestJobCompletionWithSkipped:
         job_id = job_result["job_id"]
 
         # Mark all as skipped
-        for date in ["2025-10-01", "2025-10-02", "2025-10-03"]:
-            job_manager.update_job_detail_status(
-                job_id=job_id,
-                date=date,
-                model="test-model",
-                status="skipped",
-                error="Incomplete price data"
-            )
+        job_manager.update_job_detail_status_many(job_id, [
+            (date, "test-model", "skipped", "Incomplete price data")
+            for date in ["2025-10-01", "2025-10-02", "2025-10-03"]
+        ])
 
         # Verify job completed
         job = job_manager.get_job(job_id)
@@ -219,11 +203,10 @@ class TestProgressTrackingWithSkipped:
         job_id = job_result["job_id"]
 
         # Mark all as skipped
-        for date in ["2025-10-01", "2025-10-02"]:
-            job_manager.update_job_detail_status(
-                job_id=job_id, date=date, model="test-model",
-                status="skipped", error="Incomplete price data"
-            )
+        job_manager.update_job_detail_status_many(job_id, [
+            (date, "test-model", "skipped", "Incomplete price data")
+            for date in ["2025-10-01", "2025-10-02"]
+        ])
 
         progress = job_manager.get_job_progress(job_id)
 
@@ -245,37 +228,20 @@ class TestMultiModelSkipHandling:
         )
         job_id = job_result["job_id"]
 
-        # Model A: 10/1 skipped (already completed), 10/2 completed
-        job_manager.update_job_detail_status(
-            job_id=job_id, date="2025-10-01", model="model-a",
-            status="skipped", error="Already completed"
-        )
-        job_manager.update_job_detail_status(
-            job_id=job_id, date="2025-10-02", model="model-a",
-            status="completed"
-        )
-
-        # Model B: both dates completed
-        job_manager.update_job_detail_status(
-            job_id=job_id, date="2025-10-01", model="model-b",
-            status="completed"
-        )
-        job_manager.update_job_detail_status(
-            job_id=job_id, date="2025-10-02", model="model-b",
-            status="completed"
-        )
+        job_manager.update_job_detail_status_many(job_id, [
+            # Model A: 10/1 skipped (already completed), 10/2 completed
+            ("2025-10-01", "model-a", "skipped", "Already completed"),
+            ("2025-10-02", "model-a", "completed", None),
+            # Model B: both dates completed
+            ("2025-10-01", "model-b", "completed", None),
+            ("2025-10-02", "model-b", "completed", None),
+        ])
 
         # Verify details
-        details = job_manager.get_job_details(job_id)
+        details = job_manager.get_job_details_by_key(job_id)
 
-        model_a_10_01 = next(
-            d for d in details
-            if d["model"] == "model-a" and d["date"] == "2025-10-01"
-        )
-        model_b_10_01 = next(
-            d for d in details
-            if d["model"] == "model-b" and d["date"] == "2025-10-01"
-        )
+        model_a_10_01 = details[("2025-10-01", "model-a")]
+        model_b_10_01 = details[("2025-10-01", "model-b")]
 
         assert model_a_10_01["status"] == "skipped"
         assert model_a_10_01["error"] == "Already completed"
@@ -291,25 +257,14 @@ class TestMultiModelSkipHandling:
         )
         job_id = job_result["job_id"]
 
-        # Model A: one skipped, one completed
-        job_manager.update_job_detail_status(
-            job_id=job_id, date="2025-10-01", model="model-a",
-            status="skipped", error="Already completed"
-        )
-        job_manager.update_job_detail_status(
-            job_id=job_id, date="2025-10-02", model="model-a",
-            status="completed"
-        )
-
-        # Model B: both completed
-        job_manager.update_job_detail_status(
-            job_id=job_id, date="2025-10-01", model="model-b",
-            status="completed"
-        )
-        job_manager.update_job_detail_status(
-            job_id=job_id, date="2025-10-02", model="model-b",
-            status="completed"
-        )
+        job_manager.update_job_detail_status_many(job_id, [
+            # Model A: one skipped, one completed
+            ("2025-10-01", "model-a", "skipped", "Already completed"),
+            ("2025-10-02", "model-a", "completed", None),
+            # Model B: both completed
+            ("2025-10-01", "model-b", "completed", None),
+            ("2025-10-02", "model-b", "completed", None),
+        ])
 
         # Job should complete
         job = job_manager.get_job(job_id)
@@ -325,36 +280,23 @@ class TestMultiModelSkipHandling:
 class TestSkipReasons:
     """Test that skip reasons are properly stored and retrievable."""
 
-    def test_skip_reason_already_completed(self, job_manager):
-        """Test 'Already completed' skip reason is stored."""
-        job_result = job_manager.create_job(
-            config_path="test_config.json",
-            date_range=["2025-10-01"],
-            models=["test-model"]
-        )
-        job_id = job_result["job_id"]
-
-        job_manager.update_job_detail_status(
-            job_id=job_id, date="2025-10-01", model="test-model",
-            status="skipped", error="Already completed"
-        )
-
-        details = job_manager.get_job_details(job_id)
-        assert details[0]["error"] == "Already completed"
-
-    def test_skip_reason_incomplete_price_data(self, job_manager):
-        """Test 'Incomplete price data' skip reason is stored."""
+    @pytest.mark.parametrize("date,reason", [
+        ("2025-10-01", "Already completed"),
+        ("2025-10-04", "Incomplete price data"),
+    ], ids=["already_completed", "incomplete_price_data"])
+    def test_skip_reason_is_stored(self, job_manager, date, reason):
+        """Test each skip reason is stored on the skipped model-day."""
         job_result = job_manager.create_job(
             config_path="test_config.json",
-            date_range=["2025-10-04"],
+            date_range=[date],
             models=["test-model"]
         )
         job_id = job_result["job_id"]
 
         job_manager.update_job_detail_status(
-            job_id=job_id, date="2025-10-04", model="test-model",
-            status="skipped", error="Incomplete price data"
+            job_id=job_id, date=date, model="test-model",
+            status="skipped", error=reason
         )
 
         details = job_manager.get_job_details(job_id)
-        assert details[0]["error"] == "Incomplete price data"
+        assert details[0]["error"] == reason
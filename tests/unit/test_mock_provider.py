@@ -1,13 +1,29 @@
 import pytest
-import asyncio
 from agent.mock_provider.mock_ai_provider import MockAIProvider
 from agent.mock_provider.mock_langchain_model import MockChatModel
 
 
-def test_mock_provider_rotates_stocks():
-    """Test that mock provider returns different stocks on different days"""
-    provider = MockAIProvider()
+@pytest.fixture(scope="module")
+def provider():
+    """One MockAIProvider for the module; it holds no per-test state."""
+    return MockAIProvider()
+
+
+@pytest.fixture(scope="module")
+def chat_model_for():
+    """Return a MockChatModel per date, built once per module."""
+    models = {}
+
+    def get(date):
+        if date not in models:
+            models[date] = MockChatModel(date=date)
+        return models[date]
+
+    return get
 
+
+def test_mock_provider_rotates_stocks(provider):
+    """Test that mock provider returns different stocks on different days"""
     # Day 1 should recommend AAPL
     response1 = provider.generate_response("2025-01-01", step=0)
     assert "AAPL" in response1
@@ -22,23 +38,23 @@ def test_mock_provider_rotates_stocks():
     assert response1 != response2
 
 
-def test_mock_provider_finish_signal():
-    """Test that all responses include finish signal"""
-    provider = MockAIProvider()
-    response = provider.generate_response("2025-01-01", step=0)
-    assert "<FINISH_SIGNAL>" in response
-
-
-def test_mock_provider_valid_json_tool_calls():
+def test_mock_provider_valid_json_tool_calls(provider):
     """Test that responses contain valid tool call syntax"""
-    provider = MockAIProvider()
     response = provider.generate_response("2025-01-01", step=0)
     assert "[calls tool_get_price" in response or "get_price" in response.lower()
 
 
-def test_mock_chat_model_invoke():
+def test_mock_provider_reuses_response_per_date(provider):
+    """Test that the rendered response is shared across steps and instances"""
+    response = provider.generate_response("2025-01-03", step=0)
+
+    assert MockAIProvider().generate_response("2025-01-03", step=4) is response
+    assert MockAIProvider().generate_response("2025-01-04", step=0) != response
+
+
+def test_mock_chat_model_invoke(chat_model_for):
     """Test synchronous invoke returns proper message format"""
-    model = MockChatModel(date="2025-01-01")
+    model = chat_model_for("2025-01-01")
 
     messages = [{"role": "user", "content": "Analyze the market"}]
     response = model.invoke(messages)
@@ -48,24 +64,22 @@ def test_mock_chat_model_invoke():
     assert "<FINISH_SIGNAL>" in response.content
 
 
-def test_mock_chat_model_ainvoke():
+@pytest.mark.asyncio
+async def test_mock_chat_model_ainvoke(chat_model_for):
     """Test asynchronous invoke returns proper message format"""
-    async def run_test():
-        model = MockChatModel(date="2025-01-02")
-        messages = [{"role": "user", "content": "Analyze the market"}]
-        response = await model.ainvoke(messages)
-
-        assert hasattr(response, "content")
-        assert "MSFT" in response.content
-        assert "<FINISH_SIGNAL>" in response.content
+    model = chat_model_for("2025-01-02")
+    messages = [{"role": "user", "content": "Analyze the market"}]
+    response = await model.ainvoke(messages)
 
-    asyncio.run(run_test())
+    assert hasattr(response, "content")
+    assert "MSFT" in response.content
+    assert "<FINISH_SIGNAL>" in response.content
 
 
-def test_mock_chat_model_different_dates():
+def test_mock_chat_model_different_dates(chat_model_for):
     """Test that different dates produce different responses"""
-    model1 = MockChatModel(date="2025-01-01")
-    model2 = MockChatModel(date="2025-01-02")
+    model1 = chat_model_for("2025-01-01")
+    model2 = chat_model_for("2025-01-02")
 
     msg = [{"role": "user", "content": "Trade"}]
     response1 = model1.invoke(msg)
@@ -74,10 +88,8 @@ def test_mock_chat_model_different_dates():
     assert response1.content != response2.content
 
 
-def test_mock_provider_string_representation():
+def test_mock_provider_string_representation(provider):
     """Test __str__ and __repr__ methods"""
-    provider = MockAIProvider()
-
     str_repr = str(provider)
     repr_repr = repr(provider)
 
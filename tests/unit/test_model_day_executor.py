@@ -14,50 +14,194 @@ Tests verify:
 
 import pytest
 import json
-from unittest.mock import Mock, patch, MagicMock, AsyncMock
+import sqlite3
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import Mock, AsyncMock
 from api.database import db_connection
+from tools.deployment_config import get_db_path
+from api.job_manager import JobManager
+from api import job_manager, model_day_executor
+from api.model_day_executor import ModelDayExecutor
 from pathlib import Path
 
+# Executor databases here are throwaway clones: skip fsyncs on every commit
+pytestmark = pytest.mark.usefixtures("fast_db_connections")
 
-def create_mock_agent(reasoning_steps=None, tool_usage=None, session_result=None,
-                     conversation_history=None):
-    """Helper to create properly mocked agent."""
-    mock_agent = Mock()
+FROZEN_NOW = datetime(2025, 1, 16, 12, 0, 0)
+
+
+class _FrozenDatetime(datetime):
+    """datetime whose utcnow() always returns FROZEN_NOW."""
+
+    @classmethod
+    def utcnow(cls):
+        return FROZEN_NOW
 
-    # Note: Removed get_positions, get_last_trade, get_current_prices
-    # These methods don't exist in BaseAgent and were only used by
-    # the now-deleted _write_results_to_db() method
 
-    mock_agent.get_reasoning_steps.return_value = reasoning_steps or []
-    mock_agent.get_tool_usage.return_value = tool_usage or {}
-    mock_agent.get_conversation_history.return_value = conversation_history or []
+@pytest.fixture(autouse=True)
+def frozen_time(monkeypatch):
+    """Pin JobManager's clock so the status timestamps the executor writes are deterministic."""
+    monkeypatch.setattr(job_manager, "datetime", _FrozenDatetime)
+
+
+def create_mock_agent(reasoning_steps=None, tool_usage=None, session_result=None,
+                     conversation_history=None):
+    """
+    Helper to create a lightweight stand-in for BaseAgent.
+
+    A SimpleNamespace of plain functions avoids building a Mock and its
+    attribute machinery for every test; the executor only awaits
+    set_context() and run_trading_session().
+    """
+    # Resolve defaults once so every call returns the same precomputed values
+    reasoning_steps = reasoning_steps or []
+    tool_usage = tool_usage or {}
+    conversation_history = conversation_history or []
+    session_result = session_result or {"success": True}
+
+    async def set_context(context_injector):
+        agent.context_injector = context_injector
+
+    async def run_trading_session(date):
+        return session_result
+
+    async def generate_summary(*args, **kwargs):
+        return "Mock summary"
+
+    async def summarize_message(*args, **kwargs):
+        return "Mock message summary"
+
+    agent = SimpleNamespace(
+        context_injector=None,
+        get_reasoning_steps=lambda: reasoning_steps,
+        get_tool_usage=lambda: tool_usage,
+        get_conversation_history=lambda: conversation_history,
+        set_context=set_context,
+        run_trading_session=run_trading_session,
+        generate_summary=generate_summary,
+        summarize_message=summarize_message,
+        # The executor never generates summaries, so no model is needed
+        model=None,
+    )
+    return agent
+
+
+@pytest.fixture
+def runtime_config_path(tmp_path):
+    """Per-test runtime config path, so parallel workers never share one."""
+    return str(tmp_path / "runtime.json")
+
+
+@pytest.fixture(autouse=True)
+def mocked_runtime(monkeypatch, runtime_config_path):
+    """
+    Replace RuntimeConfigManager with one Mock instance; yields that instance.
+
+    Autouse so no test, including those constructing ModelDayExecutor
+    directly, writes a real runtime config under data/.
+    """
+    runtime = Mock()
+    runtime.create_runtime_config.return_value = runtime_config_path
+    monkeypatch.setattr(model_day_executor, "RuntimeConfigManager", Mock(return_value=runtime))
+    return runtime
+
+
+@pytest.fixture(scope="module")
+def seeded_job_template(full_schema_template, tmp_path_factory):
+    """
+    In-memory schema holding one pending gpt-5 job for 2025-01-16.
+
+    The job is created through JobManager once per module; seeded_job
+    clones it instead of repeating create_job() in every test.
+    """
+    path = str(tmp_path_factory.mktemp("seeded") / "seeded.db")
+    with db_connection(path) as conn:
+        full_schema_template.backup(conn)
+
+    job_result = JobManager(db_path=path).create_job(
+        config_path="configs/test.json",
+        date_range=["2025-01-16"],
+        models=["gpt-5"]
+    )
+
+    template = sqlite3.connect(":memory:", check_same_thread=False)
+    with db_connection(path) as source:
+        source.backup(template)
+
+    yield template, job_result["job_id"]
+
+    template.close()
+
+
+@pytest.fixture
+def seeded_job(seeded_job_template, schema_db):
+    """(JobManager, job_id) for a per-test copy of the seeded job in schema_db."""
+    template, job_id = seeded_job_template
+    with db_connection(schema_db) as conn:
+        template.backup(conn)
+
+    return JobManager(db_path=schema_db), job_id
+
+
+# One statement text for every outcome assertion, so db_conn's statement
+# cache can reuse the prepared query
+_JOB_DETAIL_QUERY = (
+    "SELECT status, error, started_at, completed_at, duration_seconds "
+    "FROM job_details WHERE job_id = ?"
+)
+
+
+@pytest.fixture
+def db_conn(schema_db):
+    """Read-only connection to schema_db for asserting on what the executor wrote."""
+    conn = sqlite3.connect(f"file:{get_db_path(schema_db)}?mode=ro", uri=True)
+    conn.row_factory = sqlite3.Row
+    yield conn
+    conn.close()
+
+
+@pytest.fixture
+def executor_factory(schema_db, monkeypatch):
+    """
+    Build ModelDayExecutors against schema_db with RuntimeConfigManager mocked.
+
+    Pass agent to stand in for _initialize_agent's result, or agent_error
+    to make _initialize_agent raise.
+    """
+    def make_executor(job_id="test-job-123", agent=None, agent_error=None, **overrides):
+        params = {
+            "job_id": job_id,
+            "date": "2025-01-16",
+            "model_sig": "gpt-5",
+            "config_path": "configs/test.json",
+            "db_path": schema_db,
+        }
+        params.update(overrides)
+        executor = ModelDayExecutor(**params)
 
-    # Async methods - use AsyncMock
-    mock_agent.set_context = AsyncMock()
-    mock_agent.run_trading_session = AsyncMock(return_value=session_result or {"success": True})
-    mock_agent.generate_summary = AsyncMock(return_value="Mock summary")
-    mock_agent.summarize_message = AsyncMock(return_value="Mock message summary")
+        if agent_error is not None:
+            monkeypatch.setattr(executor, "_initialize_agent", AsyncMock(side_effect=agent_error))
+        elif agent is not None:
+            monkeypatch.setattr(executor, "_initialize_agent", AsyncMock(return_value=agent))
 
-    # Mock model for summary generation
-    mock_agent.model = Mock()
+        return executor
 
-    return mock_agent
+    return make_executor
 
 
 @pytest.mark.unit
 class TestModelDayExecutorInitialization:
     """Test ModelDayExecutor initialization."""
 
-    def test_init_with_required_params(self, clean_db):
+    def test_init_with_required_params(self, schema_db):
         """Should initialize with required parameters."""
-        from api.model_day_executor import ModelDayExecutor
-
         executor = ModelDayExecutor(
             job_id="test-job-123",
             date="2025-01-16",
             model_sig="gpt-5",
             config_path="configs/test.json",
-            db_path=clean_db
+            db_path=schema_db
         )
 
         assert executor.job_id == "test-job-123"
@@ -65,41 +209,24 @@ class TestModelDayExecutorInitialization:
         assert executor.model_sig == "gpt-5"
         assert executor.config_path == "configs/test.json"
 
-    def test_init_creates_runtime_config(self, clean_db):
+    def test_init_creates_runtime_config(self, executor_factory, mocked_runtime):
         """Should create isolated runtime config file."""
-        from api.model_day_executor import ModelDayExecutor
-
-        with patch("api.model_day_executor.RuntimeConfigManager") as mock_runtime:
-            mock_instance = Mock()
-            mock_instance.create_runtime_config.return_value = "/tmp/runtime_test.json"
-            mock_runtime.return_value = mock_instance
+        executor_factory(job_id="test-job-123")
 
-            executor = ModelDayExecutor(
-                job_id="test-job-123",
-                date="2025-01-16",
-                model_sig="gpt-5",
-                config_path="configs/test.json",
-                db_path=clean_db
-            )
-
-            # Verify runtime config created
-            mock_instance.create_runtime_config.assert_called_once_with(
-                job_id="test-job-123",
-                model_sig="gpt-5",
-                date="2025-01-16"
-            )
+        # Verify runtime config created
+        mocked_runtime.create_runtime_config.assert_called_once_with(
+            job_id="test-job-123",
+            model_sig="gpt-5",
+            date="2025-01-16"
+        )
 
 
 @pytest.mark.unit
 class TestModelDayExecutorExecution:
     """Test trading session execution."""
 
-    def test_execute_success(self, clean_db, sample_job_data, tmp_path):
+    def test_execute_success(self, seeded_job, executor_factory, db_conn, sample_job_data, tmp_path):
         """Should execute trading session and write results to DB."""
-        from api.model_day_executor import ModelDayExecutor
-        from api.job_manager import JobManager
-        import json
-
         # Create a temporary config file
         config_path = tmp_path / "test_config.json"
         config_data = {
@@ -111,292 +238,71 @@ class TestModelDayExecutorExecution:
         }
         config_path.write_text(json.dumps(config_data))
 
-        # Create job and job_detail
-        manager = JobManager(db_path=clean_db)
-        job_result = manager.create_job(
-            config_path=str(config_path),
-            date_range=["2025-01-16"],
-            models=["gpt-5"]
-        )
-        job_id = job_result["job_id"]
+        _, job_id = seeded_job
 
         # Mock agent execution
         mock_agent = create_mock_agent(
             session_result={"success": True, "total_steps": 15, "stop_signal_received": True}
         )
 
-        with patch("api.model_day_executor.RuntimeConfigManager") as mock_runtime:
-            mock_instance = Mock()
-            mock_instance.create_runtime_config.return_value = "/tmp/runtime_test.json"
-            mock_runtime.return_value = mock_instance
+        executor = executor_factory(job_id, agent=mock_agent, config_path=str(config_path))
+        result = executor.execute()
 
-            executor = ModelDayExecutor(
-                job_id=job_id,
-                date="2025-01-16",
-                model_sig="gpt-5",
-                config_path=str(config_path),
-                db_path=clean_db
-            )
-
-            # Mock the _initialize_agent method
-            with patch.object(executor, '_initialize_agent', return_value=mock_agent):
-                result = executor.execute()
-
-                assert result["success"] is True
-                assert result["job_id"] == job_id
-                assert result["date"] == "2025-01-16"
-                assert result["model"] == "gpt-5"
+        assert result["success"] is True
+        assert result["job_id"] == job_id
+        assert result["date"] == "2025-01-16"
+        assert result["model"] == "gpt-5"
 
         # Verify job_detail status updated
-        progress = manager.get_job_progress(job_id)
-        assert progress["completed"] == 1
+        row = db_conn.execute(_JOB_DETAIL_QUERY, (job_id,)).fetchone()
+        assert row["status"] == "completed"
+        assert row["started_at"] == row["completed_at"] == "2025-01-16T12:00:00Z"
+        assert row["duration_seconds"] == 0
 
-    def test_execute_failure_updates_status(self, clean_db):
+    def test_execute_failure_updates_status(self, seeded_job, executor_factory, db_conn):
         """Should update status to failed on execution error."""
-        from api.model_day_executor import ModelDayExecutor
-        from api.job_manager import JobManager
-
-        # Create job
-        manager = JobManager(db_path=clean_db)
-        job_result = manager.create_job(
-            config_path="configs/test.json",
-            date_range=["2025-01-16"],
-            models=["gpt-5"]
-        )
-        job_id = job_result["job_id"]
+        _, job_id = seeded_job
 
         # Mock agent to raise error
-        with patch("api.model_day_executor.RuntimeConfigManager") as mock_runtime:
-            mock_instance = Mock()
-            mock_instance.create_runtime_config.return_value = "/tmp/runtime_test.json"
-            mock_runtime.return_value = mock_instance
-
-            executor = ModelDayExecutor(
-                job_id=job_id,
-                date="2025-01-16",
-                model_sig="gpt-5",
-                config_path="configs/test.json",
-                db_path=clean_db
-            )
-
-            # Mock _initialize_agent to raise error
-            with patch.object(executor, '_initialize_agent', side_effect=Exception("Agent initialization failed")):
-                result = executor.execute()
-
-                assert result["success"] is False
-                assert "error" in result
-
-        # Verify job_detail marked as failed
-        progress = manager.get_job_progress(job_id)
-        assert progress["failed"] == 1
-
-
-@pytest.mark.unit
-class TestModelDayExecutorDataPersistence:
-    """Test result persistence to SQLite."""
+        executor = executor_factory(job_id, agent_error=Exception("Agent initialization failed"))
+        result = executor.execute()
 
-    @pytest.mark.skip(reason="Test uses old positions table - needs update for trading_days schema")
-    def test_creates_initial_position(self, clean_db, tmp_path):
-        """Should create initial position record (action_id=0) on first day."""
-        from api.model_day_executor import ModelDayExecutor
-        from api.job_manager import JobManager
-        from api.database import get_db_connection
-        import json
+        assert result["success"] is False
+        assert "error" in result
 
-        # Create a temporary config file
-        config_path = tmp_path / "test_config.json"
-        config_data = {
-            "agent_type": "BaseAgent",
-            "models": [],
-            "agent_config": {
-                "initial_cash": 10000.0
-            }
-        }
-        config_path.write_text(json.dumps(config_data))
-
-        # Create job
-        manager = JobManager(db_path=clean_db)
-        job_result = manager.create_job(
-            config_path=str(config_path),
-            date_range=["2025-01-16"],
-            models=["gpt-5"]
-        )
-        job_id = job_result["job_id"]
-
-        # Mock successful execution (no trades)
-        mock_agent = create_mock_agent(
-            session_result={"success": True, "total_steps": 10}
-        )
-
-        with patch("api.model_day_executor.RuntimeConfigManager") as mock_runtime:
-            mock_instance = Mock()
-            mock_instance.create_runtime_config.return_value = "/tmp/runtime_test.json"
-            mock_runtime.return_value = mock_instance
-
-            executor = ModelDayExecutor(
-                job_id=job_id,
-                date="2025-01-16",
-                model_sig="gpt-5",
-                config_path=str(config_path),
-                db_path=clean_db
-            )
-
-            with patch.object(executor, '_initialize_agent', return_value=mock_agent):
-                executor.execute()
-
-        # Verify initial position created (action_id=0)
-        with db_connection(clean_db) as conn:
-            cursor = conn.cursor()
-
-            cursor.execute("""
-                SELECT job_id, date, model, action_id, action_type, cash, portfolio_value
-                FROM positions
-                WHERE job_id = ? AND date = ? AND model = ?
-            """, (job_id, "2025-01-16", "gpt-5"))
-
-            row = cursor.fetchone()
-            assert row is not None, "Should create initial position record"
-            assert row[0] == job_id
-            assert row[1] == "2025-01-16"
-            assert row[2] == "gpt-5"
-            assert row[3] == 0, "Initial position should have action_id=0"
-            assert row[4] == "no_trade"
-            assert row[5] == 10000.0, "Initial cash should be $10,000"
-            assert row[6] == 10000.0, "Initial portfolio value should be $10,000"
-
-
-    def test_writes_reasoning_logs(self, clean_db):
-        """Should write AI reasoning logs to SQLite."""
-        from api.model_day_executor import ModelDayExecutor
-        from api.job_manager import JobManager
-        from api.database import get_db_connection
-
-        # Create job
-        manager = JobManager(db_path=clean_db)
-        job_result = manager.create_job(
-            config_path="configs/test.json",
-            date_range=["2025-01-16"],
-            models=["gpt-5"]
-        )
-        job_id = job_result["job_id"]
-
-        # Mock execution with reasoning
-        mock_agent = create_mock_agent(
-            reasoning_steps=[
-                {"step": 1, "reasoning": "Analyzing market data"},
-                {"step": 2, "reasoning": "Evaluating risk"}
-            ],
-            session_result={
-                "success": True,
-                "total_steps": 5,
-                "stop_signal_received": True,
-                "reasoning_summary": "Market analysis indicates upward trend"
-            }
-        )
-
-        with patch("api.model_day_executor.RuntimeConfigManager") as mock_runtime:
-            mock_instance = Mock()
-            mock_instance.create_runtime_config.return_value = "/tmp/runtime_test.json"
-            mock_runtime.return_value = mock_instance
-
-            executor = ModelDayExecutor(
-                job_id=job_id,
-                date="2025-01-16",
-                model_sig="gpt-5",
-                config_path="configs/test.json",
-                db_path=clean_db
-            )
-
-            with patch.object(executor, '_initialize_agent', return_value=mock_agent):
-                executor.execute()
-
-        # NOTE: Reasoning logs are now stored differently (see test_model_day_executor_reasoning.py)
-        # This test is deprecated but kept to ensure backward compatibility
-        pytest.skip("Test deprecated - reasoning logs schema changed. See test_model_day_executor_reasoning.py")
+        # Verify job_detail marked as failed
+        row = db_conn.execute(_JOB_DETAIL_QUERY, (job_id,)).fetchone()
+        assert row["status"] == "failed"
+        assert row["error"] is not None
 
 
 @pytest.mark.unit
 class TestModelDayExecutorCleanup:
     """Test cleanup operations."""
 
-    def test_cleanup_runtime_config_on_success(self, clean_db):
+    def test_cleanup_runtime_config_on_success(self, executor_factory, mocked_runtime,
+                                                runtime_config_path):
         """Should cleanup runtime config after successful execution."""
-        from api.model_day_executor import ModelDayExecutor
-        from api.job_manager import JobManager
-
-        manager = JobManager(db_path=clean_db)
-        job_result = manager.create_job(
-            config_path="configs/test.json",
-            date_range=["2025-01-16"],
-            models=["gpt-5"]
-        )
-        job_id = job_result["job_id"]
-
+        # Cleanup does not depend on the job row, so no job is seeded
         mock_agent = create_mock_agent(
             session_result={"success": True}
         )
 
-        with patch("api.model_day_executor.RuntimeConfigManager") as mock_runtime:
-            mock_instance = Mock()
-            mock_instance.create_runtime_config.return_value = "/tmp/runtime.json"
-            mock_runtime.return_value = mock_instance
+        executor = executor_factory(agent=mock_agent)
+        executor.execute()
 
-            executor = ModelDayExecutor(
-                job_id=job_id,
-                date="2025-01-16",
-                model_sig="gpt-5",
-                config_path="configs/test.json",
-                db_path=clean_db
-            )
+        # Verify cleanup called
+        mocked_runtime.cleanup_runtime_config.assert_called_once_with(runtime_config_path)
 
-            with patch.object(executor, '_initialize_agent', return_value=mock_agent):
-                executor.execute()
-
-            # Verify cleanup called
-            mock_instance.cleanup_runtime_config.assert_called_once_with("/tmp/runtime.json")
-
-    def test_cleanup_runtime_config_on_failure(self, clean_db):
+    def test_cleanup_runtime_config_on_failure(self, executor_factory, mocked_runtime,
+                                                runtime_config_path):
         """Should cleanup runtime config even after failure."""
-        from api.model_day_executor import ModelDayExecutor
-        from api.job_manager import JobManager
-
-        manager = JobManager(db_path=clean_db)
-        job_result = manager.create_job(
-            config_path="configs/test.json",
-            date_range=["2025-01-16"],
-            models=["gpt-5"]
-        )
-        job_id = job_result["job_id"]
-
-        with patch("api.model_day_executor.RuntimeConfigManager") as mock_runtime:
-            mock_instance = Mock()
-            mock_instance.create_runtime_config.return_value = "/tmp/runtime.json"
-            mock_runtime.return_value = mock_instance
-
-            executor = ModelDayExecutor(
-                job_id=job_id,
-                date="2025-01-16",
-                model_sig="gpt-5",
-                config_path="configs/test.json",
-                db_path=clean_db
-            )
-
-            # Mock _initialize_agent to raise error
-            with patch.object(executor, '_initialize_agent', side_effect=Exception("Agent failed")):
-                executor.execute()
-
-            # Verify cleanup called even on failure
-            mock_instance.cleanup_runtime_config.assert_called_once_with("/tmp/runtime.json")
-
-
-@pytest.mark.unit
-class TestModelDayExecutorPositionCalculations:
-    """Test position and P&L calculations."""
+        # Mock _initialize_agent to raise error
+        executor = executor_factory(agent_error=Exception("Agent failed"))
+        executor.execute()
 
-    @pytest.mark.skip(reason="Method _calculate_portfolio_value() removed - portfolio value calculated by trade tools")
-    def test_calculates_portfolio_value(self, clean_db):
-        """DEPRECATED: Portfolio value is now calculated by trade tools, not ModelDayExecutor."""
-        pass
+        # Verify cleanup called even on failure
+        mocked_runtime.cleanup_runtime_config.assert_called_once_with(runtime_config_path)
 
 
 # Coverage target: 90%+ for api/model_day_executor.py
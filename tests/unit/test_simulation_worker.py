@@ -11,10 +11,15 @@ Tests verify:
 - Job status updates
 """
 
+import json
 import pytest
 from unittest.mock import Mock, patch, call
 from datetime import datetime
 
+from api.database import initialize_database
+from api.job_manager import JobManager
+from api.simulation_worker import SimulationWorker
+
 
 @pytest.mark.unit
 class TestSimulationWorkerInitialization:
@@ -22,7 +27,6 @@ class TestSimulationWorkerInitialization:
 
     def test_init_with_job_id(self, clean_db):
         """Should initialize with job ID."""
-        from api.simulation_worker import SimulationWorker
 
         worker = SimulationWorker(job_id="test-job-123", db_path=clean_db)
 
@@ -36,8 +40,6 @@ class TestSimulationWorkerExecution:
 
     def test_run_executes_all_model_days(self, clean_db):
         """Should execute all model-day combinations."""
-        from api.simulation_worker import SimulationWorker
-        from api.job_manager import JobManager
 
         # Create job with 2 dates and 2 models = 4 model-days
         manager = JobManager(db_path=clean_db)
@@ -70,8 +72,6 @@ class TestSimulationWorkerExecution:
 
     def test_run_date_sequential_execution(self, clean_db):
         """Should execute dates sequentially, models in parallel."""
-        from api.simulation_worker import SimulationWorker
-        from api.job_manager import JobManager
 
         manager = JobManager(db_path=clean_db)
         job_result = manager.create_job(
@@ -116,8 +116,6 @@ class TestSimulationWorkerExecution:
 
     def test_run_updates_job_status_to_completed(self, clean_db):
         """Should update job status to completed on success."""
-        from api.simulation_worker import SimulationWorker
-        from api.job_manager import JobManager
 
         manager = JobManager(db_path=clean_db)
         job_result = manager.create_job(
@@ -158,8 +156,6 @@ class TestSimulationWorkerExecution:
 
     def test_run_handles_partial_failure(self, clean_db):
         """Should mark job as partial when some models fail."""
-        from api.simulation_worker import SimulationWorker
-        from api.job_manager import JobManager
 
         manager = JobManager(db_path=clean_db)
         job_result = manager.create_job(
@@ -214,8 +210,6 @@ class TestSimulationWorkerErrorHandling:
 
     def test_run_continues_on_single_model_failure(self, clean_db):
         """Should continue executing other models if one fails."""
-        from api.simulation_worker import SimulationWorker
-        from api.job_manager import JobManager
 
         manager = JobManager(db_path=clean_db)
         job_result = manager.create_job(
@@ -260,8 +254,6 @@ class TestSimulationWorkerErrorHandling:
 
     def test_run_updates_job_to_failed_on_exception(self, clean_db):
         """Should update job to failed on unexpected exception."""
-        from api.simulation_worker import SimulationWorker
-        from api.job_manager import JobManager
 
         manager = JobManager(db_path=clean_db)
         job_result = manager.create_job(
@@ -291,8 +283,6 @@ class TestSimulationWorkerConcurrency:
     @pytest.mark.skip(reason="Hanging due to threading deadlock - needs investigation")
     def test_run_with_threading(self, clean_db):
         """Should use threading for parallel model execution."""
-        from api.simulation_worker import SimulationWorker
-        from api.job_manager import JobManager
 
         manager = JobManager(db_path=clean_db)
         job_result = manager.create_job(
@@ -338,8 +328,6 @@ class TestSimulationWorkerJobRetrieval:
 
     def test_get_job_info(self, clean_db):
         """Should retrieve job information."""
-        from api.simulation_worker import SimulationWorker
-        from api.job_manager import JobManager
 
         manager = JobManager(db_path=clean_db)
         job_result = manager.create_job(
@@ -363,8 +351,6 @@ class TestSimulationWorkerHelperMethods:
 
     def test_download_price_data_success(self, clean_db):
         """Test successful price data download."""
-        from api.simulation_worker import SimulationWorker
-        from api.database import initialize_database
 
         db_path = clean_db
         initialize_database(db_path)
@@ -392,8 +378,6 @@ class TestSimulationWorkerHelperMethods:
 
     def test_download_price_data_rate_limited(self, clean_db):
         """Test price download with rate limit."""
-        from api.simulation_worker import SimulationWorker
-        from api.database import initialize_database
 
         db_path = clean_db
         initialize_database(db_path)
@@ -419,8 +403,6 @@ class TestSimulationWorkerHelperMethods:
 
     def test_filter_completed_dates_all_new(self, clean_db):
         """Test filtering when no dates are completed."""
-        from api.simulation_worker import SimulationWorker
-        from api.database import initialize_database
 
         db_path = clean_db
         initialize_database(db_path)
@@ -442,8 +424,6 @@ class TestSimulationWorkerHelperMethods:
 
     def test_filter_completed_dates_some_completed(self, clean_db):
         """Test filtering when some dates are completed."""
-        from api.simulation_worker import SimulationWorker
-        from api.database import initialize_database
 
         db_path = clean_db
         initialize_database(db_path)
@@ -467,10 +447,6 @@ class TestSimulationWorkerHelperMethods:
 
     def test_add_job_warnings(self, clean_db):
         """Test adding warnings to job via worker."""
-        from api.simulation_worker import SimulationWorker
-        from api.job_manager import JobManager
-        from api.database import initialize_database
-        import json
 
         db_path = clean_db
         initialize_database(db_path)
@@ -498,9 +474,6 @@ class TestSimulationWorkerHelperMethods:
 
     def test_prepare_data_no_missing_data(self, clean_db, monkeypatch):
         """Test prepare_data when all data is available."""
-        from api.simulation_worker import SimulationWorker
-        from api.job_manager import JobManager
-        from api.database import initialize_database
 
         db_path = clean_db
         initialize_database(db_path)
@@ -547,9 +520,6 @@ class TestSimulationWorkerHelperMethods:
 
     def test_prepare_data_with_download(self, clean_db, monkeypatch):
         """Test prepare_data when data needs downloading."""
-        from api.simulation_worker import SimulationWorker
-        from api.job_manager import JobManager
-        from api.database import initialize_database
 
         db_path = clean_db
         initialize_database(db_path)
@@ -65,7 +65,8 @@ class TestTradingDaysSchema:
         assert "symbol TEXT NOT NULL" in schema
         assert "quantity INTEGER NOT NULL" in schema
         assert "FOREIGN KEY (trading_day_id) REFERENCES trading_days(id)" in schema
-        assert "UNIQUE(trading_day_id, symbol)" in schema
+        assert "PRIMARY KEY (trading_day_id, symbol)" in schema
+        assert "WITHOUT ROWID" in schema
 
     def test_create_actions_table(self, db):
         """Test actions table is created with correct schema."""
@@ -1,45 +1,134 @@
 
 import os
 import json
+import functools
+import time
 from pathlib import Path
 from typing import Any
 from dotenv import load_dotenv
 load_dotenv()
 
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is the fallback
+    orjson = None
+
+@functools.lru_cache(maxsize=8)
+def _read_runtime_env(path: str, mtime_ns: int, size: int) -> dict:
+    """Parse the runtime env file; cached per (path, mtime, size) snapshot.
+
+    The returned dict is shared between callers and must not be mutated.
+    """
+    try:
+        with open(path, "rb") as f:
+            raw = f.read()
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        if isinstance(data, dict):
+            return data
+    except Exception:
+        pass
+    return {}
+
+
+# Runtime env files found missing, mapped to when they may be stat()ed again.
+# The TTL bounds how long a file created by another process (or
+# RuntimeConfigManager) can go unseen; write_config_value clears its own path.
+_MISSING_PATH_TTL = 1.0
+_missing_paths: dict = {}
+
+
 def _load_runtime_env() -> dict:
     path = os.environ.get("RUNTIME_ENV_PATH")
     if path is None:
         return {}
+    now = time.monotonic()
+    if _missing_paths.get(path, 0.0) > now:
+        return {}
     try:
-        if os.path.exists(path):
-            with open(path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                if isinstance(data, dict):
-                    return data
-    except Exception:
-        pass
-    return {}
+        stat = os.stat(path)
+    except OSError:
+        _missing_paths[path] = now + _MISSING_PATH_TTL
+        return {}
+    return _read_runtime_env(path, stat.st_mtime_ns, stat.st_size)
+
+
+_MISSING = object()
 
 
 def get_config_value(key: str, default=None):
-    _RUNTIME_ENV = _load_runtime_env()
-    
-    if key in _RUNTIME_ENV:
-        return _RUNTIME_ENV[key]
-    return os.getenv(key, default)
+    # One dict probe per source; the sentinel keeps explicit nulls in the file
+    value = _load_runtime_env().get(key, _MISSING)
+    if value is not _MISSING:
+        return value
+    return os.environ.get(key, default)
 
 def write_config_value(key: str, value: Any):
     path = os.environ.get("RUNTIME_ENV_PATH")
     if path is None:
         print(f"⚠️  WARNING: RUNTIME_ENV_PATH not set, config value '{key}' not persisted")
         return
-    _RUNTIME_ENV = _load_runtime_env()
+    # Re-stat before the read-modify-write: a negative cache entry may predate a
+    # file created elsewhere, and writing over it would drop that file's keys
+    _missing_paths.pop(path, None)
+    _RUNTIME_ENV = dict(_load_runtime_env())
     _RUNTIME_ENV[key] = value
     try:
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(_RUNTIME_ENV, f, ensure_ascii=False, indent=4)
+        if orjson is not None:
+            # Serialize before opening so a bad value cannot truncate the file
+            payload = orjson.dumps(
+                _RUNTIME_ENV, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            )
+            with open(path, "wb") as f:
+                f.write(payload)
+        else:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(_RUNTIME_ENV, f, ensure_ascii=False, indent=2)
     except Exception as e:
         print(f"❌ Error writing config to {path}: {e}")
+    finally:
+        # mtime may not tick between two quick writes; never serve a stale parse
+        _read_runtime_env.cache_clear()
+        _missing_paths.pop(path, None)
+
+def _get_field(obj, key, default=None):
+    if isinstance(obj, dict):
+        return obj.get(key, default)
+    return getattr(obj, key, default)
+
+
+def _get_nested(obj, path, default=None):
+    current = obj
+    for key in path:
+        current = _get_field(current, key, None)
+        if current is None:
+            return default
+    return current
+
+
+def _is_stop_message(msg) -> bool:
+    """Message the model finished with (finish_reason == 'stop') that has text."""
+    finish_reason = _get_nested(msg, ["response_metadata", "finish_reason"])
+    content = _get_field(msg, "content")
+    return finish_reason == "stop" and isinstance(content, str) and bool(content.strip())
+
+
+def _is_plain_ai_message(msg) -> bool:
+    """AI-like message with text that is neither a tool call nor a tool result."""
+    content = _get_field(msg, "content")
+    if not (isinstance(content, str) and content.strip()):
+        return False
+
+    additional_kwargs = _get_field(msg, "additional_kwargs", {}) or {}
+    if isinstance(additional_kwargs, dict):
+        tool_calls = additional_kwargs.get("tool_calls")
+    else:
+        tool_calls = getattr(additional_kwargs, "tool_calls", None)
+    if isinstance(tool_calls, list):
+        return False
+
+    # Tool messages often have 'tool_call_id' or 'name' (tool name)
+    return _get_field(msg, "tool_call_id") is None and not isinstance(_get_field(msg, "name"), str)
+
 
 def extract_conversation(conversation: dict, output_type: str):
     """Extract information from a conversation payload.
@@ -53,50 +142,22 @@ def extract_conversation(conversation: dict, output_type: str):
         For 'all': the original messages list (or empty list if missing).
     """
 
-    def get_field(obj, key, default=None):
-        if isinstance(obj, dict):
-            return obj.get(key, default)
-        return getattr(obj, key, default)
-
-    def get_nested(obj, path, default=None):
-        current = obj
-        for key in path:
-            current = get_field(current, key, None)
-            if current is None:
-                return default
-        return current
-
-    messages = get_field(conversation, "messages", []) or []
+    messages = _get_field(conversation, "messages", []) or []
 
     if output_type == "all":
         return messages
 
     if output_type == "final":
         # Prefer the last message with finish_reason == 'stop' and non-empty content.
-        for msg in reversed(messages):
-            finish_reason = get_nested(msg, ["response_metadata", "finish_reason"])
-            content = get_field(msg, "content")
-            if finish_reason == "stop" and isinstance(content, str) and content.strip():
-                return content
+        # Finals sit at the tail, so scan backwards and stop at the first match.
+        final = next((msg for msg in reversed(messages) if _is_stop_message(msg)), None)
+        if final is not None:
+            return _get_field(final, "content")
 
         # Fallback: last AI-like message with non-empty content and not a tool call.
-        for msg in reversed(messages):
-            content = get_field(msg, "content")
-            additional_kwargs = get_field(msg, "additional_kwargs", {}) or {}
-            tool_calls = None
-            if isinstance(additional_kwargs, dict):
-                tool_calls = additional_kwargs.get("tool_calls")
-            else:
-                tool_calls = getattr(additional_kwargs, "tool_calls", None)
-
-            is_tool_invoke = isinstance(tool_calls, list)
-            # Tool messages often have 'tool_call_id' or 'name' (tool name)
-            has_tool_call_id = get_field(msg, "tool_call_id") is not None
-            tool_name = get_field(msg, "name")
-            is_tool_message = has_tool_call_id or isinstance(tool_name, str)
-
-            if not is_tool_invoke and not is_tool_message and isinstance(content, str) and content.strip():
-                return content
+        fallback = next((msg for msg in reversed(messages) if _is_plain_ai_message(msg)), None)
+        if fallback is not None:
+            return _get_field(fallback, "content")
 
         return None
 
@@ -113,25 +174,12 @@ def extract_tool_messages(conversation: dict):
     Supports both dict-based and object-based messages.
     """
 
-    def get_field(obj, key, default=None):
-        if isinstance(obj, dict):
-            return obj.get(key, default)
-        return getattr(obj, key, default)
-
-    def get_nested(obj, path, default=None):
-        current = obj
-        for key in path:
-            current = get_field(current, key, None)
-            if current is None:
-                return default
-        return current
-
-    messages = get_field(conversation, "messages", []) or []
+    messages = _get_field(conversation, "messages", []) or []
     tool_messages = []
     for msg in messages:
-        tool_call_id = get_field(msg, "tool_call_id")
-        name = get_field(msg, "name")
-        finish_reason = get_nested(msg, ["response_metadata", "finish_reason"])  # present for AIMessage
+        tool_call_id = _get_field(msg, "tool_call_id")
+        name = _get_field(msg, "name")
+        finish_reason = _get_nested(msg, ["response_metadata", "finish_reason"])  # present for AIMessage
         # Treat as ToolMessage if it carries a tool_call_id, or looks like a tool response
         if tool_call_id or (isinstance(name, str) and not finish_reason):
             tool_messages.append(msg)